@@ -1,5 +1,5 @@
 # This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
-from . import command, install, natives, microsoft_account, utils, java_utils, mod_loader, forge, fabric, quilt, news, runtime, vanilla_launcher, mrpack, exceptions, types, microsoft_types
-__all__ = ["command", "install", "natives", "microsoft_account", "utils", "news", "java_utils", "mod_loader", "forge", "fabric", "quilt", "runtime", "vanilla_launcher", "mrpack", "exceptions", "types", "microsoft_types"]
+from . import command, install, natives, microsoft_account, utils, java_utils, mod_loader, forge, fabric, quilt, news, runtime, vanilla_launcher, mrpack, network, object_store, process, orchestrator, exceptions, types, microsoft_types
+__all__ = ["command", "install", "natives", "microsoft_account", "utils", "news", "java_utils", "mod_loader", "forge", "fabric", "quilt", "runtime", "vanilla_launcher", "mrpack", "network", "object_store", "process", "orchestrator", "exceptions", "types", "microsoft_types"]
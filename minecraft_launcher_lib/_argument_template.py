@@ -0,0 +1,89 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module compiles the arguments of the version json into templates. It should not be used outside minecraft_launcher_lib.
+
+A template is a list that alternates between literal text and placeholder names, starting and ending with literal text.
+"foo${bar}baz" becomes ["foo", "bar", "baz"]. A template is rendered in a single pass, so the value of a placeholder is never replaced again.
+"""
+from ._internal_types.shared_types import ClientJsonArgumentRule, ClientJsonRule
+from .types import MinecraftOptions
+from ._rules import compile_rule_list, RulePredicate
+import re
+
+_PLACEHOLDER_REGEX = re.compile(r"\$\{([^}]*)\}")
+
+# Placeholders that are known, but not supported. They are kept as they are.
+PASSTHROUGH_PLACEHOLDERS = frozenset(("auth_xuid", "clientid"))
+
+ArgumentTemplate = list[str]
+CompiledArgument = tuple[list[RulePredicate], list[ArgumentTemplate]]
+
+
+def compile_template(argument: str) -> ArgumentTemplate:
+    """
+    Splits the argument into literal text and placeholder names
+    """
+    return _PLACEHOLDER_REGEX.split(argument)
+
+
+def render_template(template: ArgumentTemplate, variables: dict[str, str]) -> str:
+    """
+    Replaces the placeholders of the template with the values from variables. Placeholders without a value are kept.
+    """
+    if len(template) == 1:
+        return template[0]
+
+    parts = [template[0]]
+    for pos in range(1, len(template), 2):
+        value = variables.get(template[pos])
+        parts.append(value if value is not None else "${" + template[pos] + "}")
+        parts.append(template[pos + 1])
+
+    return "".join(parts)
+
+
+def get_placeholder_names(template: ArgumentTemplate) -> list[str]:
+    """
+    Returns the names of all placeholders of the template
+    """
+    return template[1::2]
+
+
+def compile_argument_list(arguments: list[str | ClientJsonArgumentRule]) -> list[CompiledArgument]:
+    """
+    Compiles the arguments list of the version json. The rules are compiled for the current platform.
+    """
+    compiled_list: list[CompiledArgument] = []
+    for i in arguments:
+        # i could be the argument
+        if isinstance(i, str):
+            compiled_list.append(([], [compile_template(i)]))
+            continue
+
+        # Rules might has 2 different names in different client.json
+        rule_lists: list[list[ClientJsonRule]] = [i[key] for key in ("compatibilityRules", "rules") if key in i]  # type: ignore
+        predicates = [compile_rule_list(rules) for rules in rule_lists]
+
+        # Sometimes i["value"] is the argument and sometimes a list of arguments
+        values = [i["value"]] if isinstance(i["value"], str) else i["value"]
+
+        compiled_list.append((predicates, [compile_template(v) for v in values]))
+
+    return compiled_list
+
+
+def render_argument_list(compiled_list: list[CompiledArgument], variables: dict[str, str], options: MinecraftOptions) -> list[str]:
+    """
+    Returns the arguments from the compiled list, whose rules match the options
+    """
+    arglist: list[str] = []
+    for predicates, templates in compiled_list:
+        if not all(predicate(options) for predicate in predicates):
+            continue
+
+        for template in templates:
+            arglist.append(render_template(template, variables))
+
+    return arglist
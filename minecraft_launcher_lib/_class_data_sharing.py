@@ -0,0 +1,161 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module manages the dynamic Class Data Sharing (AppCDS) archives of the versions. It should not be used outside minecraft_launcher_lib.
+
+A archive is created by the JVM with -XX:ArchiveClassesAtExit and contains the classes that have been loaded during a launch.
+The name of the archive contains a hash of the launch plan and the Java build, so a new archive is needed if one of them changes.
+The Java build is cached inside the launch plan and is only read again, if the release file of the Java installation changes.
+"""
+from ._verification_index import INDEX_DIRECTORY_NAME
+from ._launch_plan import LaunchPlan, _get_stat_key
+import hashlib
+import shutil
+import re
+import os
+
+# Dynamic archives are supported since Java 13
+MIN_JAVA_VERSION = 13
+
+
+def _parse_java_major_version(version: str) -> int | None:
+    """
+    Returns the major version of a Java version string e.g. 8 for 1.8.0_51 and 21 for 21.0.3
+    """
+    match = re.match(r"^(?:1\.)?(\d+)", version)
+    if match is None:
+        return None
+    return int(match.group(1))
+
+
+def _get_release_path(java_executable: str) -> tuple[str, str] | None:
+    """
+    Returns the real path of the Java executable and the path of the release file of its installation
+    """
+    path = shutil.which(java_executable)
+    if path is None:
+        return None
+
+    real_path = os.path.realpath(path)
+    return real_path, os.path.join(os.path.dirname(os.path.dirname(real_path)), "release")
+
+
+def _read_java_build(real_path: str, release_path: str) -> tuple[str, int] | None:
+    """
+    Reads the release file and returns the id of the Java build and its major version
+    """
+    try:
+        with open(release_path, "r", encoding="utf-8") as f:
+            release = f.read()
+    except OSError:
+        return None
+
+    version_match = re.search(r'^JAVA_VERSION="([^"]*)"', release, re.MULTILINE)
+    if version_match is None:
+        return None
+
+    major_version = _parse_java_major_version(version_match.group(1))
+    if major_version is None:
+        return None
+
+    return hashlib.sha256(f"{real_path}\0{release}".encode("utf-8")).hexdigest(), major_version
+
+
+def get_java_build(java_executable: str) -> tuple[str, int] | None:
+    """
+    Returns a id of the Java build and its major version. The id changes, if the Java installation is updated.
+    Returns None, if the Java installation has no release file.
+    """
+    paths = _get_release_path(java_executable)
+    if paths is None:
+        return None
+
+    return _read_java_build(*paths)
+
+
+def get_cached_java_build(plan: LaunchPlan, java_executable: str) -> tuple[str, int] | None:
+    """
+    Same as get_java_build, but the result is cached inside the launch plan.
+    The executable is only looked up once. After that, only the release file is checked with stat().
+    """
+    cached = plan.java_builds.get(java_executable)
+    if cached is not None and _get_stat_key(cached[0][1]) == cached[1]:
+        return cached[2]
+
+    paths = _get_release_path(java_executable)
+    if paths is None:
+        return None
+
+    # Get the stat before reading the file, so a change while reading is noticed next time
+    stat_key = _get_stat_key(paths[1])
+    java_build = _read_java_build(*paths)
+    plan.java_builds[java_executable] = (paths, stat_key, java_build)
+    return java_build
+
+
+def get_archive_path(plan: LaunchPlan, java_build: str) -> str:
+    """
+    Returns the path of the archive for the launch plan and the Java build
+    """
+    key = hashlib.sha256()
+    key.update(plan.version.encode("utf-8") + b"\0")
+    key.update(plan.classpath.encode("utf-8") + b"\0")
+    key.update(plan.data["mainClass"].encode("utf-8") + b"\0")
+    for path, (mtime, size) in sorted(plan.json_files.items()):
+        key.update(f"{path}\0{mtime}\0{size}\0".encode("utf-8"))
+    key.update(java_build.encode("utf-8"))
+
+    return os.path.join(plan.minecraft_directory, INDEX_DIRECTORY_NAME, "cds", f"{plan.version}-{key.hexdigest()[:32]}.jsa")
+
+
+def is_archive_valid(path: str) -> bool:
+    """
+    Checks if the archive exists and is not empty
+    """
+    try:
+        return os.path.getsize(path) > 0
+    except OSError:
+        return False
+
+
+def remove_outdated_archives(plan: LaunchPlan, current_path: str) -> None:
+    """
+    Removes the archives of the version, that have been created for a other launch plan or Java build
+    """
+    directory = os.path.dirname(current_path)
+    if not os.path.isdir(directory):
+        return
+
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if path == current_path or not name.endswith(".jsa") or name.rsplit("-", 1)[0] != plan.version:
+            continue
+
+        try:
+            os.remove(path)
+        except OSError:
+            # The archive might be in use on Windows
+            pass
+
+
+def get_class_data_sharing_arguments(plan: LaunchPlan, java_executable: str, create: bool) -> list[str]:
+    """
+    Returns the argument that uses the archive of the launch plan, if it exists.
+    If it doesn't exist and create is True, the argument that creates the archive when Minecraft exits is returned.
+    """
+    java_build = get_cached_java_build(plan, java_executable)
+    if java_build is None or java_build[1] < MIN_JAVA_VERSION:
+        return []
+
+    path = get_archive_path(plan, java_build[0])
+
+    if is_archive_valid(path):
+        return [f"-XX:SharedArchiveFile={path}"]
+
+    if not create:
+        return []
+
+    remove_outdated_archives(plan, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return [f"-XX:ArchiveClassesAtExit={path}"]
@@ -0,0 +1,139 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"This module runs the download jobs of the installers. It should not be used outside minecraft_launcher_lib"
+from ._internal_types.install_types import DownloadJob
+from concurrent.futures import ThreadPoolExecutor
+from ._progress import ProgressTracker
+from .network import get_max_connections, get_session
+from ._helper import download_file, empty
+from .natives import extract_natives_file
+from .types import CallbackDict
+from typing import Callable
+import subprocess
+import requests
+import asyncio
+import os
+
+
+def get_default_max_workers() -> int:
+    """
+    Returns the number of workers that is used, if the user don't set one.
+    This is the number of connections of the shared session, so every worker gets its own connection.
+    """
+    return get_max_connections()
+
+
+def run_download_job(job: DownloadJob, minecraft_directory: str | os.PathLike, callback: CallbackDict, session: requests.sessions.Session | None, tracker: ProgressTracker | None = None) -> None:
+    """
+    Downloads a single file and runs the actions that are needed after the download
+    """
+    if tracker is not None and tracker.enabled:
+        progress: Callable[[int], None] | None = lambda count: tracker.add_bytes(job, count)
+    else:
+        progress = None
+
+    try:
+        download_file(
+            job["url"],
+            job["path"],
+            callback,
+            sha1=job.get("sha1"),
+            lzma_compressed=job.get("lzmaCompressed", False),
+            session=session,
+            minecraft_directory=minecraft_directory,
+            use_object_store=True,
+            progress=progress,
+            # chmod would change the mode of the shared object, so executables get their own copy
+            copy_object=job.get("executable", False)
+        )
+    except Exception:
+        if not job.get("ignoreErrors", False):
+            raise
+
+    # Make files executable on unix systems
+    if job.get("executable", False):
+        try:
+            subprocess.run(["chmod", "+x", job["path"]])
+        except FileNotFoundError:
+            pass
+
+    if "extract" in job and os.path.isfile(job["extract"]["file"]):
+        extract_natives_file(job["extract"]["file"], job["extract"]["directory"], {"exclude": job["extract"]["exclude"]})
+
+    if tracker is not None:
+        tracker.finish_job(job)
+
+
+def sort_download_jobs(jobs: list[DownloadJob]) -> list[DownloadJob]:
+    """
+    Returns the jobs in the order in which they should be started.
+    The largest files are started first, so the small files can fill the gaps at the end and no worker is idle while the last big file is still downloading.
+    """
+    return sorted(jobs, key=lambda job: job.get("size", 0), reverse=True)
+
+
+def run_download_jobs(jobs: list[DownloadJob], minecraft_directory: str | os.PathLike, callback: CallbackDict, max_workers: int | None = None) -> None:
+    """
+    Runs all jobs with a single ThreadPoolExecutor, so all jobs share the same workers
+    """
+    if max_workers is None:
+        max_workers = get_default_max_workers()
+
+    session = get_session(max_workers)
+    tracker = ProgressTracker(callback, jobs)
+    callback.get("setMax", empty)(len(jobs) - 1)
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_download_job, job, minecraft_directory, callback, session, tracker) for job in sort_download_jobs(jobs)]
+        for future in futures:
+            # Wait until the task is completed
+            future.result()
+            count += 1
+            callback.get("setProgress", empty)(count)
+
+    tracker.finish()
+
+
+async def run_download_jobs_async(jobs: list[DownloadJob], minecraft_directory: str | os.PathLike, callback: CallbackDict, max_concurrency: int | None = None) -> None:
+    """
+    Runs all jobs from a asyncio event loop without blocking it.
+    The transfers still use the blocking requests session, so every running download needs a worker thread.
+    Only jobs that wait for a free slot are coroutines, so max_concurrency is the number of threads and of downloads in flight.
+    """
+    if max_concurrency is None:
+        max_concurrency = get_default_max_workers()
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    session = get_session(max_concurrency)
+    tracker = ProgressTracker(callback, jobs)
+    callback.get("setMax", empty)(len(jobs) - 1)
+    count = 0
+
+    # The executor is not used as a context manager, because its shutdown would wait for the running downloads and block the event loop
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    async def run_job(job: DownloadJob) -> None:
+        """Waits for a free slot and runs the job."""
+        nonlocal count
+        async with semaphore:
+            await loop.run_in_executor(executor, run_download_job, job, minecraft_directory, callback, session, tracker)
+        count += 1
+        callback.get("setProgress", empty)(count)
+
+    tasks = [asyncio.ensure_future(run_job(job)) for job in sort_download_jobs(jobs)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # Don't start any new downloads, if one failed or the install was cancelled
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        # Downloads that are already running can't be stopped. They finish in the background.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    tracker.finish()
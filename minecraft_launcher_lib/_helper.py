@@ -4,19 +4,25 @@
 "This module contains some helper functions. It should nt be used outside minecraft_launcher_lib"
 from .exceptions import FileOutsideMinecraftDirectory, InvalidChecksum, VersionNotFound
 from ._internal_types.shared_types import ClientJson, ClientJsonRule, ClientJsonLibrary
-from ._internal_types.helper_types import RequestsResponseCache, MavenMetadata
+from ._version_manifest import VersionManifest, VERSION_MANIFEST_URL, parse_version_manifest
+from ._metadata_cache import get_cached_payload
+from ._rules import compile_rule_list, get_os_version  # noqa: F401
+from ._internal_types.helper_types import MavenMetadata
+from ._retry import call_with_retry, check_transient_status, get_with_retry, get_timeout
+from ._verification_index import get_verification_index
+from .object_store import _link_object, _add_object
 from .types import MinecraftOptions, CallbackDict
-from typing import Literal, Any
+from .network import get_session, _get_bandwidth_limiter
+from ._throttle import limit_bandwidth
+from typing import Literal, Iterable, Iterator, Callable, Any
 import subprocess
-import datetime
 import requests
 import platform
 import hashlib
 import zipfile
-import shutil
 import lzma
 import json
-import sys
+import copy
 import re
 import os
 
@@ -28,6 +34,8 @@ if os.name == "nt":
 else:
     SUBPROCESS_STARTUP_INFO = None
 
+_DOWNLOAD_CHUNK_SIZE = 65536
+
 
 def empty(arg: Any) -> None:
     """
@@ -44,18 +52,148 @@ def check_path_inside_minecraft_directory(minecraft_directory: str | os.PathLike
         raise FileOutsideMinecraftDirectory(os.path.abspath(path), os.path.abspath(minecraft_directory))
 
 
-def download_file(url: str, path: str, callback: CallbackDict = {}, sha1: str | None = None, lzma_compressed: bool | None = False, session: requests.sessions.Session | None = None, minecraft_directory: str | os.PathLike | None = None, overwrite: bool | None = False) -> bool:
+def _remove_file(path: str) -> None:
+    """
+    Removes the file, if it exists
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _decompress_lzma_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
     """
-    Downloads a file into the given path. Check sha1 if given.
+    Decompresses a stream of lzma compressed chunks.
+    Only a single chunk is held in memory at the same time, so large files can be decompressed with constant memory.
+    """
+    decompressor = lzma.LZMADecompressor()
+    for chunk in chunks:
+        # Limit the output, so a small chunk with a high compression ratio can't produce a huge buffer
+        data = decompressor.decompress(chunk, max_length=_DOWNLOAD_CHUNK_SIZE)
+        while True:
+            if data:
+                yield data
+
+            if decompressor.eof or decompressor.needs_input:
+                break
+
+            data = decompressor.decompress(b"", max_length=_DOWNLOAD_CHUNK_SIZE)
+
+        if decompressor.eof:
+            break
+
+    if not decompressor.eof:
+        raise lzma.LZMAError("Compressed data ended before the end-of-stream marker was reached")
+
+
+def _count_bytes(chunks: Iterable[bytes], progress: Callable[[int], None]) -> Iterator[bytes]:
+    """
+    Calls progress with the size of every chunk
+    """
+    for chunk in chunks:
+        progress(len(chunk))
+        yield chunk
+
+
+def _download_part_file(url: str, temp_path: str, session: requests.sessions.Session | None, lzma_compressed: bool, resume: bool, calculate_sha512: bool, fsync: bool, progress: Callable[[int], None] | None = None) -> tuple[str, str | None, bool] | None:
+    """
+    Downloads the given URL into the temporary file and calculates the checksums while writing.
+    If resume is True and the temporary file already exists, only the missing part is requested using a HTTP Range request.
+    Returns the sha1, the sha512 and if the download was resumed. Returns None if the server returned a error.
+    """
+    sha1_hash = hashlib.sha1()
+    sha512_hash = hashlib.sha512() if calculate_sha512 else None
+
+    headers = {"user-agent": get_user_agent()}
+
+    offset = 0
+    if resume and os.path.isfile(temp_path):
+        offset = os.path.getsize(temp_path)
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+
+    if session is None:
+        session = get_session()
+
+    r = session.get(url, stream=True, headers=headers, timeout=get_timeout())
+    check_transient_status(r)
+
+    if offset > 0 and r.status_code == 206 and r.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+        # The server supports Range requests, so the existing data needs to be part of the checksum
+        with open(temp_path, "rb") as f:
+            while data := f.read(_DOWNLOAD_CHUNK_SIZE):
+                sha1_hash.update(data)
+                if sha512_hash is not None:
+                    sha512_hash.update(data)
+        mode = "ab"
+    elif r.status_code == 200:
+        # The server ignored the Range header, so we need to start from the beginning
+        offset = 0
+        mode = "wb"
+    elif offset > 0 and r.status_code in (206, 416):
+        # The partial file does not fit the file on the server or the server sent a different range
+        r.close()
+        _remove_file(temp_path)
+        return _download_part_file(url, temp_path, session, lzma_compressed, False, calculate_sha512, fsync, progress)
+    else:
+        return None
+
+    with open(temp_path, mode) as f:
+        chunks: Iterable[bytes] = r.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+        bandwidth_limiter = _get_bandwidth_limiter()
+        if bandwidth_limiter is not None:
+            chunks = limit_bandwidth(chunks, bandwidth_limiter)
+        if progress is not None:
+            # Count the bytes that are received, which are the compressed bytes for lzma files
+            chunks = _count_bytes(chunks, progress)
+        if lzma_compressed:
+            chunks = _decompress_lzma_stream(chunks)
+
+        for chunk in chunks:
+            f.write(chunk)
+            sha1_hash.update(chunk)
+            if sha512_hash is not None:
+                sha512_hash.update(chunk)
+
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+    return sha1_hash.hexdigest(), sha512_hash.hexdigest() if sha512_hash is not None else None, offset > 0
+
+
+def download_file(url: str, path: str, callback: CallbackDict = {}, sha1: str | None = None, lzma_compressed: bool | None = False, session: requests.sessions.Session | None = None, minecraft_directory: str | os.PathLike | None = None, overwrite: bool | None = False, sha512: str | None = None, fsync: bool = False, use_object_store: bool = False, progress: Callable[[int], None] | None = None, copy_object: bool = False) -> bool:
+    """
+    Downloads a file into the given path. Check sha1 and sha512 if given.
+    The checksums are calculated while the file is written into a temporary file, which is moved to the given path after all checks passed.
+    If the sha1 is known, a interrupted download is kept as .part file and resumed the next time.
+    If use_object_store is True and the sha1 is known, the file is taken from or added to the object store.
+    If copy_object is True, the file is copied from the object store instead of linked, so it can be changed (e.g. made executable) without changing the object.
+    progress is called with the number of received bytes while downloading.
     """
     # Check if the Path is outside the given Minecraft Directory
     if minecraft_directory is not None:
         check_path_inside_minecraft_directory(minecraft_directory, path)
 
+    # The verification index is stored inside the Minecraft directory, so it can only be used if we know it
+    if minecraft_directory is not None:
+        index = get_verification_index(minecraft_directory)
+    else:
+        index = None
+
     if os.path.isfile(path) and not overwrite:
         if sha1 is None:
             return False
-        elif get_sha1_hash(path) == sha1:
+
+        # Files that have not been changed since they were last verified don't need to be hashed again
+        current_sha1 = index.lookup(path) if index is not None else None
+        if current_sha1 is None:
+            current_sha1 = get_sha1_hash(path)
+            if index is not None:
+                index.update(path, current_sha1)
+
+        if current_sha1 == sha1:
             return False
 
     try:
@@ -63,81 +201,111 @@ def download_file(url: str, path: str, callback: CallbackDict = {}, sha1: str |
     except Exception:
         pass
 
+    # A file that is already in the object store doesn't need to be downloaded again
+    if use_object_store and sha1 is not None and _link_object(sha1, path, copy_object):
+        if index is not None:
+            index.update(path, sha1)
+        return True
+
     callback.get("setStatus", empty)("Download " + os.path.basename(path))
 
-    if session is None:
-        r = requests.get(url, stream=True, headers={"user-agent": get_user_agent()})
-    else:
-        r = session.get(url, stream=True, headers={"user-agent": get_user_agent()})
+    # Never write directly into the final path, so a crash never leaves a truncated file behind
+    temp_path = path + ".part"
 
-    if r.status_code != 200:
-        return False
+    # If we know the checksum, a interrupted download can be resumed, because the checksum will tell us if the result is broken
+    resumable = sha1 is not None and not lzma_compressed
+    resume = resumable
 
-    with open(path, 'wb') as f:
-        r.raw.decode_content = True
-        if lzma_compressed:
-            f.write(lzma.decompress(r.content))
+    while True:
+        try:
+            # Transient errors are retried. If the file is resumable, a retry continues where the last attempt stopped.
+            result = call_with_retry(url, lambda current_url: _download_part_file(current_url, temp_path, session, bool(lzma_compressed), resume, sha512 is not None, fsync, progress))
+        except BaseException:
+            # Keep partial downloads with a known checksum, so they can be resumed later
+            if not resumable:
+                _remove_file(temp_path)
+            raise
+
+        if result is None:
+            return False
+
+        sha1_checksum, sha512_checksum, resumed = result
+
+        if (sha1 is None or sha1_checksum == sha1) and (sha512 is None or sha512_checksum == sha512):
+            break
+
+        _remove_file(temp_path)
+
+        if resumed:
+            # The partial file may belong to an older version of the file, so try again from the start
+            resume = False
+            continue
+
+        if sha1 is not None and sha1_checksum != sha1:
+            raise InvalidChecksum(url, path, sha1, sha1_checksum)
         else:
-            shutil.copyfileobj(r.raw, f)
+            raise InvalidChecksum(url, path, sha512, sha512_checksum)  # type: ignore[arg-type]
 
-    if sha1 is not None:
-        checksum = get_sha1_hash(path)
-        if checksum != sha1:
-            raise InvalidChecksum(url, path, sha1, checksum)
+    if not (use_object_store and sha1 is not None and _add_object(temp_path, sha1, path, copy_object)):
+        os.replace(temp_path, path)
+
+    if index is not None:
+        index.update(path, sha1_checksum)
 
     return True
 
 
+def load_metadata_file(url: str, path: str, minecraft_directory: str | os.PathLike, callback: CallbackDict = {}, sha1: str | None = None, write: bool = True) -> tuple[bytes, bool]:
+    """
+    Returns the content of a metadata file (e.g. a version json or a asset index) and if it was already present on disk.
+    If the file exists and has the given sha1, it is read from disk. Otherwise it is downloaded and written to the given path, if write is True.
+    """
+    check_path_inside_minecraft_directory(minecraft_directory, path)
+    index = get_verification_index(minecraft_directory)
+
+    if os.path.isfile(path):
+        current_sha1 = index.lookup(path)
+        if current_sha1 is None and sha1 is not None:
+            current_sha1 = get_sha1_hash(path)
+            index.update(path, current_sha1)
+
+        if sha1 is None or current_sha1 == sha1:
+            with open(path, "rb") as f:
+                return f.read(), True
+
+    callback.get("setStatus", empty)("Download " + os.path.basename(path))
+
+    r = get_with_retry(url, headers={"user-agent": get_user_agent()})
+    r.raise_for_status()
+    content = r.content
+
+    content_sha1 = hashlib.sha1(content).hexdigest()
+    if sha1 is not None and content_sha1 != sha1:
+        raise InvalidChecksum(url, path, sha1, content_sha1)
+
+    if write:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".part"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        index.update(path, content_sha1)
+
+    return content, False
+
+
 def parse_single_rule(rule: ClientJsonRule, options: MinecraftOptions) -> bool:
     """
     Parse a single rule from the versions.json
     """
-    if rule["action"] == "allow":
-        returnvalue = False
-    elif rule["action"] == "disallow":
-        returnvalue = True
-
-    for os_key, os_value in rule.get("os", {}).items():
-        if os_key == "name":
-            if os_value == "windows" and platform.system() != 'Windows':
-                return returnvalue
-            elif os_value == "osx" and platform.system() != 'Darwin':
-                return returnvalue
-            elif os_value == "linux" and platform.system() != 'Linux':
-                return returnvalue
-        elif os_key == "arch":
-            if os_value == "x86" and platform.architecture()[0] != "32bit":
-                return returnvalue
-        elif os_key == "version":
-            if not re.match(os_value, get_os_version()):
-                return returnvalue
-
-    for features_key in rule.get("features", {}).keys():
-        if features_key == "has_custom_resolution" and not options.get("customResolution", False):
-            return returnvalue
-        elif features_key == "is_demo_user" and not options.get("demo", False):
-            return returnvalue
-        elif features_key == "has_quick_plays_support" and options.get("quickPlayPath") is None:
-            return returnvalue
-        elif features_key == "is_quick_play_singleplayer" and options.get("quickPlaySingleplayer") is None:
-            return returnvalue
-        elif features_key == "is_quick_play_multiplayer" and options.get("quickPlayMultiplayer") is None:
-            return returnvalue
-        elif features_key == "is_quick_play_realms" and options.get("quickPlayRealms") is None:
-            return returnvalue
-
-    return not returnvalue
+    return compile_rule_list([rule])(options)
 
 
 def parse_rule_list(rules: list[ClientJsonRule], options: MinecraftOptions) -> bool:
     """
     Parse a list of rules
     """
-    for i in rules:
-        if not parse_single_rule(i, options):
-            return False
-
-    return True
+    return compile_rule_list(rules)(options)
 
 
 def _get_lib_name_without_version(lib: ClientJsonLibrary) -> str:
@@ -158,6 +326,14 @@ def inherit_json(original_data: ClientJson, path: str | os.PathLike) -> ClientJs
     with open(os.path.join(path, "versions", inherit_version, inherit_version + ".json")) as f:
         new_data: ClientJson = json.load(f)
 
+    return merge_inherited_json(original_data, new_data)
+
+
+def merge_inherited_json(original_data: ClientJson, new_data: ClientJson) -> ClientJson:
+    """
+    Merges the data of a version into the data of the version it inherits from.
+    new_data is changed and returned.
+    """
     # Inheriting the libs is a bit special
     # If the lib is already present in the client.json in a different, it can't be inherited
     # So first we need a dict which contains all libs that are already present
@@ -248,20 +424,6 @@ def get_sha1_hash(path: str) -> str:
     return sha1.hexdigest()
 
 
-def get_os_version() -> str:
-    """
-    Try to implement System.getProperty("os.version") from Java for use in rules
-    This doesn't work on mac yet
-    """
-    if platform.system() == "Windows":
-        ver = sys.getwindowsversion()  # type: ignore
-        return f"{ver.major}.{ver.minor}"
-    elif platform.system == "Darwin":
-        return ""
-    else:
-        return platform.uname().release
-
-
 _user_agent_cache = None
 
 
@@ -288,39 +450,47 @@ def get_classpath_separator() -> Literal[":", ";"]:
         return ":"
 
 
-_requests_response_cache: dict[str, RequestsResponseCache] = {}
+def _get_cached_payload(url: str, kind: str, parse: Callable[[bytes], Any]) -> Any:
+    """
+    Returns the parsed content of the given URL. The result is cached, so you don't need to make a request to a URL each time you call a function.
+    """
+    return get_cached_payload(url, kind, parse, {"user-agent": get_user_agent()})
+
+
+def get_cached_json(url: str) -> Any:
+    """
+    Returns the parsed JSON of the given URL using the cache. The result is shared and must not be modified.
+    """
+    return _get_cached_payload(url, "json", json.loads)
 
 
-def get_requests_response_cache(url: str) -> requests.models.Response:
+def get_version_manifest() -> VersionManifest:
     """
-    Caches the result of request.get(). If a request was made to the same URL within the last hour, the cache will be used, so you don't need to make a request to a URl each timje you call a function.
+    Returns the parsed version manifest using the cache. The result is shared and must not be modified.
     """
-    global _requests_response_cache  # noqa: F824
-    if url not in _requests_response_cache or (datetime.datetime.now() - _requests_response_cache[url]["datetime"]).total_seconds() / 60 / 60 >= 1:
-        r = requests.get(url, headers={"user-agent": get_user_agent()})
-        if r.status_code == 200:
-            _requests_response_cache[url] = {
-                "response": r,
-                "datetime": datetime.datetime.now()
-            }
-        return r
-    else:
-        return _requests_response_cache[url]["response"]
+    return _get_cached_payload(VERSION_MANIFEST_URL, "version-manifest", parse_version_manifest)
 
 
-def parse_maven_metadata(url: str) -> MavenMetadata:
+def _parse_maven_metadata(content: bytes) -> MavenMetadata:
     """
-    Parses a maven metadata file
+    Parses the content of a maven metadata file
     """
-    r = get_requests_response_cache(url)
+    text = content.decode("utf-8")
     # The structure of the metadata file is simple. So you don't need a XML parser. It can be parsed using RegEx.
     return {
-        "release": re.search("(?<=<release>).*?(?=</release>)", r.text, re.MULTILINE).group(),  # type: ignore
-        "latest": re.search("(?<=<latest>).*?(?=</latest>)", r.text, re.MULTILINE).group(),  # type: ignore
-        "versions": re.findall("(?<=<version>).*?(?=</version>)", r.text, re.MULTILINE)
+        "release": re.search("(?<=<release>).*?(?=</release>)", text, re.MULTILINE).group(),  # type: ignore
+        "latest": re.search("(?<=<latest>).*?(?=</latest>)", text, re.MULTILINE).group(),  # type: ignore
+        "versions": re.findall("(?<=<version>).*?(?=</version>)", text, re.MULTILINE)
     }
 
 
+def parse_maven_metadata(url: str) -> MavenMetadata:
+    """
+    Parses a maven metadata file. The result is shared and must not be modified.
+    """
+    return _get_cached_payload(url, "maven-metadata", _parse_maven_metadata)
+
+
 def extract_file_from_zip(handler: zipfile.ZipFile, zip_path: str, extract_path: str, minecraft_directory: str | os.PathLike | None = None) -> None:
     """
     Extract a file from a zip handler into the given path
@@ -360,9 +530,8 @@ def get_client_json(version: str, minecraft_directory: str | os.PathLike) -> Cli
 
         return data
 
-    version_list = get_requests_response_cache("https://launchermeta.mojang.com/mc/game/version_manifest_v2.json").json()
-    for i in version_list["versions"]:
-        if i["id"] == version:
-            return get_requests_response_cache(i["url"]).json()
+    version_info = get_version_manifest().get(version)
+    if version_info is None:
+        raise VersionNotFound(version)
 
-    raise VersionNotFound(version)
+    return copy.deepcopy(get_cached_json(version_info["url"]))
@@ -1,17 +1,31 @@
 # This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
-from typing import TypedDict
-import requests
-import datetime  # noqa: F401
+from typing import TypedDict, Any
 
 
-class RequestsResponseCache(TypedDict):
-    response: requests.models.Response
-    datetime: datetime.datetime
+class MemoryCacheEntry(TypedDict):
+    payload: Any
+    size: int
+    time: float
+
+
+class MetadataCacheEntry(TypedDict):
+    url: str
+    etag: str | None
+    lastModified: str | None
+    fetched: float
+    sha1: str
 
 
 class MavenMetadata(TypedDict):
     release: str
     latest: str
     versions: list[str]
+
+
+class VerificationIndexEntry(TypedDict):
+    size: int
+    mtime_ns: int
+    inode: int
+    sha1: str
@@ -1,6 +1,9 @@
 # This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
+from .runtime_types import RuntimeInstallInfo
+from .shared_types import ClientJson
+from .._version_manifest import VersionManifest
 from typing import TypedDict
 
 
@@ -11,3 +14,31 @@ class _AssetsJsonObject(TypedDict):
 
 class AssetsJson(TypedDict):
     objects: dict[str, _AssetsJsonObject]
+
+
+class NativesExtract(TypedDict):
+    file: str
+    directory: str
+    exclude: list[str]
+
+
+class DownloadJob(TypedDict, total=False):
+    url: str
+    path: str
+    sha1: str | None
+    size: int
+    lzmaCompressed: bool
+    executable: bool
+    ignoreErrors: bool
+    extract: NativesExtract
+    phase: str
+
+
+class VersionInstallPlan(TypedDict):
+    jobs: list[DownloadJob]
+    runtimes: list[RuntimeInstallInfo]
+    inheritsFrom: dict[str, str]
+    dryRun: bool
+    versionData: dict[str, ClientJson]
+    versionManifest: VersionManifest | None
+    assetIndexes: list[str]
@@ -4,9 +4,10 @@
 from typing import TypedDict, Literal
 
 
-class MrpackFileHashes(TypedDict):
+class MrpackFileHashes(TypedDict, total=False):
     sha1: str
     sha256: str
+    sha512: str
 
 
 class MrpackFileEnv(TypedDict):
@@ -34,3 +34,12 @@ class _PlatformManifestJsonFile(TypedDict, total=False):
 
 class PlatformManifestJson(TypedDict):
     files: dict[str, _PlatformManifestJsonFile]
+
+
+class RuntimeInstallInfo(TypedDict):
+    jvmVersion: str
+    platform: str
+    versionName: str
+    files: dict[str, str]
+    directories: list[str]
+    links: dict[str, str]
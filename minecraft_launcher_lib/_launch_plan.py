@@ -0,0 +1,248 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module contains the launch plan, which holds everything that is needed to create the command of a version. It should not be used outside minecraft_launcher_lib.
+
+A launch plan is created once per version and reused until one of the version jsons is changed.
+"""
+from ._internal_types.shared_types import ClientJson
+from ._helper import merge_inherited_json, parse_rule_list, get_classpath_separator, get_library_path
+from ._argument_template import CompiledArgument, ArgumentTemplate, compile_argument_list, compile_template, get_placeholder_names
+from ._verification_index import INDEX_DIRECTORY_NAME
+from ._rules import get_platform_profile
+from .natives import get_natives
+from collections import OrderedDict
+import threading
+import hashlib
+import json
+import time
+import os
+
+_MAX_LAUNCH_PLANS = 64
+_MAX_ARGUMENT_FILES = 16
+# Argument files that have not been used for this time are removed. A running instance might still need its file for a restart.
+_ARGUMENT_FILE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def get_classpath(data: ClientJson, path: str) -> str:
+    """
+    Returns the argument with all libs that come after -cp
+    """
+    classpath_seperator = get_classpath_separator()
+    libstr = ""
+    for i in data["libraries"]:
+        if "rules" in i and not parse_rule_list(i["rules"], {}):
+            continue
+
+        libstr += get_library_path(i["name"], path) + classpath_seperator
+        native = get_natives(i)
+        if native != "":
+            if "downloads" in i and "path" in i["downloads"]["classifiers"][native]:  # type: ignore
+                libstr += os.path.join(path, "libraries", i["downloads"]["classifiers"][native]["path"]) + classpath_seperator  # type: ignore
+            else:
+                libstr += get_library_path(i["name"] + "-" + native, path) + classpath_seperator
+
+    if "jar" in data:
+        libstr = libstr + os.path.join(path, "versions", data["jar"], data["jar"] + ".jar")
+    else:
+        libstr = libstr + os.path.join(path, "versions", data["id"], data["id"] + ".jar")
+
+    return libstr
+
+
+class LaunchPlan():
+    """
+    The resolved data of a version. It is shared by all commands of the version, so it must not be modified.
+    """
+    def __init__(self, version: str, minecraft_directory: str, data: ClientJson, json_files: dict[str, tuple[int, int]]) -> None:
+        self.version = version
+        self.minecraft_directory = minecraft_directory
+        self.data = data
+        self.json_files = json_files
+        self.profile = get_platform_profile()
+        self.classpath = get_classpath(data, minecraft_directory)
+
+        self.jvm_arguments: list[CompiledArgument] | None = None
+        self.game_arguments: list[CompiledArgument] = []
+        # The minecraftArguments of older versions
+        self.game_arguments_string: list[ArgumentTemplate] | None = None
+
+        if isinstance(data.get("arguments", None), dict) and "jvm" in data["arguments"]:
+            self.jvm_arguments = compile_argument_list(data["arguments"]["jvm"])
+
+        if "minecraftArguments" in data:
+            self.game_arguments_string = [compile_template(i) for i in data["minecraftArguments"].split(" ")]
+        else:
+            self.game_arguments = compile_argument_list(data["arguments"]["game"])
+
+        self.placeholder_names: set[str] = set()
+        for compiled_list in (self.jvm_arguments or [], self.game_arguments):
+            for _, templates in compiled_list:
+                for template in templates:
+                    self.placeholder_names.update(get_placeholder_names(template))
+        for template in self.game_arguments_string or []:
+            self.placeholder_names.update(get_placeholder_names(template))
+
+        self.argument_files: OrderedDict[tuple[str, ...], str] = OrderedDict()
+        self.argument_files_lock = threading.Lock()
+
+        # Java executable -> ((real path, release file), stat of the release file, Java build) for the Class Data Sharing archives
+        self.java_builds: dict[str, tuple[tuple[str, str], tuple[int, int] | None, tuple[str, int] | None]] = {}
+
+    def is_valid(self) -> bool:
+        "Checks if the version jsons and the platform are still the same"
+        if self.profile is not get_platform_profile():
+            return False
+
+        for path, stat_key in self.json_files.items():
+            if _get_stat_key(path) != stat_key:
+                return False
+
+        return True
+
+
+def _quote_argument(argument: str) -> str:
+    """
+    Quotes a argument for a Java argument file
+    """
+    for char, escaped in (("\\", "\\\\"), ("\"", "\\\""), ("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t")):
+        argument = argument.replace(char, escaped)
+    return f'"{argument}"'
+
+
+def _remove_old_argument_files(plan: LaunchPlan, directory: str) -> None:
+    """
+    Removes the argument files of the version, that have not been used for a long time
+    """
+    min_mtime = time.time() - _ARGUMENT_FILE_MAX_AGE
+    for name in os.listdir(directory):
+        if not name.endswith(".txt") or name.rsplit("-", 1)[0] != plan.version:
+            continue
+
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < min_mtime:
+                os.remove(path)
+        except OSError:
+            # The file might be in use on Windows or removed by another thread
+            pass
+
+
+def get_argument_file(plan: LaunchPlan, arguments: list[str]) -> str:
+    """
+    Writes the arguments into a Java argument file and returns its path.
+    The name contains the hash of the content, so a file is reused as long as the arguments are the same.
+    Only the most recently used files are remembered by the plan and files that have not been used for a long time are removed.
+    """
+    key = tuple(arguments)
+    with plan.argument_files_lock:
+        path = plan.argument_files.get(key)
+        if path is not None:
+            plan.argument_files.move_to_end(key)
+
+    if path is not None:
+        try:
+            # Mark the file as used, so it is not removed
+            os.utime(path)
+            return path
+        except OSError:
+            pass
+
+    content = "".join(_quote_argument(i) + "\n" for i in arguments).encode("utf-8")
+    path = os.path.join(plan.minecraft_directory, INDEX_DIRECTORY_NAME, "argfiles", f"{plan.version}-{hashlib.sha1(content).hexdigest()}.txt")
+
+    if os.path.isfile(path):
+        os.utime(path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _remove_old_argument_files(plan, os.path.dirname(path))
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    with plan.argument_files_lock:
+        plan.argument_files[key] = path
+        plan.argument_files.move_to_end(key)
+        while len(plan.argument_files) > _MAX_ARGUMENT_FILES:
+            plan.argument_files.popitem(last=False)
+
+    return path
+
+
+_launch_plans: dict[tuple[str, str], LaunchPlan] = {}
+_lock = threading.Lock()
+
+
+def _get_stat_key(path: str) -> tuple[int, int] | None:
+    """
+    Returns the mtime and the size of the file or None, if it doesn't exist
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _load_json(path: str, json_files: dict[str, tuple[int, int]]) -> ClientJson:
+    """
+    Loads the version json and records its mtime
+    """
+    stat_key = _get_stat_key(path)
+
+    with open(path, "r", encoding="utf-8") as f:
+        data: ClientJson = json.load(f)
+
+    if stat_key is not None:
+        json_files[path] = stat_key
+
+    return data
+
+
+def _create_launch_plan(version: str, minecraft_directory: str) -> LaunchPlan:
+    """
+    Reads the version json and creates a new launch plan
+    """
+    json_files: dict[str, tuple[int, int]] = {}
+
+    data = _load_json(os.path.join(minecraft_directory, "versions", version, version + ".json"), json_files)
+
+    if "inheritsFrom" in data:
+        inherit_version = data["inheritsFrom"]
+        data = merge_inherited_json(data, _load_json(os.path.join(minecraft_directory, "versions", inherit_version, inherit_version + ".json"), json_files))
+
+    return LaunchPlan(version, minecraft_directory, data, json_files)
+
+
+def get_launch_plan(version: str, minecraft_directory: str) -> LaunchPlan:
+    """
+    Returns the launch plan of the given version. A cached plan is used, if the version jsons have not been changed.
+    """
+    key = (minecraft_directory, version)
+
+    with _lock:
+        plan = _launch_plans.get(key)
+
+    if plan is not None and plan.is_valid():
+        return plan
+
+    plan = _create_launch_plan(version, minecraft_directory)
+
+    with _lock:
+        _launch_plans.pop(key, None)
+        if len(_launch_plans) >= _MAX_LAUNCH_PLANS:
+            del _launch_plans[next(iter(_launch_plans))]
+        _launch_plans[key] = plan
+
+    return plan
+
+
+def clear_launch_plans() -> None:
+    """
+    Removes all cached launch plans
+    """
+    with _lock:
+        _launch_plans.clear()
@@ -0,0 +1,267 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module contains the cache for metadata like the version manifest or the mod loader version lists. It should not be used outside minecraft_launcher_lib.
+
+There are two layers: A cache in memory that holds the parsed content and an optional cache on disk, that survives restarts.
+The cache in memory is thread-safe and limited by the estimated size of the parsed content. The least recently used entries are removed first.
+An entry that is older than the TTL is revalidated with the ETag and Last-Modified headers, so an unchanged file only costs a 304 response.
+"""
+from .network import get_metadata_cache_directory, get_metadata_cache_ttl, get_metadata_cache_memory_limit, is_offline_mode
+from ._internal_types.helper_types import MemoryCacheEntry, MetadataCacheEntry
+from .exceptions import NotAvailableOffline
+from typing import Callable, Any
+from ._retry import get_with_retry
+import collections
+import threading
+import requests
+import hashlib
+import sys
+import json
+import math
+import time
+import os
+
+_MAX_MEMORY_CACHE_ENTRIES = 256
+
+_memory_cache: collections.OrderedDict[tuple[str, str], MemoryCacheEntry] = collections.OrderedDict()
+_memory_cache_size = 0
+_memory_cache_lock = threading.Lock()
+_flights: dict[tuple[str, str], "_Flight"] = {}
+
+
+def _get_ttl() -> float:
+    """
+    Returns the TTL. In offline mode entries never expire.
+    """
+    if is_offline_mode():
+        return math.inf
+
+    return get_metadata_cache_ttl()
+
+
+def _get_disk_cache_paths(directory: str, url: str) -> tuple[str, str]:
+    """
+    Returns the path of the info file and the content file of the given URL
+    """
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(directory, key + ".json"), os.path.join(directory, key + ".data")
+
+
+def _read_disk_cache(directory: str, url: str) -> tuple[MetadataCacheEntry, bytes] | None:
+    """
+    Returns the entry of the URL from the disk cache or None, if there is no valid entry
+    """
+    info_path, content_path = _get_disk_cache_paths(directory, url)
+
+    try:
+        with open(info_path, "r", encoding="utf-8") as f:
+            entry: MetadataCacheEntry = json.load(f)
+
+        with open(content_path, "rb") as f:
+            content = f.read()
+    except (OSError, ValueError):
+        return None
+
+    # Protect against hash collisions and broken files
+    if not isinstance(entry, dict) or entry.get("url") != url or entry.get("sha1") != hashlib.sha1(content).hexdigest():
+        return None
+
+    return entry, content
+
+
+def _write_file(path: str, content: bytes) -> None:
+    """
+    Writes the file atomically
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def _write_disk_cache(directory: str, entry: MetadataCacheEntry, content: bytes | None) -> None:
+    """
+    Writes the entry into the disk cache. If content is None, only the info is updated.
+    """
+    info_path, content_path = _get_disk_cache_paths(directory, entry["url"])
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        if content is not None:
+            _write_file(content_path, content)
+
+        _write_file(info_path, json.dumps(entry).encode("utf-8"))
+    except OSError:
+        # The cache is optional, so a error should not break anything
+        pass
+
+
+def fetch_metadata(url: str, headers: dict[str, str]) -> tuple[bytes, float]:
+    """
+    Returns the content of the given URL using the disk cache, if it is enabled.
+    The second value is the time at which the content was fetched, so the TTL of a entry from the disk cache is not restarted.
+    """
+    directory = get_metadata_cache_directory()
+    cached = _read_disk_cache(directory, url) if directory is not None else None
+
+    if cached is not None and time.time() - cached[0]["fetched"] < _get_ttl():
+        return cached[1], cached[0]["fetched"]
+
+    if is_offline_mode():
+        raise NotAvailableOffline(url)
+
+    request_headers = headers.copy()
+    if cached is not None:
+        if cached[0]["etag"] is not None:
+            request_headers["If-None-Match"] = cached[0]["etag"]
+        if cached[0]["lastModified"] is not None:
+            request_headers["If-Modified-Since"] = cached[0]["lastModified"]
+
+    try:
+        r = get_with_retry(url, headers=request_headers)
+    except requests.exceptions.RequestException:
+        # A outdated file is better than nothing. It is kept for a full TTL, so the server is not asked again on every call.
+        if cached is not None:
+            return cached[1], time.time()
+        raise
+
+    if r.status_code == 304 and cached is not None and directory is not None:
+        cached[0]["fetched"] = time.time()
+        _write_disk_cache(directory, cached[0], None)
+        return cached[1], cached[0]["fetched"]
+
+    r.raise_for_status()
+    content = r.content
+    fetched = time.time()
+
+    if directory is not None:
+        _write_disk_cache(directory, {
+            "url": url,
+            "etag": r.headers.get("ETag"),
+            "lastModified": r.headers.get("Last-Modified"),
+            "fetched": fetched,
+            "sha1": hashlib.sha1(content).hexdigest()
+        }, content)
+
+    return content, fetched
+
+
+def estimate_size(payload: Any) -> int:
+    """
+    Returns a estimate of how many bytes the parsed content uses in memory.
+    Containers and the attributes of objects are followed. Objects that are referenced multiple times are only counted once.
+    """
+    seen: set[int] = set()
+    size = 0
+    stack = [payload]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__") and not isinstance(current, type):
+            stack.append(vars(current))
+
+    return size
+
+
+class _Flight():
+    "A request that is currently running. Other threads wait for its result instead of sending the same request."
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def _evict(limit: int) -> None:
+    """
+    Removes expired entries and the least recently used entries until the cache fits into the limit. Must be called with the lock held.
+    """
+    global _memory_cache_size
+
+    now = time.time()
+    ttl = _get_ttl()
+    for key in [key for key, entry in _memory_cache.items() if now - entry["time"] >= ttl]:
+        _memory_cache_size -= _memory_cache.pop(key)["size"]
+
+    while _memory_cache and (_memory_cache_size > limit or len(_memory_cache) > _MAX_MEMORY_CACHE_ENTRIES):
+        _memory_cache_size -= _memory_cache.popitem(last=False)[1]["size"]
+
+
+def get_cached_payload(url: str, kind: str, parse: Callable[[bytes], Any], headers: dict[str, str]) -> Any:
+    """
+    Returns the parsed content of the given URL. kind is the name of the parser and is used as part of the cache key.
+    The memory cache is used, if the entry is not older than the TTL. If multiple threads ask for the same URL, only one request is made.
+    The returned object is shared and must not be modified.
+    """
+    global _memory_cache_size
+
+    key = (url, kind)
+    with _memory_cache_lock:
+        entry = _memory_cache.get(key)
+        if entry is not None and time.time() - entry["time"] < _get_ttl():
+            _memory_cache.move_to_end(key)
+            return entry["payload"]
+
+        flight = _flights.get(key)
+        is_owner = flight is None
+        if flight is None:
+            flight = _Flight()
+            _flights[key] = flight
+
+    if not is_owner:
+        flight.event.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        content, fetched = fetch_metadata(url, headers)
+        flight.result = parse(content)
+        size = estimate_size(flight.result)
+    except BaseException as ex:
+        flight.error = ex
+        raise
+    finally:
+        with _memory_cache_lock:
+            del _flights[key]
+
+            limit = get_metadata_cache_memory_limit()
+            if flight.error is None and size <= limit:
+                old_entry = _memory_cache.pop(key, None)
+                if old_entry is not None:
+                    _memory_cache_size -= old_entry["size"]
+
+                # The TTL starts when the content was fetched and not when it was read from the disk cache
+                _memory_cache[key] = {
+                    "payload": flight.result,
+                    "size": size,
+                    "time": fetched
+                }
+                _memory_cache_size += size
+                _evict(limit)
+
+        flight.event.set()
+
+    return flight.result
+
+
+def clear_memory_cache() -> None:
+    """
+    Removes all entries from the memory cache
+    """
+    global _memory_cache_size
+
+    with _memory_cache_lock:
+        _memory_cache.clear()
+        _memory_cache_size = 0
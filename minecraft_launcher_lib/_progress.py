@@ -0,0 +1,139 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"This module creates the progress events of the installers. It should not be used outside minecraft_launcher_lib"
+from .types import CallbackDict, ProgressEvent, ProgressEventPhase
+from ._internal_types.install_types import DownloadJob
+import threading
+import time
+
+DEFAULT_PROGRESS_EVENT_INTERVAL = 0.1
+DEFAULT_PHASE = "download"
+
+
+class _PhaseState():
+    "The counters of a single phase"
+    def __init__(self) -> None:
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.bytes_transferred = 0
+        self.files_done = 0
+        self.files_total = 0
+
+
+class ProgressTracker():
+    """
+    Counts the downloaded bytes of all jobs of a scheduler run and sends progress events to the progressEvent callback.
+    It can be used from any thread. The events are sent one after another and not more often than the configured interval.
+    """
+    def __init__(self, callback: CallbackDict, jobs: list[DownloadJob]) -> None:
+        self._callback = callback.get("progressEvent")
+        self._interval = callback.get("progressEventInterval", DEFAULT_PROGRESS_EVENT_INTERVAL)
+        self._lock = threading.Lock()
+        self._phases: dict[str, _PhaseState] = {}
+        self._start_time = time.monotonic()
+        self._last_event_time: float | None = None
+        self._job_bytes: dict[int, int] = {}
+
+        for job in jobs:
+            phase = self._get_phase(job)
+            phase.bytes_total += job.get("size", 0)
+            phase.files_total += 1
+
+    @property
+    def enabled(self) -> bool:
+        "If there is a callback that receives the events"
+        return self._callback is not None
+
+    def _get_phase(self, job: DownloadJob) -> _PhaseState:
+        "Returns the state of the phase of the job"
+        name = job.get("phase", DEFAULT_PHASE)
+        if name not in self._phases:
+            self._phases[name] = _PhaseState()
+        return self._phases[name]
+
+    def add_bytes(self, job: DownloadJob, count: int) -> None:
+        "Adds bytes that have been downloaded for the job"
+        if self._callback is None:
+            return
+
+        with self._lock:
+            phase = self._get_phase(job)
+
+            # A retry downloads the same bytes again, so a job can't count more than its size
+            reported_bytes = self._job_bytes.get(id(job), 0)
+            new_bytes = max(0, min(count, job.get("size", 0) - reported_bytes))
+            self._job_bytes[id(job)] = reported_bytes + new_bytes
+
+            phase.bytes_done += new_bytes
+            phase.bytes_transferred += count
+            self._send_event(False)
+
+    def finish_job(self, job: DownloadJob) -> None:
+        """
+        Marks the job as finished.
+        The size of files that didn't need to be downloaded is added to the done bytes, but not used to calculate the rate.
+        """
+        if self._callback is None:
+            return
+
+        with self._lock:
+            phase = self._get_phase(job)
+            phase.bytes_done += max(0, job.get("size", 0) - self._job_bytes.pop(id(job), 0))
+            phase.files_done += 1
+            self._send_event(False)
+
+    def finish(self) -> None:
+        "Sends the final event"
+        if self._callback is None:
+            return
+
+        with self._lock:
+            self._send_event(True)
+
+    def _send_event(self, finished: bool) -> None:
+        "Sends a event, if the interval has passed. Must be called with the lock held."
+        if self._callback is None:
+            return
+
+        now = time.monotonic()
+        if not finished and self._last_event_time is not None and now - self._last_event_time < self._interval:
+            return
+        self._last_event_time = now
+
+        elapsed = max(now - self._start_time, 1e-9)
+
+        phases: dict[str, ProgressEventPhase] = {}
+        for name, state in self._phases.items():
+            phases[name] = {
+                "bytesDone": state.bytes_done,
+                "bytesTotal": state.bytes_total,
+                "filesDone": state.files_done,
+                "filesTotal": state.files_total,
+                "bytesPerSecond": state.bytes_transferred / elapsed
+            }
+
+        bytes_done = sum(i.bytes_done for i in self._phases.values())
+        bytes_total = sum(i.bytes_total for i in self._phases.values())
+        bytes_per_second = sum(i.bytes_transferred for i in self._phases.values()) / elapsed
+
+        if finished:
+            eta: float | None = 0.0
+        elif bytes_per_second > 0:
+            eta = max(0, bytes_total - bytes_done) / bytes_per_second
+        else:
+            eta = None
+
+        event: ProgressEvent = {
+            "bytesDone": bytes_done,
+            "bytesTotal": bytes_total,
+            "filesDone": sum(i.files_done for i in self._phases.values()),
+            "filesTotal": sum(i.files_total for i in self._phases.values()),
+            "bytesPerSecond": bytes_per_second,
+            "eta": eta,
+            "elapsed": now - self._start_time,
+            "finished": finished,
+            "phases": phases
+        }
+
+        self._callback(event)
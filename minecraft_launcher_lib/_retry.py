@@ -0,0 +1,130 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"This module retries requests with a exponential backoff and falls back to mirrors. It should not be used outside minecraft_launcher_lib"
+from .network import get_retry_policy, get_mirror_urls, get_session, is_offline_mode, _get_host_connection_slot
+from .exceptions import NotAvailableOffline
+from typing import Callable, TypeVar, Any
+from .types import RetryPolicy
+import email.utils
+import datetime
+import requests
+import random
+import time
+
+T = TypeVar("T")
+
+_TRANSIENT_STATUS_CODES = frozenset((408, 425, 429, 500, 502, 503, 504))
+_TRANSIENT_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError)
+
+
+class TransientHTTPError(requests.exceptions.HTTPError):
+    """
+    Raised when the server returned a status code that may go away, if the request is sent again
+    """
+    def __init__(self, response: requests.models.Response) -> None:
+        super().__init__(f"{response.url} returned status code {response.status_code}", response=response)
+        self.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses the value of a Retry-After header. It can contain the number of seconds or a HTTP date.
+    Returns None, if the header is missing or invalid.
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def check_transient_status(response: requests.models.Response) -> None:
+    """
+    Raises TransientHTTPError, if the response has a status code that should be retried
+    """
+    if response.status_code in _TRANSIENT_STATUS_CODES:
+        response.close()
+        raise TransientHTTPError(response)
+
+
+def get_retry_delay(policy: RetryPolicy, attempt: int, retry_after: float | None) -> float:
+    """
+    Returns the time in seconds to wait before the given retry (starting with 1)
+    """
+    max_backoff = policy.get("maxBackoff", 30.0)
+    delay = min(max_backoff, policy.get("backoffFactor", 0.5) * (2 ** (attempt - 1)))
+
+    if policy.get("jitter", True):
+        delay = random.uniform(0, delay)
+
+    # The server knows best when it can handle the request again
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_backoff))
+
+    return delay
+
+
+def get_timeout() -> tuple[float, float]:
+    """
+    Returns the connect and read timeout of the retry policy in the format used by requests
+    """
+    policy = get_retry_policy()
+    return policy.get("connectTimeout", 10.0), policy.get("readTimeout", 60.0)
+
+
+def call_with_retry(url: str, func: Callable[[str], T]) -> T:
+    """
+    Calls func with the given URL until it doesn't raise a transient error.
+    Every call waits until the connection limit of the host allows a new request.
+    If all attempts failed, the same is done with the URL on every mirror.
+    The last error is raised, if nothing worked.
+    In offline mode NotAvailableOffline is raised without sending anything.
+    """
+    if is_offline_mode():
+        raise NotAvailableOffline(url)
+
+    policy = get_retry_policy()
+    attempts = policy.get("attempts", 3)
+    last_exception: BaseException = RuntimeError("No URL was tried")
+
+    for current_url in get_mirror_urls(url):
+        for attempt in range(attempts):
+            if attempt > 0:
+                retry_after = last_exception.retry_after if isinstance(last_exception, TransientHTTPError) else None
+                time.sleep(get_retry_delay(policy, attempt, retry_after))
+
+            try:
+                with _get_host_connection_slot(current_url):
+                    return func(current_url)
+            except TransientHTTPError as ex:
+                last_exception = ex
+            except _TRANSIENT_EXCEPTIONS as ex:
+                last_exception = ex
+
+    raise last_exception
+
+
+def get_with_retry(url: str, **kwargs: Any) -> requests.models.Response:
+    """
+    Sends a GET request using the shared session with retries and mirrors
+    """
+    def _get(current_url: str) -> requests.models.Response:
+        "Sends a single request"
+        response = get_session().get(current_url, timeout=get_timeout(), **kwargs)
+        check_transient_status(response)
+        return response
+
+    return call_with_retry(url, _get)
@@ -0,0 +1,207 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module compiles the rules of the version json into predicates. It should not be used outside minecraft_launcher_lib.
+
+The OS part of a rule only depends on the platform, so it is evaluated once per rule list.
+The compiled predicate only checks the features against the given options.
+"""
+from ._internal_types.shared_types import ClientJsonRule
+from typing import Callable
+from .types import MinecraftOptions
+import threading
+import platform
+import json
+import sys
+import re
+
+RulePredicate = Callable[[MinecraftOptions], bool]
+
+_MAX_COMPILED_RULES = 1024
+
+_FEATURE_CHECKS: dict[str, RulePredicate] = {
+    "has_custom_resolution": lambda options: bool(options.get("customResolution", False)),
+    "is_demo_user": lambda options: bool(options.get("demo", False)),
+    "has_quick_plays_support": lambda options: options.get("quickPlayPath") is not None,
+    "is_quick_play_singleplayer": lambda options: options.get("quickPlaySingleplayer") is not None,
+    "is_quick_play_multiplayer": lambda options: options.get("quickPlayMultiplayer") is not None,
+    "is_quick_play_realms": lambda options: options.get("quickPlayRealms") is not None,
+}
+
+
+def _always_true(options: MinecraftOptions) -> bool:
+    "A predicate for rule lists that always match"
+    return True
+
+
+def _always_false(options: MinecraftOptions) -> bool:
+    "A predicate for rule lists that never match"
+    return False
+
+
+def get_os_version() -> str:
+    """
+    Try to implement System.getProperty("os.version") from Java for use in rules
+    This doesn't work on mac yet
+    """
+    if platform.system() == "Windows":
+        ver = sys.getwindowsversion()  # type: ignore
+        return f"{ver.major}.{ver.minor}"
+    elif platform.system == "Darwin":
+        return ""
+    else:
+        return platform.uname().release
+
+
+class PlatformProfile():
+    """
+    The information about the current platform that is needed to evaluate rules.
+    It also holds the rule lists that have been compiled for this platform. The rules are compiled from multiple threads, so the caches are guarded by a lock.
+    """
+    def __init__(self) -> None:
+        self.system = platform.system()
+        self.is_32bit = platform.architecture()[0] == "32bit"
+        self.os_version: str | None = None
+        self.compiled_rules: dict[str, RulePredicate] = {}
+        # The same rule list object is usually compiled many times (e.g. by install and natives), so it's looked up by identity first.
+        # The list is kept, so its id can't be reused by another list.
+        self.compiled_rule_lists: dict[int, tuple[list[ClientJsonRule], RulePredicate]] = {}
+        self.compiled_rules_lock = threading.Lock()
+        self._os_version_matches: dict[str, bool] = {}
+
+    def match_os(self, rule: ClientJsonRule) -> bool:
+        "Checks if the os part of the rule matches this platform"
+        for os_key, os_value in rule.get("os", {}).items():
+            if os_key == "name":
+                if os_value == "windows" and self.system != "Windows":
+                    return False
+                elif os_value == "osx" and self.system != "Darwin":
+                    return False
+                elif os_value == "linux" and self.system != "Linux":
+                    return False
+            elif os_key == "arch":
+                if os_value == "x86" and not self.is_32bit:
+                    return False
+            elif os_key == "version":
+                if os_value not in self._os_version_matches:
+                    # The version is only needed by a few rules, so it is looked up the first time it's needed
+                    if self.os_version is None:
+                        self.os_version = get_os_version()
+                    self._os_version_matches[os_value] = re.match(os_value, self.os_version) is not None
+                if not self._os_version_matches[os_value]:
+                    return False
+        return True
+
+
+_profile: PlatformProfile | None = None
+_lock = threading.Lock()
+
+
+def get_platform_profile() -> PlatformProfile:
+    """
+    Returns the profile of the current platform. It is only created once.
+    """
+    global _profile
+
+    profile = _profile
+    if profile is not None:
+        return profile
+
+    with _lock:
+        if _profile is None:
+            _profile = PlatformProfile()
+        return _profile
+
+
+def reset_platform_profile() -> None:
+    """
+    Removes the profile, so it's created again the next time it's needed.
+    This must be called if the platform functions have been replaced (e.g. by tests).
+    """
+    global _profile
+
+    with _lock:
+        _profile = None
+
+
+def _compile_rule(rule: ClientJsonRule, profile: PlatformProfile) -> RulePredicate | bool:
+    """
+    Compiles a single rule. Returns a bool, if the result does not depend on the options.
+    """
+    allow = rule["action"] == "allow"
+
+    if not profile.match_os(rule):
+        return not allow
+
+    feature_checks = [_FEATURE_CHECKS[i] for i in rule.get("features", {}).keys() if i in _FEATURE_CHECKS]
+    if len(feature_checks) == 0:
+        return allow
+
+    def _predicate(options: MinecraftOptions) -> bool:
+        "Checks the features of the rule"
+        for check in feature_checks:
+            if not check(options):
+                return not allow
+        return allow
+
+    return _predicate
+
+
+def _remember_rule_list(profile: PlatformProfile, rules: list[ClientJsonRule], predicate: RulePredicate) -> None:
+    """
+    Caches the predicate by the identity of the rule list. Must be called with the lock of the profile held.
+    """
+    if len(profile.compiled_rule_lists) >= _MAX_COMPILED_RULES:
+        profile.compiled_rule_lists.clear()
+
+    profile.compiled_rule_lists[id(rules)] = (rules, predicate)
+
+
+def compile_rule_list(rules: list[ClientJsonRule]) -> RulePredicate:
+    """
+    Compiles a list of rules into a predicate over the options. The result is cached.
+    The rule list must not be modified after it has been compiled.
+    """
+    profile = get_platform_profile()
+
+    with profile.compiled_rules_lock:
+        cached = profile.compiled_rule_lists.get(id(rules))
+    if cached is not None and cached[0] is rules:
+        return cached[1]
+
+    key = json.dumps(rules, sort_keys=True)
+    with profile.compiled_rules_lock:
+        predicate = profile.compiled_rules.get(key)
+        if predicate is not None:
+            _remember_rule_list(profile, rules, predicate)
+            return predicate
+
+    predicates: list[RulePredicate] = []
+    for rule in rules:
+        compiled = _compile_rule(rule, profile)
+        if isinstance(compiled, bool):
+            if not compiled:
+                predicates = [_always_false]
+                break
+        else:
+            predicates.append(compiled)
+
+    if len(predicates) == 0:
+        predicate = _always_true
+    elif len(predicates) == 1:
+        predicate = predicates[0]
+    else:
+        def predicate(options: MinecraftOptions) -> bool:
+            "Checks all rules of the list"
+            return all(i(options) for i in predicates)
+
+    # Another thread might have compiled the same rules in the meantime, which doesn't matter, because the result is the same
+    with profile.compiled_rules_lock:
+        if len(profile.compiled_rules) >= _MAX_COMPILED_RULES:
+            profile.compiled_rules.clear()
+
+        profile.compiled_rules[key] = predicate
+        _remember_rule_list(profile, rules, predicate)
+
+    return predicate
@@ -0,0 +1,59 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"This module contains the bandwidth limiter and the connection limits per host. It should not be used outside minecraft_launcher_lib"
+from typing import Iterable, Iterator
+import threading
+import time
+
+
+class TokenBucket():
+    """
+    A token bucket that is shared by all threads.
+    Every byte needs a token. The bucket is refilled with rate tokens per second and holds at most one second of tokens.
+    """
+    def __init__(self, rate: int) -> None:
+        self.rate = rate
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> None:
+        """
+        Takes the given amount of tokens and waits until they are available.
+        The tokens are reserved before waiting, so parallel callers get their share one after another.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.rate), self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= amount
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def limit_bandwidth(chunks: Iterable[bytes], bucket: TokenBucket) -> Iterator[bytes]:
+    """
+    Consumes the size of every chunk from the bucket before passing it on
+    """
+    for chunk in chunks:
+        bucket.consume(len(chunk))
+        yield chunk
+
+
+class HostConnectionSlot():
+    """
+    A context manager that waits until a connection to the host is allowed
+    """
+    def __init__(self, semaphore: threading.BoundedSemaphore | None) -> None:
+        self._semaphore = semaphore
+
+    def __enter__(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+    def __exit__(self, *args: object) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
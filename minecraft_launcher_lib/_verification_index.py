@@ -0,0 +1,140 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module contains the verification index. It should not be used outside minecraft_launcher_lib.
+
+The index remembers the sha1 of every file that was verified or downloaded inside a Minecraft directory together with the stat() result of the file.
+As long as size, mtime and inode of a file did not change, the file doesn't need to be hashed again.
+"""
+from ._internal_types.helper_types import VerificationIndexEntry
+from collections import OrderedDict
+import threading
+import json
+import os
+
+INDEX_DIRECTORY_NAME = "minecraft-launcher-lib"
+INDEX_FILE_NAME = "verification_index.json"
+_INDEX_VERSION = 1
+
+# The number of indexes that are kept in memory. The least recently used index is saved and dropped, if there are more.
+_MAX_CACHED_INDEXES = 16
+
+
+class VerificationIndex():
+    """
+    A persistent map of path -> (size, mtime_ns, inode, sha1) for a single Minecraft directory
+    """
+    def __init__(self, minecraft_directory: str | os.PathLike) -> None:
+        self._minecraft_directory = os.path.abspath(minecraft_directory)
+        self._index_path = os.path.join(self._minecraft_directory, INDEX_DIRECTORY_NAME, INDEX_FILE_NAME)
+        self._lock = threading.Lock()
+        self._entries: dict[str, VerificationIndexEntry] | None = None
+        self._dirty = False
+
+    def _get_key(self, path: str | os.PathLike) -> str:
+        "Returns the key of the given path inside the index"
+        return os.path.relpath(os.path.abspath(path), self._minecraft_directory).replace(os.sep, "/")
+
+    def _load(self) -> dict[str, VerificationIndexEntry]:
+        "Loads the index from disk. Must be called with the lock held."
+        if self._entries is not None:
+            return self._entries
+
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == _INDEX_VERSION:
+                self._entries = data["files"]
+            else:
+                self._entries = {}
+        except (OSError, ValueError, KeyError, AttributeError):
+            # A missing or broken index just means that everything is hashed again
+            self._entries = {}
+
+        return self._entries
+
+    def lookup(self, path: str | os.PathLike) -> str | None:
+        """
+        Returns the sha1 of the file, if the file was not changed since it was last indexed.
+        Returns None, if the file needs to be hashed.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._load().get(self._get_key(path))
+
+        if entry is None:
+            return None
+
+        if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns or entry["inode"] != stat.st_ino:
+            return None
+
+        return entry["sha1"]
+
+    def update(self, path: str | os.PathLike, sha1: str) -> None:
+        "Records the sha1 of the file together with its current stat() result"
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        with self._lock:
+            self._load()[self._get_key(path)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "inode": stat.st_ino,
+                "sha1": sha1
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        "Writes the index to disk, if something has changed"
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+
+            os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+
+            # Write into a temporary file first, so a crash never leaves a broken index behind
+            temp_path = f"{self._index_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": _INDEX_VERSION, "files": self._entries}, f, separators=(",", ":"))
+            os.replace(temp_path, self._index_path)
+
+            self._dirty = False
+
+
+_index_cache: OrderedDict[str, VerificationIndex] = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_verification_index(minecraft_directory: str | os.PathLike) -> VerificationIndex:
+    """
+    Returns the verification index of the given Minecraft directory.
+    The same object is returned for the same directory, so it is shared by all installs in the process.
+    Only the most recently used indexes are kept in memory. A index that is dropped is saved first.
+    """
+    key = os.path.abspath(minecraft_directory)
+    evicted: list[VerificationIndex] = []
+    with _index_cache_lock:
+        if key in _index_cache:
+            _index_cache.move_to_end(key)
+        else:
+            _index_cache[key] = VerificationIndex(key)
+            while len(_index_cache) > _MAX_CACHED_INDEXES:
+                evicted.append(_index_cache.popitem(last=False)[1])
+        index = _index_cache[key]
+
+    # Saving writes to disk, so it is done without holding the lock
+    for old_index in evicted:
+        try:
+            old_index.save()
+        except OSError:
+            # The index is only a cache, so the files are just hashed again next time
+            pass
+
+    return index
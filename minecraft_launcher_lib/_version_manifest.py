@@ -0,0 +1,74 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"This module contains the parsed version manifest. It should not be used outside minecraft_launcher_lib"
+from ._internal_types.shared_types import VersionListManifestJson, _VersionListManifestJsonVersion
+from .types import LatestMinecraftVersions, MinecraftVersionInfo
+import datetime
+import json
+
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+
+
+class VersionManifest():
+    """
+    The version manifest with a index of all versions.
+    A instance is shared by all functions through the metadata cache, so it must not be modified.
+    """
+    def __init__(self, data: VersionListManifestJson) -> None:
+        self._data = data
+        self._versions: dict[str, _VersionListManifestJsonVersion] = {i["id"]: i for i in data["versions"]}
+        self._release_times: dict[str, datetime.datetime] = {}
+        self._version_list: list[MinecraftVersionInfo] | None = None
+
+    def __contains__(self, version: object) -> bool:
+        return version in self._versions
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    @property
+    def latest(self) -> LatestMinecraftVersions:
+        "The latest release and snapshot"
+        return {"release": self._data["latest"]["release"], "snapshot": self._data["latest"]["snapshot"]}
+
+    @property
+    def latest_release(self) -> str:
+        "The id of the latest release"
+        return self._data["latest"]["release"]
+
+    @property
+    def latest_snapshot(self) -> str:
+        "The id of the latest snapshot"
+        return self._data["latest"]["snapshot"]
+
+    def get(self, version: str) -> _VersionListManifestJsonVersion | None:
+        "Returns the entry of the given version or None, if it is not in the manifest"
+        return self._versions.get(version)
+
+    def get_release_time(self, version: str) -> datetime.datetime:
+        "Returns the release time of the given version. It is only parsed when it's needed."
+        release_time = self._release_times.get(version)
+        if release_time is None:
+            release_time = datetime.datetime.fromisoformat(self._versions[version]["releaseTime"])
+            self._release_times[version] = release_time
+        return release_time
+
+    def get_ids(self, version_type: str | None = None) -> list[str]:
+        "Returns the ids of all versions in the order of the manifest. If version_type is given, only versions with this type are returned."
+        if version_type is None:
+            return list(self._versions)
+        return [key for key, value in self._versions.items() if value["type"] == version_type]
+
+    def get_version_list(self) -> list[MinecraftVersionInfo]:
+        "Returns the information of all versions. The list is only created once, so the entries must not be modified."
+        if self._version_list is None:
+            self._version_list = [{"id": i["id"], "type": i["type"], "releaseTime": self.get_release_time(i["id"]), "complianceLevel": i["complianceLevel"]} for i in self._data["versions"]]
+        return self._version_list
+
+
+def parse_version_manifest(content: bytes) -> VersionManifest:
+    """
+    Parses the content of the version manifest
+    """
+    return VersionManifest(json.loads(content))
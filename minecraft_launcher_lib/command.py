@@ -2,87 +2,79 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
 "command contains the function for creating the minecraft command"
-from ._helper import parse_rule_list, inherit_json, get_classpath_separator, get_library_path
+from ._argument_template import PASSTHROUGH_PLACEHOLDERS, compile_template, render_template, compile_argument_list, render_argument_list
+from ._launch_plan import LaunchPlan, get_launch_plan, get_classpath, get_argument_file
+from ._class_data_sharing import get_class_data_sharing_arguments
+from ._helper import get_classpath_separator
 from ._internal_types.shared_types import ClientJson, ClientJsonArgumentRule
+from .java_utils import get_jvm_preset_arguments, merge_jvm_arguments
 from .runtime import get_executable_path
 from .exceptions import VersionNotFound
 from .utils import get_library_version
 from .types import MinecraftOptions
-from .natives import get_natives
-import json
+import warnings
 import copy
 import os
 
 __all__ = ["get_minecraft_command"]
 
+_KNOWN_PLACEHOLDERS = frozenset(("natives_directory", "launcher_name", "launcher_version", "classpath", "auth_player_name", "version_name", "game_directory", "assets_root",
+                                 "assets_index_name", "auth_uuid", "auth_access_token", "user_type", "version_type", "user_properties", "resolution_width", "resolution_height",
+                                 "game_assets", "auth_session", "library_directory", "classpath_separator", "quickPlayPath", "quickPlaySingleplayer", "quickPlayMultiplayer", "quickPlayRealms"))
+
 
 def get_libraries(data: ClientJson, path: str) -> str:
     """
     Returns the argument with all libs that come after -cp
     """
-    classpath_seperator = get_classpath_separator()
-    libstr = ""
-    for i in data["libraries"]:
-        if "rules" in i and not parse_rule_list(i["rules"], {}):
-            continue
-
-        libstr += get_library_path(i["name"], path) + classpath_seperator
-        native = get_natives(i)
-        if native != "":
-            if "downloads" in i and "path" in i["downloads"]["classifiers"][native]:  # type: ignore
-                libstr += os.path.join(path, "libraries", i["downloads"]["classifiers"][native]["path"]) + classpath_seperator  # type: ignore
-            else:
-                libstr += get_library_path(i["name"] + "-" + native, path) + classpath_seperator
-
-    if "jar" in data:
-        libstr = libstr + os.path.join(path, "versions", data["jar"], data["jar"] + ".jar")
-    else:
-        libstr = libstr + os.path.join(path, "versions", data["id"], data["id"] + ".jar")
+    return get_classpath(data, path)
 
-    return libstr
+
+def get_argument_variables(versionData: ClientJson, path: str, options: MinecraftOptions, classpath: str) -> dict[str, str]:
+    """
+    Returns the values of all placeholders in arguments
+    """
+    return {
+        "natives_directory": options["nativesDirectory"],
+        "launcher_name": options.get("launcherName", "minecraft-launcher-lib"),
+        "launcher_version": options.get("launcherVersion", get_library_version()),
+        "classpath": classpath,
+        "auth_player_name": options.get("username", "{username}"),
+        "version_name": versionData["id"],
+        "game_directory": options.get("gameDirectory", path),
+        "assets_root": os.path.join(path, "assets"),
+        "assets_index_name": versionData.get("assets", versionData["id"]),
+        "auth_uuid": options.get("uuid", "{uuid}"),
+        "auth_access_token": options.get("token", "{token}"),
+        "user_type": "msa",
+        "version_type": versionData["type"],
+        "user_properties": "{}",
+        "resolution_width": options.get("resolutionWidth", "854"),
+        "resolution_height": options.get("resolutionHeight", "480"),
+        "game_assets": os.path.join(path, "assets", "virtual", "legacy"),
+        "auth_session": options.get("token", "{token}"),
+        "library_directory": os.path.join(path, "libraries"),
+        "classpath_separator": get_classpath_separator(),
+        "quickPlayPath": options.get("quickPlayPath") or "{quickPlayPath}",
+        "quickPlaySingleplayer": options.get("quickPlaySingleplayer") or "{quickPlaySingleplayer}",
+        "quickPlayMultiplayer": options.get("quickPlayMultiplayer") or "{quickPlayMultiplayer}",
+        "quickPlayRealms": options.get("quickPlayRealms") or "{quickPlayRealms}",
+    }
 
 
 def replace_arguments(argstr: str, versionData: ClientJson, path: str, options: MinecraftOptions, classpath: str) -> str:
     """
     Replace all placeholder in arguments with the needed value
     """
-    argstr = argstr.replace("${natives_directory}", options["nativesDirectory"])
-    argstr = argstr.replace("${launcher_name}", options.get("launcherName", "minecraft-launcher-lib"))
-    argstr = argstr.replace("${launcher_version}", options.get("launcherVersion", get_library_version()))
-    argstr = argstr.replace("${classpath}", classpath)
-    argstr = argstr.replace("${auth_player_name}", options.get("username", "{username}"))
-    argstr = argstr.replace("${version_name}", versionData["id"])
-    argstr = argstr.replace("${game_directory}", options.get("gameDirectory", path))
-    argstr = argstr.replace("${assets_root}", os.path.join(path, "assets"))
-    argstr = argstr.replace("${assets_index_name}", versionData.get("assets", versionData["id"]))
-    argstr = argstr.replace("${auth_uuid}", options.get("uuid", "{uuid}"))
-    argstr = argstr.replace("${auth_access_token}", options.get("token", "{token}"))
-    argstr = argstr.replace("${user_type}", "msa")
-    argstr = argstr.replace("${version_type}", versionData["type"])
-    argstr = argstr.replace("${user_properties}", "{}")
-    argstr = argstr.replace("${resolution_width}", options.get("resolutionWidth", "854"))
-    argstr = argstr.replace("${resolution_height}", options.get("resolutionHeight", "480"))
-    argstr = argstr.replace("${game_assets}", os.path.join(path, "assets", "virtual", "legacy"))
-    argstr = argstr.replace("${auth_session}", options.get("token", "{token}"))
-    argstr = argstr.replace("${library_directory}", os.path.join(path, "libraries"))
-    argstr = argstr.replace("${classpath_separator}", get_classpath_separator())
-    argstr = argstr.replace("${quickPlayPath}", options.get("quickPlayPath") or "{quickPlayPath}")
-    argstr = argstr.replace("${quickPlaySingleplayer}", options.get("quickPlaySingleplayer") or "{quickPlaySingleplayer}")
-    argstr = argstr.replace("${quickPlayMultiplayer}", options.get("quickPlayMultiplayer") or "{quickPlayMultiplayer}")
-    argstr = argstr.replace("${quickPlayRealms}", options.get("quickPlayRealms") or "{quickPlayRealms}")
-    return argstr
+    return render_template(compile_template(argstr), get_argument_variables(versionData, path, options, classpath))
 
 
-def get_arguments_string(versionData: ClientJson, path: str, options: MinecraftOptions, classpath: str) -> list[str]:
+def _get_extra_game_arguments(options: MinecraftOptions) -> list[str]:
     """
-    Turns the argument string from the client.json into a list
+    Returns the arguments that older versions don't have in minecraftArguments
     """
     arglist: list[str] = []
 
-    for v in versionData["minecraftArguments"].split(" "):
-        v = replace_arguments(v, versionData, path, options, classpath)
-        arglist.append(v)
-
     # Custom resolution is not in the list
     if options.get("customResolution", False):
         arglist.append("--width")
@@ -96,32 +88,30 @@ def get_arguments_string(versionData: ClientJson, path: str, options: MinecraftO
     return arglist
 
 
+def get_arguments_string(versionData: ClientJson, path: str, options: MinecraftOptions, classpath: str) -> list[str]:
+    """
+    Turns the argument string from the client.json into a list
+    """
+    variables = get_argument_variables(versionData, path, options, classpath)
+    arglist = [render_template(compile_template(v), variables) for v in versionData["minecraftArguments"].split(" ")]
+    return arglist + _get_extra_game_arguments(options)
+
+
 def get_arguments(data: list[str | ClientJsonArgumentRule], versionData: ClientJson, path: str, options: MinecraftOptions, classpath: str) -> list[str]:
     """
     Returns all arguments from the client.json
     """
-    arglist: list[str] = []
-    for i in data:
-        # i could be the argument
-        if isinstance(i, str):
-            arglist.append(replace_arguments(i, versionData, path, options, classpath))
-        else:
-            # Rules might has 2 different names in different client.json
-            if "compatibilityRules" in i and not parse_rule_list(i["compatibilityRules"], options):
-                continue
-
-            if "rules" in i and not parse_rule_list(i["rules"], options):
-                continue
-
-            # Sometimes  i["value"] is the argument
-            if isinstance(i["value"], str):
-                arglist.append(replace_arguments(i["value"], versionData, path, options, classpath))
-            # Sometimes i["value"] is a list of arguments
-            else:
-                for v in i["value"]:
-                    v = replace_arguments(v, versionData, path, options, classpath)
-                    arglist.append(v)
-    return arglist
+    return render_argument_list(compile_argument_list(data), get_argument_variables(versionData, path, options, classpath), options)
+
+
+def _report_unknown_placeholders(plan: LaunchPlan) -> None:
+    """
+    Warns about placeholders in the arguments of the version that minecraft-launcher-lib doesn't know
+    """
+    unknown_placeholders = plan.placeholder_names - _KNOWN_PLACEHOLDERS - PASSTHROUGH_PLACEHOLDERS
+    if len(unknown_placeholders) != 0:
+        names = ", ".join("${" + i + "}" for i in sorted(unknown_placeholders))
+        warnings.warn(f"The arguments of {plan.version} contain unknown placeholders: {names}", stacklevel=3)
 
 
 def get_minecraft_command(version: str, minecraft_directory: str | os.PathLike, options: MinecraftOptions) -> list[str]:
@@ -158,6 +148,10 @@ def get_minecraft_command(version: str, minecraft_directory: str | os.PathLike,
             "quickPlaySingleplayer": None, # The Quick Play Singleplayer
             "quickPlayMultiplayer": None, # The Quick Play Multiplayer
             "quickPlayRealms": None, # The Quick Play Realms
+            "useArgumentFile": False, # Write the JVM arguments into a argument file (needs Java 9 or newer)
+            "jvmPreset": "balanced", # Add JVM arguments that are tuned for this computer ("balanced", "low-latency" or "throughput")
+            "createClassDataArchive": False, # Create a Class Data Sharing archive when Minecraft exits, if there is none (needs Java 13 or newer)
+            "disableClassDataArchive": False, # Don't use the Class Data Sharing archive
         }
 
     Use the :doc:`microsoft_account` module to obtain account-related information.
@@ -188,14 +182,16 @@ def get_minecraft_command(version: str, minecraft_directory: str | os.PathLike,
 
     options = copy.deepcopy(options)
 
-    with open(os.path.join(path, "versions", version, version + ".json"), "r", encoding="utf-8") as f:
-        data: ClientJson = json.load(f)
-
-    if "inheritsFrom" in data:
-        data = inherit_json(data, path)
+    # The version json is only read again, if it has been changed
+    plan = get_launch_plan(version, path)
+    data = plan.data
 
     options["nativesDirectory"] = options.get("nativesDirectory", os.path.join(path, "versions", data["id"], "natives"))
-    classpath = get_libraries(data, path)
+    classpath = plan.classpath
+
+    # All placeholders are replaced in a single pass using this values
+    variables = get_argument_variables(data, path, options, classpath)
+    _report_unknown_placeholders(plan)
 
     command: list[str] = []
     # Add Java executable
@@ -210,17 +206,20 @@ def get_minecraft_command(version: str, minecraft_directory: str | os.PathLike,
     else:
         command.append(options.get("defaultExecutablePath", "java"))
 
-    if "jvmArguments" in options:
+    if "jvmPreset" in options:
+        # Old versions don't have javaVersion and run on Java 8
+        java_major_version = data["javaVersion"]["majorVersion"] if "javaVersion" in data else 8
+        command = command + merge_jvm_arguments(get_jvm_preset_arguments(options["jvmPreset"], java_major_version), options.get("jvmArguments", []))
+    elif "jvmArguments" in options:
         command = command + options["jvmArguments"]
 
+    # A Class Data Sharing archive of the classes that have been loaded during a earlier launch speeds up the startup
+    if not options.get("disableClassDataArchive", False):
+        command = command + get_class_data_sharing_arguments(plan, command[0], options.get("createClassDataArchive", False))
+
     # Newer Versions have jvmArguments in client.json
-    if isinstance(data.get("arguments", None), dict):
-        if "jvm" in data["arguments"]:
-            command = command + get_arguments(data["arguments"]["jvm"], data, path, options, classpath)
-        else:
-            command.append("-Djava.library.path=" + options["nativesDirectory"])
-            command.append("-cp")
-            command.append(classpath)
+    if plan.jvm_arguments is not None:
+        command = command + render_argument_list(plan.jvm_arguments, variables, options)
     else:
         command.append("-Djava.library.path=" + options["nativesDirectory"])
         command.append("-cp")
@@ -233,13 +232,17 @@ def get_minecraft_command(version: str, minecraft_directory: str | os.PathLike,
                 logger_file = os.path.join(path, "assets", "log_configs", data["logging"]["client"]["file"]["id"])
                 command.append(data["logging"]["client"]["argument"].replace("${path}", logger_file))
 
+    # Long classpaths make the command very long, so the JVM arguments can be moved into a file
+    if options.get("useArgumentFile", False):
+        command = [command[0], "@" + get_argument_file(plan, command[1:])]
+
     command.append(data["mainClass"])
 
-    if "minecraftArguments" in data:
+    if plan.game_arguments_string is not None:
         # For older versions
-        command = command + get_arguments_string(data, path, options, classpath)
+        command = command + [render_template(i, variables) for i in plan.game_arguments_string] + _get_extra_game_arguments(options)
     else:
-        command = command + get_arguments(data["arguments"]["game"], data, path, options, classpath)
+        command = command + render_argument_list(plan.game_arguments, variables, options)
 
     if "server" in options:
         command.append("--server")
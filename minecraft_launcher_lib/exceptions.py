@@ -133,6 +133,20 @@ class PlatformNotSupported(Exception):
         super().__init__("Your Platform is not supported")
 
 
+class NotAvailableOffline(Exception):
+    """
+    Raised when offline mode is enabled and something is needed that is neither in the metadata cache nor in the Minecraft directory.
+    See :func:`~minecraft_launcher_lib.network.set_offline_mode`.
+
+    .. versionadded:: 8.1
+    """
+    def __init__(self, url: str) -> None:
+        self.url: str = url
+        "The URL that would be needed"
+
+        super().__init__(f"{url} is not available in offline mode")
+
+
 class AccountNotOwnMinecraft(Exception):
     """
     Raised by :func:`~minecraft_launcher_lib.microsoft_account.complete_login` and :func:`~minecraft_launcher_lib.microsoft_account.complete_login` when the Account does not own Minecraft
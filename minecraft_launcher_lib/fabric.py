@@ -8,7 +8,7 @@
 
 fabric contains functions for dealing with the `Fabric modloader <https://fabricmc.net/>`_.
 """
-from ._helper import download_file, get_requests_response_cache, parse_maven_metadata, empty
+from ._helper import download_file, get_cached_json, parse_maven_metadata, empty
 from .exceptions import VersionNotFound, UnsupportedVersion, ExternalProgramError
 from .types import FabricMinecraftVersion, FabricLoader, CallbackDict
 from .install import install_minecraft_version
@@ -16,6 +16,7 @@ from .utils import is_version_valid
 import subprocess
 import tempfile
 import warnings
+import copy
 import os
 
 
@@ -32,7 +33,7 @@ def get_all_minecraft_versions() -> list[FabricMinecraftVersion]:
     """
     warnings.warn("This module is deprecated and has been replaced by mod_loader", DeprecationWarning)
     FABRIC_MINECARFT_VERSIONS_URL = "https://meta.fabricmc.net/v2/versions/game"
-    return get_requests_response_cache(FABRIC_MINECARFT_VERSIONS_URL).json()
+    return copy.deepcopy(get_cached_json(FABRIC_MINECARFT_VERSIONS_URL))
 
 
 def get_stable_minecraft_versions() -> list[str]:
@@ -122,7 +123,7 @@ def get_all_loader_versions() -> list[FabricLoader]:
     """
     warnings.warn("This module is deprecated and has been replaced by mod_loader", DeprecationWarning)
     FABRIC_LOADER_VERSIONS_URL = "https://meta.fabricmc.net/v2/versions/loader"
-    return get_requests_response_cache(FABRIC_LOADER_VERSIONS_URL).json()
+    return copy.deepcopy(get_cached_json(FABRIC_LOADER_VERSIONS_URL))
 
 
 def get_latest_loader_version() -> str:
@@ -193,7 +193,7 @@ def list_forge_versions() -> list[str]:
     warnings.warn("This module is deprecated and has been replaced by mod_loader", DeprecationWarning)
 
     MAVEN_METADATA_URL = "https://maven.minecraftforge.net/net/minecraftforge/forge/maven-metadata.xml"
-    return parse_maven_metadata(MAVEN_METADATA_URL)["versions"]
+    return parse_maven_metadata(MAVEN_METADATA_URL)["versions"].copy()
 
 
 def find_forge_version(vanilla_version: str) -> str | None:
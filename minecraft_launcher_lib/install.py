@@ -2,40 +2,37 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
 "install allows you to install minecraft."
-from ._helper import download_file, parse_rule_list, inherit_json, empty, get_user_agent, check_path_inside_minecraft_directory
+from ._helper import parse_rule_list, inherit_json, merge_inherited_json, empty, get_version_manifest, check_path_inside_minecraft_directory, load_metadata_file, get_sha1_hash
+from .runtime import _get_jvm_runtime_jobs, _finish_jvm_runtime_install
+from ._internal_types.install_types import AssetsJson, DownloadJob, VersionInstallPlan
+from ._download_scheduler import run_download_jobs, run_download_jobs_async
 from ._internal_types.shared_types import ClientJson, ClientJsonLibrary
-from .natives import extract_natives_file, get_natives
-from ._internal_types.install_types import AssetsJson
-from concurrent.futures import ThreadPoolExecutor
-from .runtime import install_jvm_runtime
+from ._verification_index import get_verification_index
 from .exceptions import VersionNotFound
-from .types import CallbackDict
-import requests
+from .natives import get_natives
+from .types import CallbackDict, InstallPlan, InstallPlanFile
+import asyncio
 import shutil
 import json
+import copy
 import os
 
-__all__ = ["install_minecraft_version"]
+__all__ = ["install_minecraft_version", "install_minecraft_version_async", "install_minecraft_versions", "install_minecraft_versions_async", "get_install_plan", "install_from_plan", "save_install_plan", "load_install_plan"]
 
+_INSTALL_PLAN_FORMAT_VERSION = 1
 
-def install_libraries(
-        id: str,
-        libraries: list[ClientJsonLibrary],
-        path: str, callback: CallbackDict,
-        max_workers: int | None = None,) -> None:
+
+def _get_library_jobs(id: str, libraries: list[ClientJsonLibrary], path: str) -> list[DownloadJob]:
     """
-    Install all libraries
+    Returns the jobs to download all libraries
     """
-    session = requests.session()
-    callback.get("setStatus", empty)("Download Libraries")
-    callback.get("setMax", empty)(len(libraries) - 1)
+    job_list: list[DownloadJob] = []
+    natives_path = os.path.join(path, "versions", id, "natives")
 
-    def download_library(
-            i: ClientJsonLibrary,) -> None:
-        """Download the single library."""
+    for i in libraries:
         # Check, if the rules allow this lib for the current system
         if "rules" in i and not parse_rule_list(i["rules"], {}):
-            return
+            continue
 
         # Turn the name into a path
         current_path = os.path.join(path, "libraries")
@@ -50,7 +47,7 @@ def install_libraries(
         try:
             lib_path, name, version = i["name"].split(":")[0:3]
         except ValueError:
-            return
+            continue
 
         for lib_part in lib_path.split("."):
             current_path = os.path.join(current_path, lib_part)
@@ -61,7 +58,6 @@ def install_libraries(
         except ValueError:
             fileend = "jar"
 
-        jar_filename = f"{name}-{version}.{fileend}"
         download_url = f"{download_url}/{name}/{version}"
         current_path = os.path.join(current_path, name, version)
         native = get_natives(i)
@@ -70,34 +66,103 @@ def install_libraries(
         if native != "":
             jar_filename_native = f"{name}-{version}-{native}.jar"
         jar_filename = f"{name}-{version}.{fileend}"
-        download_url = f"{download_url}/{jar_filename}"
 
-        # Try to download the lib
-        try:
-            download_file(download_url, os.path.join(current_path, jar_filename), callback=callback, session=session, minecraft_directory=path)
-        except Exception:
-            pass
+        artifact_path: str | None = None
+        if "downloads" in i and "artifact" in i["downloads"] and i["downloads"]["artifact"]["url"] != "" and "path" in i["downloads"]["artifact"]:
+            artifact_path = os.path.join(path, "libraries", i["downloads"]["artifact"]["path"])
+
+        # Try to download the lib from the maven repo. This may fail, so errors are ignored.
+        # If the client.json gives us a artifact for the same file, we don't need to do that.
+        if artifact_path is None or os.path.abspath(artifact_path) != os.path.abspath(os.path.join(current_path, jar_filename)):
+            job_list.append({
+                "phase": "libraries",
+                "url": f"{download_url}/{jar_filename}",
+                "path": os.path.join(current_path, jar_filename),
+                "sha1": None,
+                "ignoreErrors": True
+            })
 
         if "downloads" not in i:
-            if "extract" in i:
-                extract_natives_file(os.path.join(current_path, jar_filename_native), os.path.join(path, "versions", id, "natives"), i["extract"])
-            return
-
-        if "artifact" in i["downloads"] and i["downloads"]["artifact"]["url"] != "" and "path" in i["downloads"]["artifact"]:
-            download_file(i["downloads"]["artifact"]["url"], os.path.join(path, "libraries", i["downloads"]["artifact"]["path"]), callback, sha1=i["downloads"]["artifact"]["sha1"], session=session, minecraft_directory=path)
+            if "extract" in i and native != "":
+                job_list.append({
+                    "phase": "libraries",
+                    "url": f"{download_url}/{jar_filename_native}",
+                    "path": os.path.join(current_path, jar_filename_native),
+                    "sha1": None,
+                    "ignoreErrors": True,
+                    "extract": {"file": os.path.join(current_path, jar_filename_native), "directory": natives_path, "exclude": i["extract"]["exclude"]}
+                })
+            continue
+
+        if artifact_path is not None:
+            job_list.append({
+                "phase": "libraries",
+                "url": i["downloads"]["artifact"]["url"],
+                "path": artifact_path,
+                "sha1": i["downloads"]["artifact"]["sha1"],
+                "size": i["downloads"]["artifact"].get("size", 0)
+            })
         if native != "":
-            download_file(i["downloads"]["classifiers"][native]["url"], os.path.join(current_path, jar_filename_native), callback, sha1=i["downloads"]["classifiers"][native]["sha1"], session=session, minecraft_directory=path)  # type: ignore
-            extract_natives_file(os.path.join(current_path, jar_filename_native), os.path.join(path, "versions", id, "natives"), i.get("extract", {"exclude": []}))  # type: ignore[arg-type] # mypy bug 20138
+            job_list.append({
+                "phase": "libraries",
+                "url": i["downloads"]["classifiers"][native]["url"],  # type: ignore
+                "path": os.path.join(current_path, jar_filename_native),
+                "sha1": i["downloads"]["classifiers"][native]["sha1"],  # type: ignore
+                "size": i["downloads"]["classifiers"][native].get("size", 0),  # type: ignore
+                "extract": {"file": os.path.join(current_path, jar_filename_native), "directory": natives_path, "exclude": i.get("extract", {"exclude": []})["exclude"]}  # type: ignore[arg-type] # mypy bug 20138
+            })
+
+    return job_list
+
+
+def install_libraries(
+        id: str,
+        libraries: list[ClientJsonLibrary],
+        path: str, callback: CallbackDict,
+        max_workers: int | None = None,) -> None:
+    """
+    Install all libraries
+    """
+    callback.get("setStatus", empty)("Download Libraries")
+    run_download_jobs(_get_library_jobs(id, libraries, path), path, callback, max_workers=max_workers)
+    get_verification_index(path).save()
+
+
+def _get_asset_jobs(data: ClientJson, path: str, callback: CallbackDict, dry_run: bool = False) -> list[DownloadJob]:
+    """
+    Loads the asset index and returns the jobs to download the asset index and all assets.
+    If dry_run is True, the asset index is not written to disk.
+    """
+    # Old versions don't have this
+    if "assetIndex" not in data:
+        return []
 
-    count = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit task for every library
-        futures = [executor.submit(download_library, i) for i in libraries]
-        for future in futures:
-            # Wait until the task is completed
-            future.result()
-            count += 1
-            callback.get("setProgress", empty)(count)
+    index_path = os.path.join(path, "assets", "indexes", data["assets"] + ".json")
+    index_content = load_metadata_file(data["assetIndex"]["url"], index_path, path, callback, sha1=data["assetIndex"]["sha1"], write=not dry_run)[0]
+    assets_data: AssetsJson = json.loads(index_content)
+
+    # The assets has a hash. e.g. c4dbabc820f04ba685694c63359429b22e3a62b5
+    # With this hash, it can be download from https://resources.download.minecraft.net/c4/c4dbabc820f04ba685694c63359429b22e3a62b5
+    # And saved at assets/objects/c4/c4dbabc820f04ba685694c63359429b22e3a62b5
+    asset_sizes = {val["hash"]: val["size"] for val in assets_data["objects"].values()}
+
+    job_list: list[DownloadJob] = [{
+        "phase": "assets",
+        "url": data["assetIndex"]["url"],
+        "path": index_path,
+        "sha1": data["assetIndex"]["sha1"],
+        "size": len(index_content)
+    }]
+    for filehash, size in asset_sizes.items():
+        job_list.append({
+            "phase": "assets",
+            "url": "https://resources.download.minecraft.net/" + filehash[:2] + "/" + filehash,
+            "path": os.path.join(path, "assets", "objects", filehash[:2], filehash),
+            "sha1": filehash,
+            "size": size
+        })
+
+    return job_list
 
 
 def install_assets(
@@ -113,83 +178,179 @@ def install_assets(
         return
 
     callback.get("setStatus", empty)("Download Assets")
-    session = requests.session()
+    run_download_jobs(_get_asset_jobs(data, path, callback), path, callback, max_workers=max_workers)
+    get_verification_index(path).save()
 
-    # Download all assets
-    download_file(data["assetIndex"]["url"], os.path.join(path, "assets", "indexes", data["assets"] + ".json"), callback, sha1=data["assetIndex"]["sha1"], session=session)
-    with open(os.path.join(path, "assets", "indexes", data["assets"] + ".json")) as f:
-        assets_data: AssetsJson = json.load(f)
-
-    # The assets has a hash. e.g. c4dbabc820f04ba685694c63359429b22e3a62b5
-    # With this hash, it can be download from https://resources.download.minecraft.net/c4/c4dbabc820f04ba685694c63359429b22e3a62b5
-    # And saved at assets/objects/c4/c4dbabc820f04ba685694c63359429b22e3a62b5
-    assets = set(val["hash"] for val in assets_data["objects"].values())
-    callback.get("setMax", empty)(len(assets) - 1)
-    count = 0
 
-    def download_asset(filehash: str) -> None:
-        """Download the single asset file."""
-        download_file("https://resources.download.minecraft.net/" + filehash[:2] + "/" + filehash, os.path.join(path, "assets", "objects", filehash[:2], filehash), callback, sha1=filehash, session=session, minecraft_directory=path)
-
-    # Use a ThreadPoolExecutor to download assets concurrently
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit task for every library
-        futures = [executor.submit(download_asset, filehash) for filehash in assets]
-        for future in futures:
-            # Wait until the task is completed
-            future.result()
-            count += 1
-            callback.get("setProgress", empty)(count)
-
-
-def do_version_install(versionid: str, path: str, callback: CallbackDict, url: str | None = None, sha1: str | None = None) -> None:
+def _add_version_to_plan(versionid: str, path: str, callback: CallbackDict, plan: VersionInstallPlan, url: str | None = None, sha1: str | None = None) -> None:
     """
-    Installs the given version
+    Loads the metadata of the given version and adds all files that are needed to the plan
     """
+    job_list: list[DownloadJob] = []
+
     # Download and read versions.json
+    version_path = os.path.join(path, "versions", versionid, versionid + ".json")
     if url:
-        download_file(url, os.path.join(path, "versions", versionid, versionid + ".json"), callback, sha1=sha1, minecraft_directory=path)
+        version_content = load_metadata_file(url, version_path, path, callback, sha1=sha1, write=not plan["dryRun"])[0]
+        versiondata: ClientJson = json.loads(version_content)
+        job_list.append({"url": url, "path": version_path, "sha1": sha1, "size": len(version_content), "phase": "client"})
+    else:
+        with open(version_path, "r", encoding="utf-8") as f:
+            versiondata = json.load(f)
 
-    with open(os.path.join(path, "versions", versionid, versionid + ".json"), "r", encoding="utf-8") as f:
-        versiondata: ClientJson = json.load(f)
+    # Keep a unchanged copy, so versions that inherit from this version don't need to read it from disk
+    plan["versionData"][versionid] = copy.deepcopy(versiondata)
 
     # For Forge
     if "inheritsFrom" in versiondata:
+        inherits_from = versiondata["inheritsFrom"]
         try:
-            install_minecraft_version(versiondata["inheritsFrom"], path, callback=callback)
+            _add_minecraft_version_to_plan(inherits_from, path, callback, plan)
         except VersionNotFound:
             pass
-        versiondata = inherit_json(versiondata, path)
 
-    install_libraries(versiondata["id"], versiondata["libraries"], path, callback)
-    install_assets(versiondata, path, callback)
+        if inherits_from in plan["versionData"]:
+            versiondata = merge_inherited_json(versiondata, copy.deepcopy(plan["versionData"][inherits_from]))
+        else:
+            versiondata = inherit_json(versiondata, path)
+
+        plan["inheritsFrom"][versiondata["id"]] = inherits_from
+
+    job_list += _get_library_jobs(versiondata["id"], versiondata["libraries"], path)
+
+    # Many versions share the same asset index, which only needs to be processed once
+    if "assetIndex" in versiondata and versiondata["assets"] not in plan["assetIndexes"]:
+        plan["assetIndexes"].append(versiondata["assets"])
+        job_list += _get_asset_jobs(versiondata, path, callback, dry_run=plan["dryRun"])
 
     # Download logging config
     if "logging" in versiondata:
         if len(versiondata["logging"]) != 0:
-            logger_file = os.path.join(path, "assets", "log_configs", versiondata["logging"]["client"]["file"]["id"])
-            download_file(versiondata["logging"]["client"]["file"]["url"], logger_file, callback, sha1=versiondata["logging"]["client"]["file"]["sha1"], minecraft_directory=path)
+            job_list.append({
+                "phase": "client",
+                "url": versiondata["logging"]["client"]["file"]["url"],
+                "path": os.path.join(path, "assets", "log_configs", versiondata["logging"]["client"]["file"]["id"]),
+                "sha1": versiondata["logging"]["client"]["file"]["sha1"],
+                "size": versiondata["logging"]["client"]["file"]["size"]
+            })
 
     # Download minecraft.jar
     if "downloads" in versiondata:
-        download_file(versiondata["downloads"]["client"]["url"], os.path.join(path, "versions", versiondata["id"], versiondata["id"] + ".jar"), callback, sha1=versiondata["downloads"]["client"]["sha1"], minecraft_directory=path)
+        job_list.append({
+            "phase": "client",
+            "url": versiondata["downloads"]["client"]["url"],
+            "path": os.path.join(path, "versions", versiondata["id"], versiondata["id"] + ".jar"),
+            "sha1": versiondata["downloads"]["client"]["sha1"],
+            "size": versiondata["downloads"]["client"]["size"]
+        })
+
+    # Install java runtime if needed
+    if "javaVersion" in versiondata and not any(i["jvmVersion"] == versiondata["javaVersion"]["component"] for i in plan["runtimes"]):
+        runtime_jobs = _get_jvm_runtime_jobs(versiondata["javaVersion"]["component"], path)
+        if runtime_jobs is not None:
+            job_list += runtime_jobs[0]
+            plan["runtimes"].append(runtime_jobs[1])
+
+    # A inherited version shares many files with its parent, but every file must only be downloaded once
+    known_jobs = {os.path.abspath(i["path"]): i for i in plan["jobs"]}
+    for job in job_list:
+        known_job = known_jobs.get(os.path.abspath(job["path"]))
+        if known_job is None:
+            known_jobs[os.path.abspath(job["path"])] = job
+            plan["jobs"].append(job)
+        elif job.get("sha1") is not None:
+            if known_job.get("sha1") is None:
+                known_job["sha1"] = job["sha1"]
+            elif known_job["sha1"] != job["sha1"]:
+                raise ValueError(f"{job['path']} is needed with the sha1 {known_job['sha1']} and {job['sha1']}")
+
+
+def _add_minecraft_version_to_plan(version: str, minecraft_directory: str, callback: CallbackDict, plan: VersionInstallPlan) -> None:
+    """
+    Looks up the given version locally and in the version manifest and adds it to the plan
+    """
+    # The version is already part of the plan
+    if version in plan["versionData"]:
+        return
+
+    if os.path.isfile(os.path.join(minecraft_directory, "versions", version, f"{version}.json")):
+        _add_version_to_plan(version, minecraft_directory, callback, plan)
+        return
+
+    # The manifest is only looked up once per plan
+    version_manifest = plan["versionManifest"]
+    if version_manifest is None:
+        version_manifest = get_version_manifest()
+        plan["versionManifest"] = version_manifest
+
+    version_info = version_manifest.get(version)
+    if version_info is None:
+        raise VersionNotFound(version)
+
+    _add_version_to_plan(version, minecraft_directory, callback, plan, url=version_info["url"], sha1=version_info["sha1"])
+
 
+def _create_version_install_plan(dry_run: bool) -> VersionInstallPlan:
+    """
+    Returns a empty plan
+    """
+    return {"jobs": [], "runtimes": [], "inheritsFrom": {}, "dryRun": dry_run, "versionData": {}, "versionManifest": None, "assetIndexes": []}
+
+
+def _get_version_install_plan(versions: str | list[str], minecraft_directory: str, callback: CallbackDict, dry_run: bool = False) -> VersionInstallPlan:
+    """
+    Returns everything that needs to be done to install the given versions.
+    Files that are needed by multiple versions are only once in the plan.
+    If dry_run is True, the metadata files are not written to disk.
+    """
+    if isinstance(versions, str):
+        versions = [versions]
+
+    plan = _create_version_install_plan(dry_run)
+    for version in versions:
+        _add_minecraft_version_to_plan(version, minecraft_directory, callback, plan)
+    return plan
+
+
+def _finish_version_install(plan: VersionInstallPlan, path: str) -> None:
+    """
+    Runs everything that needs to be done after all files of the plan are downloaded
+    """
     # Need to copy jar for old forge versions
-    if not os.path.isfile(os.path.join(path, "versions", versiondata["id"], versiondata["id"] + ".jar")) and "inheritsFrom" in versiondata:
-        inherits_from = versiondata["inheritsFrom"]
-        inherit_path = os.path.join(path, "versions", inherits_from, f"{inherits_from}.jar")
-        check_path_inside_minecraft_directory(path, inherit_path)
-        shutil.copyfile(os.path.join(path, "versions", versiondata["id"], versiondata["id"] + ".jar"), inherit_path)
+    for versionid, inherits_from in plan["inheritsFrom"].items():
+        if not os.path.isfile(os.path.join(path, "versions", versionid, versionid + ".jar")):
+            inherit_path = os.path.join(path, "versions", inherits_from, f"{inherits_from}.jar")
+            check_path_inside_minecraft_directory(path, inherit_path)
+            shutil.copyfile(os.path.join(path, "versions", versionid, versionid + ".jar"), inherit_path)
+
+    for runtime_info in plan["runtimes"]:
+        _finish_jvm_runtime_install(runtime_info, path)
+
+    get_verification_index(path).save()
 
-    # Install java runtime if needed
-    if "javaVersion" in versiondata:
-        callback.get("setStatus", empty)("Install java runtime")
-        install_jvm_runtime(versiondata["javaVersion"]["component"], path, callback=callback)
+
+def _run_version_install_plan(plan: VersionInstallPlan, path: str, callback: CallbackDict, max_workers: int | None = None) -> None:
+    """
+    Downloads all files of the plan in a single scheduler run and finishes the installation
+    """
+    callback.get("setStatus", empty)("Download files")
+    run_download_jobs(plan["jobs"], path, callback, max_workers=max_workers)
+
+    _finish_version_install(plan, path)
 
     callback.get("setStatus", empty)("Installation complete")
 
 
-def install_minecraft_version(version: str, minecraft_directory: str | os.PathLike, callback: CallbackDict | None = None) -> None:
+def do_version_install(versionid: str, path: str, callback: CallbackDict, url: str | None = None, sha1: str | None = None, max_workers: int | None = None) -> None:
+    """
+    Installs the given version
+    """
+    plan = _create_version_install_plan(False)
+    _add_version_to_plan(versionid, path, callback, plan, url=url, sha1=sha1)
+    _run_version_install_plan(plan, path, callback, max_workers=max_workers)
+
+
+def install_minecraft_version(version: str, minecraft_directory: str | os.PathLike, callback: CallbackDict | None = None, max_workers: int | None = None) -> None:
     """
     Installs a Minecraft version to the specified path.
     It also verifies and repairs an existing installation, so call it before launching.
@@ -203,6 +364,8 @@ def install_minecraft_version(version: str, minecraft_directory: str | os.PathLi
             "setStatus": some_function, # This function is called to set a text
             "setProgress" some_function, # This function is called to set the progress.
             "setMax": some_function, # This function is called to set to max progress.
+            "progressEvent": some_function, # This function is called with the downloaded bytes, the rate and the ETA.
+            "progressEventInterval": 0.1, # The minimum time between two progress events in seconds.
         }
 
     For more details, check the :doc:`corresponding tutorial </tutorial/get_installation_progress>`.
@@ -217,19 +380,354 @@ def install_minecraft_version(version: str, minecraft_directory: str | os.PathLi
     :param version: The Minecraft version
     :param minecraft_directory: The path to your Minecraft directory
     :param callback: Some functions that are called to monitor the progress
+    :param max_workers: The number of files that are downloaded at the same time. If None, max_workers will be set automatically.
     :raises VersionNotFound: The Minecraft version was not found
+    :raises ValueError: The same file is needed with different checksums
     :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
     """
     if isinstance(minecraft_directory, os.PathLike):
         minecraft_directory = str(minecraft_directory)
     if callback is None:
         callback = {}
-    if os.path.isfile(os.path.join(minecraft_directory, "versions", version, f"{version}.json")):
-        do_version_install(version, minecraft_directory, callback)
-        return
-    version_list = requests.get("https://launchermeta.mojang.com/mc/game/version_manifest_v2.json", headers={"user-agent": get_user_agent()}).json()
-    for i in version_list["versions"]:
-        if i["id"] == version:
-            do_version_install(version, minecraft_directory, callback, url=i["url"], sha1=i["sha1"])
-            return
-    raise VersionNotFound(version)
+
+    # All files of all parts (libraries, assets, client, java runtime) are downloaded together
+    plan = _get_version_install_plan(version, minecraft_directory, callback)
+    _run_version_install_plan(plan, minecraft_directory, callback, max_workers=max_workers)
+
+
+async def install_minecraft_version_async(version: str, minecraft_directory: str | os.PathLike, callback: CallbackDict | None = None, max_concurrency: int | None = None) -> None:
+    """
+    The asyncio version of :func:`install_minecraft_version`.
+
+    It first resolves all metadata of the version (including inherited versions, the asset index and the java runtime).
+    After that all files of all parts of the installation are downloaded together with a bounded number of concurrent downloads.
+    The event loop is not blocked, but the downloads themselves use requests and run in a pool of max_concurrency worker threads.
+    Only downloads that wait for a free worker are coroutines.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        asyncio.run(minecraft_launcher_lib.install.install_minecraft_version_async("1.21", minecraft_directory))
+
+    :param version: The Minecraft version
+    :param minecraft_directory: The path to your Minecraft directory
+    :param callback: Some functions that are called to monitor the progress. The same as for :func:`install_minecraft_version`.
+    :param max_concurrency: The maximal number of downloads that run at the same time. Every running download uses a worker thread. If None, it will be set automatically.
+    :raises VersionNotFound: The Minecraft version was not found
+    :raises ValueError: The same file is needed with different checksums
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+
+    .. versionadded:: 8.1
+    """
+    minecraft_directory = str(minecraft_directory)
+    if callback is None:
+        callback = {}
+
+    plan = await asyncio.to_thread(_get_version_install_plan, version, minecraft_directory, callback)
+
+    callback.get("setStatus", empty)("Download files")
+    await run_download_jobs_async(plan["jobs"], minecraft_directory, callback, max_concurrency=max_concurrency)
+
+    await asyncio.to_thread(_finish_version_install, plan, minecraft_directory)
+
+    callback.get("setStatus", empty)("Installation complete")
+
+
+def install_minecraft_versions(versions: list[str], minecraft_directory: str | os.PathLike, callback: CallbackDict | None = None, max_workers: int | None = None) -> None:
+    """
+    Installs multiple Minecraft versions at once.
+    This is faster than calling :func:`install_minecraft_version` for every version:
+    The version manifest is only downloaded once, a asset index that is used by multiple versions is only processed once
+    and files that are needed by multiple versions (e.g. libraries) are only checked once.
+    All files of all versions are downloaded together.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        minecraft_launcher_lib.install.install_minecraft_versions(["1.20.6", "1.21", "1.21.1"], minecraft_directory)
+
+    :param versions: The Minecraft versions
+    :param minecraft_directory: The path to your Minecraft directory
+    :param callback: The same dict as for :func:`install_minecraft_version`
+    :param max_workers: The number of files that are downloaded at the same time. If None, max_workers will be set automatically.
+    :raises VersionNotFound: A Minecraft version was not found
+    :raises ValueError: The same file is needed by the versions with different checksums
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+
+    .. versionadded:: 8.1
+    """
+    minecraft_directory = str(minecraft_directory)
+    if callback is None:
+        callback = {}
+
+    plan = _get_version_install_plan(versions, minecraft_directory, callback)
+    _run_version_install_plan(plan, minecraft_directory, callback, max_workers=max_workers)
+
+
+async def install_minecraft_versions_async(versions: list[str], minecraft_directory: str | os.PathLike, callback: CallbackDict | None = None, max_concurrency: int | None = None) -> None:
+    """
+    The asyncio version of :func:`install_minecraft_versions`
+
+    Example:
+
+    .. code:: python
+
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        asyncio.run(minecraft_launcher_lib.install.install_minecraft_versions_async(["1.20.6", "1.21", "1.21.1"], minecraft_directory))
+
+    :param versions: The Minecraft versions
+    :param minecraft_directory: The path to your Minecraft directory
+    :param callback: The same dict as for :func:`install_minecraft_version`
+    :param max_concurrency: The maximal number of downloads that run at the same time. Every running download uses a worker thread. If None, it will be set automatically.
+    :raises VersionNotFound: A Minecraft version was not found
+    :raises ValueError: The same file is needed by the versions with different checksums
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+
+    .. versionadded:: 8.1
+    """
+    minecraft_directory = str(minecraft_directory)
+    if callback is None:
+        callback = {}
+
+    plan = await asyncio.to_thread(_get_version_install_plan, versions, minecraft_directory, callback)
+
+    callback.get("setStatus", empty)("Download files")
+    await run_download_jobs_async(plan["jobs"], minecraft_directory, callback, max_concurrency=max_concurrency)
+
+    await asyncio.to_thread(_finish_version_install, plan, minecraft_directory)
+
+    callback.get("setStatus", empty)("Installation complete")
+
+
+def _is_job_satisfied(job: DownloadJob, minecraft_directory: str) -> bool:
+    """
+    Checks if the file of the job already exists with the correct checksum
+    """
+    if not os.path.isfile(job["path"]):
+        return False
+
+    sha1 = job.get("sha1")
+    if sha1 is None:
+        # download_file() doesn't replace files without a known checksum
+        return True
+
+    index = get_verification_index(minecraft_directory)
+    current_sha1 = index.lookup(job["path"])
+    if current_sha1 is None:
+        current_sha1 = get_sha1_hash(job["path"])
+        index.update(job["path"], current_sha1)
+
+    return current_sha1 == sha1
+
+
+def _get_relative_plan_path(path: str, minecraft_directory: str) -> str:
+    """
+    Returns the path relative to the Minecraft directory with / as separator
+    """
+    return os.path.relpath(path, minecraft_directory).replace(os.sep, "/")
+
+
+def _get_absolute_plan_path(path: str, minecraft_directory: str) -> str:
+    """
+    Returns the absolute path of a path from a install plan and checks if it is inside the Minecraft directory
+    """
+    absolute_path = os.path.join(minecraft_directory, *path.split("/"))
+    check_path_inside_minecraft_directory(minecraft_directory, absolute_path)
+    return absolute_path
+
+
+def get_install_plan(version: str, minecraft_directory: str | os.PathLike) -> InstallPlan:
+    """
+    Returns everything that :func:`install_minecraft_version` would download, without downloading or writing anything.
+    The version json (including inherited versions), the libraries, the natives, the asset index, the assets, the logging config, the client jar and the java runtime are resolved.
+    The plan contains the URL, the destination (relative to the Minecraft directory), the size and the sha1 of every file and if the file already exists with the correct checksum.
+
+    The plan only contains JSON types, so it can be saved as lockfile with :func:`save_install_plan` and installed later or on another computer with :func:`install_from_plan`.
+    Versions that only exist in the given Minecraft directory (e.g. a Forge version) must also exist in the Minecraft directory the plan is installed into.
+    The java runtime depends on the platform, so a plan should only be used on the same platform.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        plan = minecraft_launcher_lib.install.get_install_plan("1.21", minecraft_directory)
+        print(f"{plan['downloadSize']} of {plan['totalSize']} bytes need to be downloaded")
+        minecraft_launcher_lib.install.save_install_plan(plan, "1.21.lock")
+
+    :param version: The Minecraft version
+    :param minecraft_directory: The path to your Minecraft directory
+    :raises VersionNotFound: The Minecraft version was not found
+    :raises ValueError: The same file is needed with different checksums
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+    :return: The install plan
+
+    .. versionadded:: 8.1
+    """
+    minecraft_directory = str(minecraft_directory)
+
+    internal_plan = _get_version_install_plan(version, minecraft_directory, {}, dry_run=True)
+
+    install_plan: InstallPlan = {
+        "formatVersion": _INSTALL_PLAN_FORMAT_VERSION,
+        "version": version,
+        "files": [],
+        "runtimes": [],
+        "inheritsFrom": internal_plan["inheritsFrom"],
+        "totalSize": 0,
+        "downloadSize": 0
+    }
+
+    for job in internal_plan["jobs"]:
+        plan_file: InstallPlanFile = {
+            "url": job["url"],
+            "path": _get_relative_plan_path(job["path"], minecraft_directory),
+            "sha1": job.get("sha1"),
+            "size": job.get("size", 0),
+            "satisfied": _is_job_satisfied(job, minecraft_directory)
+        }
+
+        for key in ("lzmaCompressed", "executable", "ignoreErrors", "phase"):
+            if key in job:
+                plan_file[key] = job[key]  # type: ignore[literal-required]
+
+        if "extract" in job:
+            plan_file["extract"] = {
+                "file": _get_relative_plan_path(job["extract"]["file"], minecraft_directory),
+                "directory": _get_relative_plan_path(job["extract"]["directory"], minecraft_directory),
+                "exclude": job["extract"]["exclude"]
+            }
+
+        install_plan["files"].append(plan_file)
+        install_plan["totalSize"] += plan_file["size"]
+        if not plan_file["satisfied"]:
+            install_plan["downloadSize"] += plan_file["size"]
+
+    for runtime_info in internal_plan["runtimes"]:
+        install_plan["runtimes"].append({
+            "jvmVersion": runtime_info["jvmVersion"],
+            "platform": runtime_info["platform"],
+            "versionName": runtime_info["versionName"],
+            "files": runtime_info["files"],
+            "directories": runtime_info["directories"],
+            "links": runtime_info["links"]
+        })
+
+    return install_plan
+
+
+def install_from_plan(plan: InstallPlan, minecraft_directory: str | os.PathLike, callback: CallbackDict | None = None, max_workers: int | None = None) -> None:
+    """
+    Installs everything from a plan that was created by :func:`get_install_plan`.
+    No metadata needs to be resolved, so only the files of the plan are downloaded.
+    Files that already exist with the correct checksum are not downloaded again.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        plan = minecraft_launcher_lib.install.load_install_plan("1.21.lock")
+        minecraft_launcher_lib.install.install_from_plan(plan, minecraft_directory)
+
+    :param plan: The install plan
+    :param minecraft_directory: The path to your Minecraft directory
+    :param callback: The same dict as for :func:`install_minecraft_version`
+    :param max_workers: The number of files that are downloaded at the same time. If None, max_workers will be set automatically.
+    :raises ValueError: The plan has a unsupported format
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+
+    .. versionadded:: 8.1
+    """
+    minecraft_directory = str(minecraft_directory)
+    if callback is None:
+        callback = {}
+
+    if plan.get("formatVersion") != _INSTALL_PLAN_FORMAT_VERSION:
+        raise ValueError(f"Unsupported install plan format {plan.get('formatVersion')}")
+
+    internal_plan = _create_version_install_plan(False)
+    internal_plan["inheritsFrom"] = dict(plan["inheritsFrom"])
+
+    for plan_file in plan["files"]:
+        job: DownloadJob = {
+            "url": plan_file["url"],
+            "path": _get_absolute_plan_path(plan_file["path"], minecraft_directory),
+            "sha1": plan_file.get("sha1"),
+            "size": plan_file.get("size", 0)
+        }
+
+        for key in ("lzmaCompressed", "executable", "ignoreErrors", "phase"):
+            if key in plan_file:
+                job[key] = plan_file[key]  # type: ignore[literal-required]
+
+        if "extract" in plan_file:
+            job["extract"] = {
+                "file": _get_absolute_plan_path(plan_file["extract"]["file"], minecraft_directory),
+                "directory": _get_absolute_plan_path(plan_file["extract"]["directory"], minecraft_directory),
+                "exclude": plan_file["extract"]["exclude"]
+            }
+
+        internal_plan["jobs"].append(job)
+
+    for runtime in plan["runtimes"]:
+        internal_plan["runtimes"].append({
+            "jvmVersion": runtime["jvmVersion"],
+            "platform": runtime["platform"],
+            "versionName": runtime["versionName"],
+            "files": runtime["files"],
+            "directories": runtime["directories"],
+            "links": runtime["links"]
+        })
+
+    _run_version_install_plan(internal_plan, minecraft_directory, callback, max_workers=max_workers)
+
+
+def save_install_plan(plan: InstallPlan, path: str | os.PathLike) -> None:
+    """
+    Saves a install plan as lockfile
+
+    Example:
+
+    .. code:: python
+
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        plan = minecraft_launcher_lib.install.get_install_plan("1.21", minecraft_directory)
+        minecraft_launcher_lib.install.save_install_plan(plan, "1.21.lock")
+
+    :param plan: The install plan
+    :param path: The path of the lockfile
+
+    .. versionadded:: 8.1
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, ensure_ascii=False, indent=4)
+
+
+def load_install_plan(path: str | os.PathLike) -> InstallPlan:
+    """
+    Loads a lockfile that was saved with :func:`save_install_plan`
+
+    Example:
+
+    .. code:: python
+
+        plan = minecraft_launcher_lib.install.load_install_plan("1.21.lock")
+
+    :param path: The path of the lockfile
+    :raises ValueError: The lockfile has a unsupported format
+    :return: The install plan
+
+    .. versionadded:: 8.1
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        plan: InstallPlan = json.load(f)
+
+    if not isinstance(plan, dict) or plan.get("formatVersion") != _INSTALL_PLAN_FORMAT_VERSION:
+        raise ValueError(f"{path} is not a supported install plan")
+
+    return plan
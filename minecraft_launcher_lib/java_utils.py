@@ -3,12 +3,32 @@
 # SPDX-License-Identifier: BSD-2-Clause
 "java_utils contains some functions to help with Java"
 from ._helper import SUBPROCESS_STARTUP_INFO
-from .types import JavaInformation
+from .types import JavaInformation, HostResources
+from typing import Literal
 import subprocess
 import platform
+import math
 import re
 import os
 
+_GC_SELECTORS = frozenset(("UseSerialGC", "UseParallelGC", "UseG1GC", "UseZGC", "UseShenandoahGC", "UseConcMarkSweepGC", "UseEpsilonGC"))
+_GC_TUNING_PREFIXES = ("G1", "Z", "Shenandoah", "ParallelGC")
+# Tuning arguments of the presets without the prefix of their garbage collector
+_GC_TUNING_OPTIONS = frozenset(("InitiatingHeapOccupancyPercent", "SurvivorRatio", "MaxTenuringThreshold"))
+
+_MAX_HEAP_SIZE = {"balanced": 4096, "low-latency": 4096, "throughput": 8192}
+_DEFAULT_MEMORY = 4096
+
+# The default arguments of the official launcher
+_BALANCED_G1_ARGUMENTS = ["-XX:+UnlockExperimentalVMOptions", "-XX:+UseG1GC", "-XX:G1NewSizePercent=20", "-XX:G1ReservePercent=20", "-XX:MaxGCPauseMillis=50", "-XX:G1HeapRegionSize=32M"]
+
+# G1 with a large young generation and early mixed collections, which keeps the pauses short on older Java versions
+_LOW_LATENCY_G1_ARGUMENTS = [
+    "-XX:+UnlockExperimentalVMOptions", "-XX:+UseG1GC", "-XX:+ParallelRefProcEnabled", "-XX:MaxGCPauseMillis=50", "-XX:+DisableExplicitGC",
+    "-XX:G1NewSizePercent=30", "-XX:G1MaxNewSizePercent=40", "-XX:G1HeapRegionSize=8M", "-XX:G1ReservePercent=20", "-XX:G1HeapWastePercent=5",
+    "-XX:G1MixedGCCountTarget=4", "-XX:InitiatingHeapOccupancyPercent=15", "-XX:G1MixedGCLiveThresholdPercent=90", "-XX:SurvivorRatio=32", "-XX:MaxTenuringThreshold=1"
+]
+
 
 def get_java_information(path: str | os.PathLike) -> JavaInformation:
     """
@@ -132,3 +152,270 @@ def find_system_java_versions_information(additional_directories: list[str | os.
     for i in find_system_java_versions(additional_directories=additional_directories):
         java_information_list.append(get_java_information(i))
     return java_information_list
+
+
+def _parse_cgroup_cpu_max(content: str) -> float | None:
+    """
+    Parses the content of cpu.max from cgroup v2. Returns None, if there is no limit.
+    """
+    parts = content.split()
+    if len(parts) != 2 or parts[0] == "max":
+        return None
+
+    try:
+        return int(parts[0]) / int(parts[1])
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _parse_cgroup_memory_max(content: str) -> int | None:
+    """
+    Parses the content of memory.max from cgroup v2 or memory.limit_in_bytes from cgroup v1. Returns None, if there is no limit.
+    """
+    try:
+        limit = int(content.strip())
+    except ValueError:
+        return None
+
+    # cgroup v1 uses a very large number for no limit
+    if limit <= 0 or limit >= 2 ** 60:
+        return None
+
+    return limit
+
+
+def _read_file(path: str) -> str | None:
+    """
+    Returns the content of a file or None, if it can't be read
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_cgroup_limits(root: str = "/sys/fs/cgroup", proc_cgroup: str = "/proc/self/cgroup") -> tuple[float | None, int | None]:
+    """
+    Returns the CPU and memory limits of the cgroup of the current process.
+    The limits of the parent cgroups apply too, so the lowest limit is returned.
+    """
+    cpu_limit: float | None = None
+    memory_limit: int | None = None
+
+    cgroup_path: str | None = None
+    for line in (_read_file(proc_cgroup) or "").splitlines():
+        if line.startswith("0::"):
+            cgroup_path = line[3:].strip("/")
+
+    if cgroup_path is not None:
+        # cgroup v2
+        current = os.path.join(root, cgroup_path) if cgroup_path != "" else root
+        while True:
+            cpu = _parse_cgroup_cpu_max(_read_file(os.path.join(current, "cpu.max")) or "")
+            if cpu is not None and (cpu_limit is None or cpu < cpu_limit):
+                cpu_limit = cpu
+
+            memory = _parse_cgroup_memory_max(_read_file(os.path.join(current, "memory.max")) or "")
+            if memory is not None and (memory_limit is None or memory < memory_limit):
+                memory_limit = memory
+
+            if os.path.normpath(current) == os.path.normpath(root):
+                break
+            current = os.path.dirname(current)
+    else:
+        # cgroup v1
+        memory_limit = _parse_cgroup_memory_max(_read_file(os.path.join(root, "memory", "memory.limit_in_bytes")) or "")
+        quota = _parse_cgroup_memory_max(_read_file(os.path.join(root, "cpu", "cpu.cfs_quota_us")) or "")
+        period = _parse_cgroup_memory_max(_read_file(os.path.join(root, "cpu", "cpu.cfs_period_us")) or "")
+        if quota is not None and period is not None:
+            cpu_limit = quota / period
+
+    return cpu_limit, memory_limit
+
+
+def get_host_resources() -> HostResources:
+    """
+    Returns the CPU cores and the memory, that can be used by Minecraft. On Linux the limits of the cgroup (e.g. inside a container) are included.
+    The result can be passed to :func:`get_jvm_preset_arguments`.
+
+    Example:
+
+    .. code:: python
+
+        resources = minecraft_launcher_lib.java_utils.get_host_resources()
+        print("CPU cores: " + str(resources["cpuCount"]))
+        print("Memory: " + str(resources["memoryTotal"]))
+
+    .. versionadded:: 8.1
+
+    :return: The resources. Values that could not be determined are None.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpu_count = len(os.sched_getaffinity(0))
+    else:
+        cpu_count = os.cpu_count() or 1
+
+    try:
+        memory_total: int | None = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        memory_total = None
+
+    cgroup_cpu_limit: float | None = None
+    cgroup_memory_limit: int | None = None
+    if platform.system() == "Linux":
+        cgroup_cpu_limit, cgroup_memory_limit = _read_cgroup_limits()
+
+    return {
+        "cpuCount": cpu_count,
+        "memoryTotal": memory_total,
+        "cgroupCpuLimit": cgroup_cpu_limit,
+        "cgroupMemoryLimit": cgroup_memory_limit
+    }
+
+
+def get_jvm_preset_arguments(preset: Literal["balanced", "low-latency", "throughput"], java_major_version: int, resources: HostResources | None = None) -> list[str]:
+    """
+    Returns JVM arguments that are tuned for the given resources and Java version. The result only depends on the arguments, so it's always the same for the same input.
+
+    The heap size is half of the available memory, but at most 4 GiB (8 GiB for throughput) and at least 1 GiB, if there is enough memory.
+    The following presets are available:
+
+    - balanced: G1 with the settings of the official launcher
+    - low-latency: ZGC on Java 21 and newer, G1 tuned for short pauses on older versions. The whole heap is reserved at the start.
+    - throughput: The parallel garbage collector, which has the highest throughput, but longer pauses
+
+    With less than 2 CPU cores, the serial garbage collector is always used.
+
+    Example:
+
+    .. code:: python
+
+        arguments = minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("low-latency", 21)
+        options["jvmArguments"] = minecraft_launcher_lib.java_utils.merge_jvm_arguments(arguments, ["-Xmx6G"])
+
+    You can also set the ``jvmPreset`` option of :func:`~minecraft_launcher_lib.command.get_minecraft_command`.
+
+    .. versionadded:: 8.1
+
+    :param preset: The preset
+    :param java_major_version: The major version of Java e.g. 21
+    :param resources: The resources from :func:`get_host_resources`. If None, :func:`get_host_resources` is called.
+    :raises ValueError: The preset does not exist
+    :return: The arguments
+    """
+    if preset not in _MAX_HEAP_SIZE:
+        raise ValueError(f"Unknown JVM preset: {preset}")
+
+    if resources is None:
+        resources = get_host_resources()
+
+    cpu_count = resources["cpuCount"]
+    if resources["cgroupCpuLimit"] is not None:
+        cpu_count = max(min(cpu_count, math.ceil(resources["cgroupCpuLimit"])), 1)
+
+    memory_limits = [i for i in (resources["memoryTotal"], resources["cgroupMemoryLimit"]) if i is not None]
+    available_memory = min(memory_limits) // (1024 * 1024) if len(memory_limits) != 0 else _DEFAULT_MEMORY
+
+    heap_size = max(min(available_memory // 2, _MAX_HEAP_SIZE[preset]), min(1024, available_memory * 3 // 4))
+    # Round down to a multiple of 128 MiB
+    heap_size = max(heap_size - heap_size % 128, 128)
+
+    arguments = [f"-Xmx{heap_size}M"]
+    if preset == "low-latency":
+        arguments.append(f"-Xms{heap_size}M")
+
+    # Older Java versions don't know about cgroup CPU limits and would create too many threads
+    if cpu_count < resources["cpuCount"] and java_major_version >= 10:
+        arguments.append(f"-XX:ActiveProcessorCount={cpu_count}")
+
+    if cpu_count < 2:
+        arguments.append("-XX:+UseSerialGC")
+    elif preset == "throughput":
+        arguments += ["-XX:+UseParallelGC", f"-XX:ParallelGCThreads={cpu_count}"]
+    elif preset == "low-latency" and java_major_version >= 21:
+        arguments.append("-XX:+UseZGC")
+        # Generational ZGC is the default since Java 23
+        if java_major_version < 23:
+            arguments.append("-XX:+ZGenerational")
+        arguments.append("-XX:+DisableExplicitGC")
+    elif preset == "low-latency":
+        arguments += _LOW_LATENCY_G1_ARGUMENTS
+    else:
+        arguments += _BALANCED_G1_ARGUMENTS
+
+    if preset == "low-latency":
+        arguments.append("-XX:+AlwaysPreTouch")
+
+    return arguments
+
+
+def _get_argument_key(argument: str) -> str:
+    """
+    Returns the option, that is set by the argument. Arguments with the same key override each other.
+    """
+    if argument.startswith("-XX:"):
+        name = argument[4:].split("=", 1)[0]
+        return "-XX:" + name.lstrip("+-")
+    elif argument.startswith("-D"):
+        return argument.split("=", 1)[0]
+    elif re.match(r"^-X(mx|ms|ss|mn)", argument) is not None:
+        return argument[:4]
+    else:
+        return argument
+
+
+def _is_gc_argument(key: str) -> bool:
+    """
+    Checks if the argument selects or tunes a garbage collector
+    """
+    if not key.startswith("-XX:"):
+        return False
+
+    name = key[4:]
+    return name in _GC_SELECTORS or name in _GC_TUNING_OPTIONS or name.startswith(_GC_TUNING_PREFIXES)
+
+
+def merge_jvm_arguments(preset_arguments: list[str], user_arguments: list[str]) -> list[str]:
+    """
+    Merges the arguments from :func:`get_jvm_preset_arguments` with arguments from the user. The arguments of the user always win:
+
+    - A preset argument is removed, if the user sets the same option (e.g. -Xmx, -XX:MaxGCPauseMillis or -Dfoo)
+    - If the user selects a garbage collector, all garbage collector arguments of the preset are removed
+    - If the user sets -Xmx, -Xms of the preset is removed, so it can't be larger than -Xmx
+
+    The remaining preset arguments come first in their original order, followed by all user arguments.
+
+    Example:
+
+    .. code:: python
+
+        arguments = minecraft_launcher_lib.java_utils.merge_jvm_arguments(["-Xmx4096M", "-XX:+UseG1GC"], ["-Xmx2G", "-Dfoo=bar"])
+        # ["-XX:+UseG1GC", "-Xmx2G", "-Dfoo=bar"]
+
+    .. versionadded:: 8.1
+
+    :param preset_arguments: The arguments of the preset
+    :param user_arguments: The arguments of the user
+    :return: The merged arguments
+    """
+    user_keys = {_get_argument_key(i) for i in user_arguments}
+
+    user_selects_gc = any(i.startswith("-XX:+") and i[5:] in _GC_SELECTORS for i in user_arguments)
+
+    merged: list[str] = []
+    for argument in preset_arguments:
+        key = _get_argument_key(argument)
+
+        if key in user_keys:
+            continue
+
+        if user_selects_gc and _is_gc_argument(key):
+            continue
+
+        if key == "-Xms" and "-Xmx" in user_keys:
+            continue
+
+        merged.append(argument)
+
+    return merged + user_arguments
@@ -12,10 +12,11 @@ from ._quilt import Quilt
 from ._base import ModLoaderBase
 from ..types import CallbackDict
 from ..exceptions import VersionNotFound, UnsupportedVersion
-from ..install import install_minecraft_version
+from ..install import install_minecraft_version, install_minecraft_version_async
 from ._forge import Forge
 from ..utils import is_version_valid
 from ._neoforge import Neoforge
+import asyncio
 import os
 
 __all__ = ["get_mod_loader", "list_mod_loader", "ModLoader"]
@@ -167,7 +168,7 @@ class ModLoader():
         """
         return self._base.get_installed_version(minecraft_version, loader_version)
 
-    def install(self, minecraft_version: str, minecraft_directory: str | os.PathLike, *, loader_version: str | None = None, callback: CallbackDict | None = None, java: str | os.PathLike | None = None) -> str:
+    def install(self, minecraft_version: str, minecraft_directory: str | os.PathLike, *, loader_version: str | None = None, callback: CallbackDict | None = None, java: str | os.PathLike | None = None, max_workers: int | None = None) -> str:
         """
         Installs the mod loader for the given vanilla version.
 
@@ -185,6 +186,7 @@ class ModLoader():
         :param loader_version: The version of the mod loader as returned by :func:`~minecraft_launcher_lib.mod_loader.ModLoader.get_loader_versions`.If not set the latest one will be used.
         :param callback: See :doc:`/tutorial/get_installation_progress`
         :param java: If set use this Java executable to execute programs during the installation.
+        :param max_workers: The number of files that are downloaded at the same time. If None, max_workers will be set automatically.
         :raises ~minecraft_launcher_lib.exceptions.VersionNotFound: An invalid minecraft version was passed.
         :raises ~minecraft_launcher_lib.exceptions.UnsupportedVersion: The given Minecraft version is not supported by the mod loader.
         :raises: CalledProcessError: The execution of a program failed.
@@ -205,13 +207,66 @@ class ModLoader():
         if loader_version is None:
             loader_version = self.get_latest_loader_version(minecraft_version)
 
-        install_minecraft_version(minecraft_version, minecraft_directory, callback=callback)
+        install_minecraft_version(minecraft_version, minecraft_directory, callback=callback, max_workers=max_workers)
 
         self._base.install(minecraft_version, str(minecraft_directory), callback, str(java), loader_version)
 
         installed_version = self.get_installed_version(minecraft_version, loader_version)
 
-        install_minecraft_version(installed_version, minecraft_directory, callback=callback)
+        install_minecraft_version(installed_version, minecraft_directory, callback=callback, max_workers=max_workers)
+
+        return installed_version
+
+    async def install_async(self, minecraft_version: str, minecraft_directory: str | os.PathLike, *, loader_version: str | None = None, callback: CallbackDict | None = None, java: str | os.PathLike | None = None, max_concurrency: int | None = None) -> str:
+        """
+        The asyncio version of :func:`~minecraft_launcher_lib.mod_loader.ModLoader.install`.
+        The vanilla version is installed using :func:`~minecraft_launcher_lib.install.install_minecraft_version_async`.
+        The installer of the mod loader runs in a separate thread, so the event loop is not blocked.
+
+        Example:
+
+        .. code:: python
+
+            vanilla_version = "1.21"
+            minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+            mod_loader = minecraft_launcher_lib.mod_loader.get_mod_loader("fabric")
+            asyncio.run(mod_loader.install_async(vanilla_version, minecraft_directory))
+
+        :param minecraft_version: The vanilla Minecraft version for which to install the mod loader. If not installed, minecraft-launcher-lib will also install the vanilla version.
+        :param minecraft_directory: The path to your Minecraft directory
+        :param loader_version: The version of the mod loader as returned by :func:`~minecraft_launcher_lib.mod_loader.ModLoader.get_loader_versions`.If not set the latest one will be used.
+        :param callback: See :doc:`/tutorial/get_installation_progress`
+        :param java: If set use this Java executable to execute programs during the installation.
+        :param max_concurrency: The maximal number of downloads that run at the same time. Every running download uses a worker thread. If None, it will be set automatically.
+        :raises ~minecraft_launcher_lib.exceptions.VersionNotFound: An invalid minecraft version was passed.
+        :raises ~minecraft_launcher_lib.exceptions.UnsupportedVersion: The given Minecraft version is not supported by the mod loader.
+        :raises: CalledProcessError: The execution of a program failed.
+        :return: The same as :func:`~minecraft_launcher_lib.mod_loader.ModLoader.get_installed_version`.
+
+        .. versionadded:: 8.1
+        """
+        if not await asyncio.to_thread(is_version_valid, minecraft_version, minecraft_directory):
+            raise VersionNotFound(minecraft_version)
+
+        if not await asyncio.to_thread(self.is_minecraft_version_supported, minecraft_version):
+            raise UnsupportedVersion(minecraft_version)
+
+        if callback is None:
+            callback = {}
+
+        if java is None:
+            java = "java"
+
+        if loader_version is None:
+            loader_version = await asyncio.to_thread(self.get_latest_loader_version, minecraft_version)
+
+        await install_minecraft_version_async(minecraft_version, minecraft_directory, callback=callback, max_concurrency=max_concurrency)
+
+        await asyncio.to_thread(self._base.install, minecraft_version, str(minecraft_directory), callback, str(java), loader_version)
+
+        installed_version = self.get_installed_version(minecraft_version, loader_version)
+
+        await install_minecraft_version_async(installed_version, minecraft_directory, callback=callback, max_concurrency=max_concurrency)
 
         return installed_version
 
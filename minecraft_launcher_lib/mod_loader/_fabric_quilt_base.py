@@ -1,7 +1,7 @@
 # This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
-from .._helper import get_requests_response_cache, parse_maven_metadata
+from .._helper import get_cached_json, parse_maven_metadata
 from ._base import ModLoaderBase
 
 
@@ -20,7 +20,7 @@ class FabricQuiltBase(ModLoaderBase):
         "Implements get_minecraft_versions() for Fabric/Quilt"
         version_list: list[str] = []
 
-        for version in get_requests_response_cache(self._game_url).json():
+        for version in get_cached_json(self._game_url):
             if not version["stable"] and stable_only:
                 continue
 
@@ -32,7 +32,7 @@ class FabricQuiltBase(ModLoaderBase):
         "Implements get_loader_versions() for Fabric/Quilt"
         version_list: list[str] = []
 
-        for current_version in get_requests_response_cache(self._loader_url).json():
+        for current_version in get_cached_json(self._loader_url):
             version = current_version["version"]
 
             if (not current_version.get("stable", True) or "beta" in version) and stable_only:
@@ -2,7 +2,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
 from ..vanilla_launcher import do_vanilla_launcher_profiles_exists, create_empty_vanilla_launcher_profiles_file
-from .._helper import get_requests_response_cache, download_file, empty, SUBPROCESS_STARTUP_INFO
+from .._helper import get_cached_json, download_file, empty, SUBPROCESS_STARTUP_INFO
 from ._base import ModLoaderBase
 from ..types import CallbackDict
 import subprocess
@@ -34,7 +34,7 @@ class Neoforge(ModLoaderBase):
         "Implements get_minecraft_versions() for NeoForge"
         version_dict: dict[str, bool] = {}
 
-        for current_version in get_requests_response_cache(_API_URL).json()["versions"]:
+        for current_version in get_cached_json(_API_URL)["versions"]:
             if not current_version.startswith("0."):
                 current_minecraft_version = _VERSION_REG_EX.match(current_version).group()  # type: ignore
                 version_dict[self._normalize_minecraft_version(current_minecraft_version)] = True
@@ -45,7 +45,7 @@ class Neoforge(ModLoaderBase):
         "Implements get_loader_versions() for NeoForge"
         version_list: list[str] = []
 
-        for current_version in get_requests_response_cache(_API_URL).json()["versions"]:
+        for current_version in get_cached_json(_API_URL)["versions"]:
             if "beta" in current_version and stable_only:
                 continue
 
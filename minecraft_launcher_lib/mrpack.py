@@ -127,7 +127,7 @@ def install_mrpack(path: str | os.PathLike, minecraft_directory: str | os.PathLi
 
             check_path_inside_minecraft_directory(modpack_directory, full_path)
 
-            download_file(file["downloads"][0], full_path, sha1=file["hashes"]["sha1"], callback=callback)
+            download_file(file["downloads"][0], full_path, sha1=file["hashes"]["sha1"], sha512=file["hashes"].get("sha512"), callback=callback)
 
             callback.get("setProgress", empty)(count + 1)
 
@@ -0,0 +1,498 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+network allows you to configure how minecraft-launcher-lib accesses the network.
+All settings are global for the whole process and are used by all functions of minecraft-launcher-lib.
+
+.. versionadded:: 8.1
+"""
+from ._throttle import TokenBucket, HostConnectionSlot
+from .types import RetryPolicy
+import requests.adapters
+import urllib.parse
+import threading
+import requests
+import os
+
+# The number of different hosts, for which a connection pool is kept
+_POOL_HOSTS = 16
+
+_max_connections: int | None = None
+_session: requests.sessions.Session | None = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+_DEFAULT_RETRY_POLICY: RetryPolicy = {
+    "attempts": 3,
+    "backoffFactor": 0.5,
+    "maxBackoff": 30.0,
+    "jitter": True,
+    "connectTimeout": 10.0,
+    "readTimeout": 60.0
+}
+_retry_policy: RetryPolicy = _DEFAULT_RETRY_POLICY.copy()
+_mirrors: dict[str, list[str]] = {}
+
+_bandwidth_limiter: TokenBucket | None = None
+_host_connection_limits: dict[str, int] = {}
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+_metadata_cache_directory: str | None = None
+_metadata_cache_ttl = 3600.0
+_metadata_cache_memory_limit = 32 * 1024 * 1024
+
+_offline_mode = False
+
+
+def _get_default_max_connections() -> int:
+    """
+    Returns the number of connections that is used, if the user don't set one.
+    This is the same default as the number of workers of ThreadPoolExecutor.
+    """
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def get_max_connections() -> int:
+    """
+    Returns the maximum number of connections per host that are kept open.
+    This is also the default number of parallel downloads.
+
+    .. versionadded:: 8.1
+
+    :return: The maximum number of connections
+    """
+    if _max_connections is None:
+        return _get_default_max_connections()
+    else:
+        return _max_connections
+
+
+def set_max_connections(count: int | None) -> None:
+    """
+    Sets the maximum number of connections per host that are kept open.
+    This is also used as the default number of parallel downloads.
+    Set it to None to use the default, which depends on the number of CPUs.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_max_connections(64)
+
+    .. versionadded:: 8.1
+
+    :param count: The maximum number of connections
+    :raises ValueError: The count is smaller than 1
+    """
+    global _max_connections, _session, _session_pool_size
+
+    if count is not None and count < 1:
+        raise ValueError("count must be at least 1")
+
+    with _session_lock:
+        _max_connections = count
+
+        # The next call of get_session() creates a new session with the new pool size
+        _session = None
+        _session_pool_size = 0
+
+
+def get_session(pool_size: int | None = None) -> requests.sessions.Session:
+    """
+    Returns the session that is shared by all functions of minecraft-launcher-lib.
+    The session keeps the connections open, so they can be reused across all downloads and installs in the process.
+    The connection pool of every host has the size of :func:`get_max_connections`.
+    You can use it to make your own requests using the same connections.
+
+    Example:
+
+    .. code:: python
+
+        session = minecraft_launcher_lib.network.get_session()
+        r = session.get("https://launchermeta.mojang.com/mc/game/version_manifest_v2.json")
+
+    .. versionadded:: 8.1
+
+    :param pool_size: The minimum size of the connection pool of every host. This is used, when more downloads than :func:`get_max_connections` are running in parallel.
+    :return: The shared session
+    """
+    global _session, _session_pool_size
+
+    size = max(pool_size or 0, get_max_connections())
+
+    with _session_lock:
+        if _session is None or _session_pool_size < size:
+            # The pool size can't be changed after the adapter is created, so a new session is needed.
+            # The old session is not closed, as other threads may still use it.
+            session = requests.session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=_POOL_HOSTS, pool_maxsize=size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+            _session_pool_size = size
+
+        return _session
+
+
+def close_session() -> None:
+    """
+    Closes all connections of the shared session.
+    A new session is created the next time it is needed.
+
+    .. versionadded:: 8.1
+    """
+    global _session, _session_pool_size
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pool_size = 0
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Returns the current retry policy. See :func:`set_retry_policy` for more information.
+
+    .. versionadded:: 8.1
+
+    :return: The retry policy
+    """
+    return _retry_policy.copy()
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """
+    Sets how often a request is retried, if a transient error happens.
+    Transient errors are connection errors, timeouts and the status codes 408, 425, 429, 500, 502, 503 and 504.
+    Keys that are not in the given dict keep their default value.
+
+    - attempts: How often a request is tried for every URL. Default is 3.
+    - backoffFactor: The waiting time before retry n is backoffFactor * 2^(n - 1) seconds. Default is 0.5.
+    - maxBackoff: The maximum waiting time before a retry in seconds. A Retry-After header sent by the server is honoured up to this limit. Default is 30.
+    - jitter: If True, a random waiting time between 0 and the calculated time is used, so not all downloads retry at the same time. Default is True.
+    - connectTimeout: The seconds to wait for a connection to the server. Default is 10.
+    - readTimeout: The seconds to wait for new data from the server. A stalled download fails with a timeout and is retried. Default is 60.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_retry_policy({"attempts": 5, "maxBackoff": 10})
+
+    .. versionadded:: 8.1
+
+    :param policy: The retry policy
+    :raises ValueError: attempts is smaller than 1 or a timeout is not positive
+    """
+    global _retry_policy
+
+    if policy.get("attempts", 1) < 1:
+        raise ValueError("attempts must be at least 1")
+
+    if policy.get("connectTimeout", 1) <= 0 or policy.get("readTimeout", 1) <= 0:
+        raise ValueError("The timeouts must be positive")
+
+    new_policy = _DEFAULT_RETRY_POLICY.copy()
+    new_policy.update(policy)
+    _retry_policy = new_policy
+
+
+def set_mirrors(host: str, mirrors: list[str]) -> None:
+    """
+    Sets a list of mirrors for the given host.
+    If a request to the host still fails after all retries, the mirrors are tried in the given order.
+    A mirror is a base URL. The path of the original URL is appended to it.
+    Use a empty list to remove all mirrors of the host.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_mirrors("libraries.minecraft.net", ["https://mirror.example.com/libraries"])
+        # https://libraries.minecraft.net/com/example/lib.jar will fall back to https://mirror.example.com/libraries/com/example/lib.jar
+
+    .. versionadded:: 8.1
+
+    :param host: The host e.g. resources.download.minecraft.net
+    :param mirrors: The list of mirrors
+    """
+    with _session_lock:
+        if len(mirrors) == 0:
+            _mirrors.pop(host.lower(), None)
+        else:
+            _mirrors[host.lower()] = [i.rstrip("/") for i in mirrors]
+
+
+def get_mirrors(host: str) -> list[str]:
+    """
+    Returns the mirrors of the given host
+
+    .. versionadded:: 8.1
+
+    :param host: The host
+    :return: The list of mirrors
+    """
+    with _session_lock:
+        return list(_mirrors.get(host.lower(), []))
+
+
+def get_mirror_urls(url: str) -> list[str]:
+    """
+    Returns the given URL followed by the same URL on all mirrors of the host
+
+    Example:
+
+    .. code:: python
+
+        for url in minecraft_launcher_lib.network.get_mirror_urls("https://libraries.minecraft.net/com/example/lib.jar"):
+            print(url)
+
+    .. versionadded:: 8.1
+
+    :param url: The URL
+    :return: The list of URLs in the order they should be tried
+    """
+    parsed = urllib.parse.urlsplit(url)
+    path = parsed.path
+    if parsed.query != "":
+        path += "?" + parsed.query
+
+    return [url] + [mirror + path for mirror in get_mirrors(parsed.hostname or "")]
+
+
+def set_bandwidth_limit(bytes_per_second: int | None) -> None:
+    """
+    Limits the download speed of all downloads in the process together.
+    The limit applies to all installs that are running at the same time. Set it to None to remove the limit, which is the default.
+
+    Example:
+
+    .. code:: python
+
+        # Allow 10 MiB/s
+        minecraft_launcher_lib.network.set_bandwidth_limit(10 * 1024 * 1024)
+
+    .. versionadded:: 8.1
+
+    :param bytes_per_second: The maximum number of bytes per second
+    :raises ValueError: bytes_per_second is smaller than 1
+    """
+    global _bandwidth_limiter
+
+    if bytes_per_second is not None and bytes_per_second < 1:
+        raise ValueError("bytes_per_second must be at least 1")
+
+    with _session_lock:
+        _bandwidth_limiter = TokenBucket(bytes_per_second) if bytes_per_second is not None else None
+
+
+def get_bandwidth_limit() -> int | None:
+    """
+    Returns the bandwidth limit in bytes per second or None, if there is no limit
+
+    .. versionadded:: 8.1
+
+    :return: The bandwidth limit
+    """
+    limiter = _bandwidth_limiter
+    return limiter.rate if limiter is not None else None
+
+
+def _get_bandwidth_limiter() -> TokenBucket | None:
+    """
+    Returns the token bucket that is shared by all downloads
+    """
+    return _bandwidth_limiter
+
+
+def set_host_connection_limit(host: str, limit: int | None) -> None:
+    """
+    Sets the maximum number of requests to the given host that run at the same time.
+    The limit applies to all installs that are running at the same time. Set it to None to remove the limit, which is the default.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_host_connection_limit("resources.download.minecraft.net", 8)
+        minecraft_launcher_lib.network.set_host_connection_limit("maven.minecraftforge.net", 2)
+
+    .. versionadded:: 8.1
+
+    :param host: The host e.g. libraries.minecraft.net
+    :param limit: The maximum number of connections
+    :raises ValueError: The limit is smaller than 1
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    host = host.lower()
+    with _session_lock:
+        # Requests that are already running keep the old semaphore
+        if limit is None:
+            _host_connection_limits.pop(host, None)
+            _host_semaphores.pop(host, None)
+        else:
+            _host_connection_limits[host] = limit
+            _host_semaphores[host] = threading.BoundedSemaphore(limit)
+
+
+def get_host_connection_limit(host: str) -> int | None:
+    """
+    Returns the connection limit of the given host or None, if there is no limit
+
+    .. versionadded:: 8.1
+
+    :param host: The host
+    :return: The connection limit
+    """
+    with _session_lock:
+        return _host_connection_limits.get(host.lower())
+
+
+def _get_host_connection_slot(url: str) -> HostConnectionSlot:
+    """
+    Returns a context manager that waits until a request to the host of the URL is allowed
+    """
+    host = (urllib.parse.urlsplit(url).hostname or "").lower()
+    with _session_lock:
+        return HostConnectionSlot(_host_semaphores.get(host))
+
+
+def set_metadata_cache_directory(path: str | os.PathLike | None) -> None:
+    """
+    Sets a directory in which metadata like the version manifest, the Fabric and Quilt version lists or the Forge maven metadata is cached.
+    The cache survives restarts, so a new process doesn't need to download the metadata again.
+    After the TTL the metadata is revalidated with the ETag and Last-Modified headers, so unchanged metadata is not downloaded again.
+    Set it to None to disable the cache on disk, which is the default.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_metadata_cache_directory(os.path.join(minecraft_directory, "metadata-cache"))
+
+    .. versionadded:: 8.1
+
+    :param path: The cache directory
+    """
+    global _metadata_cache_directory
+
+    _metadata_cache_directory = os.path.abspath(path) if path is not None else None
+
+
+def get_metadata_cache_directory() -> str | None:
+    """
+    Returns the directory of the metadata cache or None, if the cache on disk is disabled
+
+    .. versionadded:: 8.1
+
+    :return: The cache directory
+    """
+    return _metadata_cache_directory
+
+
+def set_metadata_cache_ttl(seconds: float) -> None:
+    """
+    Sets how long metadata is used without asking the server if it has changed. The default is one hour.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_metadata_cache_ttl(600)
+
+    .. versionadded:: 8.1
+
+    :param seconds: The TTL in seconds
+    :raises ValueError: seconds is negative
+    """
+    global _metadata_cache_ttl
+
+    if seconds < 0:
+        raise ValueError("seconds must not be negative")
+
+    _metadata_cache_ttl = float(seconds)
+
+
+def get_metadata_cache_ttl() -> float:
+    """
+    Returns the TTL of the metadata cache in seconds
+
+    .. versionadded:: 8.1
+
+    :return: The TTL
+    """
+    return _metadata_cache_ttl
+
+
+def set_metadata_cache_memory_limit(size: int) -> None:
+    """
+    Sets how many bytes of metadata are kept in memory. The size of the parsed metadata is estimated, so it is larger than the downloaded file.
+    If the limit is reached, the least recently used metadata is removed first. The default is 32 MiB. Set it to 0 to disable the cache in memory.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_metadata_cache_memory_limit(8 * 1024 * 1024)
+
+    .. versionadded:: 8.1
+
+    :param size: The limit in bytes
+    :raises ValueError: size is negative
+    """
+    global _metadata_cache_memory_limit
+
+    if size < 0:
+        raise ValueError("size must not be negative")
+
+    _metadata_cache_memory_limit = size
+
+
+def get_metadata_cache_memory_limit() -> int:
+    """
+    Returns how many bytes of metadata are kept in memory
+
+    .. versionadded:: 8.1
+
+    :return: The limit in bytes
+    """
+    return _metadata_cache_memory_limit
+
+
+def set_offline_mode(enabled: bool) -> None:
+    """
+    Enables or disables the offline mode.
+    In offline mode no request is sent. Metadata like the version manifest or the mod loader version lists is taken from the metadata cache, no matter how old it is.
+    Installed versions are taken from the versions directory. Installing a version that is already installed only verifies the files on disk.
+    If something is needed that is not available offline, :class:`~minecraft_launcher_lib.exceptions.NotAvailableOffline` is raised immediately.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.network.set_metadata_cache_directory(os.path.join(minecraft_directory, "metadata-cache"))
+        minecraft_launcher_lib.network.set_offline_mode(True)
+        minecraft_launcher_lib.install.install_minecraft_version("1.21", minecraft_directory)
+
+    .. versionadded:: 8.1
+
+    :param enabled: If offline mode should be used
+    """
+    global _offline_mode
+
+    _offline_mode = enabled
+
+
+def is_offline_mode() -> bool:
+    """
+    Returns if the offline mode is enabled
+
+    .. versionadded:: 8.1
+
+    :return: If offline mode is used
+    """
+    return _offline_mode
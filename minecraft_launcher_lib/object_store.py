@@ -0,0 +1,223 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+object_store allows multiple Minecraft directories to share the same files.
+
+If a object store is set, every library, asset, runtime file and client jar that is downloaded by the installers is stored in the object store under its sha1.
+The file inside the Minecraft directory is a hardlink to the file in the object store.
+If hardlinks are not possible (e.g. the object store is on another filesystem), a reflink is tried and after that the file is copied.
+A file that is already in the object store is never downloaded again, no matter for which Minecraft directory it is needed.
+The sha1 of a object is checked before it is linked into a Minecraft directory. A broken object is removed from the store and downloaded again.
+Executable files are always copied, so changing their mode does not change the object store.
+
+.. warning::
+    Files inside the Minecraft directories share their content with the object store.
+    If a file is modified in place, the file in the object store and all other Minecraft directories are modified too.
+
+.. versionadded:: 8.1
+"""
+import threading
+import hashlib
+import shutil
+import sys
+import os
+
+_object_store_directory: str | None = None
+_lock = threading.Lock()
+
+# The stat of the objects, whose sha1 has been checked. A object is only hashed again, if it has been changed.
+_verified_objects: dict[str, tuple[int, int, int]] = {}
+
+# The ioctl to create a reflink on Linux
+_FICLONE = 0x40049409
+
+
+def set_object_store(path: str | os.PathLike | None) -> None:
+    """
+    Sets the directory of the object store. Set it to None to disable the object store, which is the default.
+    The setting is global for the whole process.
+
+    Example:
+
+    .. code:: python
+
+        minecraft_launcher_lib.object_store.set_object_store("/srv/minecraft/objects")
+        minecraft_launcher_lib.install.install_minecraft_version("1.21", "/srv/minecraft/instances/first")
+        # Nothing needs to be downloaded
+        minecraft_launcher_lib.install.install_minecraft_version("1.21", "/srv/minecraft/instances/second")
+
+    .. versionadded:: 8.1
+
+    :param path: The directory of the object store
+    """
+    global _object_store_directory
+
+    with _lock:
+        _object_store_directory = os.path.abspath(path) if path is not None else None
+
+
+def get_object_store() -> str | None:
+    """
+    Returns the directory of the object store or None, if no object store is set
+
+    .. versionadded:: 8.1
+
+    :return: The directory of the object store
+    """
+    return _object_store_directory
+
+
+def _get_object_path(sha1: str) -> str | None:
+    """
+    Returns the path of the object with the given sha1 inside the object store
+    """
+    store = _object_store_directory
+    if store is None:
+        return None
+
+    sha1 = sha1.lower()
+    return os.path.join(store, "objects", sha1[:2], sha1)
+
+
+def _reflink(source: str, destination: str) -> None:
+    """
+    Creates a copy of the file that shares the data on filesystems that support it (e.g. Btrfs or XFS)
+    """
+    if sys.platform != "linux":
+        raise OSError("Reflinks are only supported on Linux")
+
+    import fcntl
+
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        try:
+            fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+        except OSError:
+            destination_file.close()
+            os.remove(destination)
+            raise
+
+
+def _link_file(source: str, destination: str, copy: bool = False) -> None:
+    """
+    Links the source to the destination. Uses a hardlink, a reflink or a copy, in this order.
+    If copy is True, the file is always copied, so the destination does not share the inode with the source.
+    The destination is replaced atomically.
+    """
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+    temp_path = f"{destination}.{os.getpid()}.{threading.get_ident()}.link"
+
+    if copy:
+        shutil.copyfile(source, temp_path)
+    else:
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            try:
+                _reflink(source, temp_path)
+            except OSError:
+                shutil.copyfile(source, temp_path)
+
+    try:
+        os.replace(temp_path, destination)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def _get_stat_key(path: str) -> tuple[int, int, int] | None:
+    """
+    Returns the inode, the mtime and the size of the file or None, if it doesn't exist
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+
+    return stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _mark_verified(object_path: str) -> None:
+    """
+    Records the stat of a object, whose sha1 is known to be correct
+    """
+    stat_key = _get_stat_key(object_path)
+    if stat_key is not None:
+        with _lock:
+            _verified_objects[object_path] = stat_key
+
+
+def _verify_object(object_path: str, sha1: str) -> bool:
+    """
+    Checks if the object has the given sha1. A broken object is removed from the object store.
+    """
+    stat_key = _get_stat_key(object_path)
+    if stat_key is None:
+        return False
+
+    with _lock:
+        if _verified_objects.get(object_path) == stat_key:
+            return True
+
+    sha1_hash = hashlib.sha1()
+    try:
+        with open(object_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha1_hash.update(chunk)
+    except OSError:
+        return False
+
+    if sha1_hash.hexdigest() != sha1.lower():
+        with _lock:
+            _verified_objects.pop(object_path, None)
+        try:
+            os.remove(object_path)
+        except OSError:
+            pass
+        return False
+
+    with _lock:
+        _verified_objects[object_path] = stat_key
+
+    return True
+
+
+def _link_object(sha1: str, path: str, copy: bool = False) -> bool:
+    """
+    Links the object with the given sha1 into the given path. The sha1 of the object is checked first.
+    Returns False, if the object is not in the object store or is broken.
+    """
+    object_path = _get_object_path(sha1)
+    if object_path is None or not _verify_object(object_path, sha1):
+        return False
+
+    try:
+        _link_file(object_path, path, copy)
+    except OSError:
+        return False
+
+    return True
+
+
+def _add_object(temp_path: str, sha1: str, path: str, copy: bool = False) -> bool:
+    """
+    Adds the verified temp file to the object store and links it into the given path.
+    Returns False, if the object store is not used or can't be written. In this case the temp file is left untouched.
+    """
+    object_path = _get_object_path(sha1)
+    if object_path is None:
+        return False
+
+    try:
+        # A broken object is replaced by the verified temp file
+        if not _verify_object(object_path, sha1):
+            _link_file(temp_path, object_path)
+            _mark_verified(object_path)
+    except OSError:
+        return False
+
+    _link_file(object_path, path, copy)
+    os.remove(temp_path)
+
+    return True
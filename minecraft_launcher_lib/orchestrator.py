@@ -0,0 +1,454 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+orchestrator runs multiple Minecraft instances at the same time.
+
+The instances are started one after another, so they don't compete for the CPU and the disk while loading.
+Each instance can be pinned to CPU cores, limited by a cgroup and restarted when it exits.
+The startup latency and the resource usage of every instance can be read with :func:`InstanceOrchestrator.get_metrics`.
+
+.. versionadded:: 8.1
+"""
+from .types import InstanceConfig, InstanceMetrics, OrchestratorCallbackDict, GameLogEvent, GameProcessCallbackDict, MinecraftOptions
+from .process import GameProcess, start_minecraft, DEFAULT_STARTUP_PATTERN
+from .exceptions import PlatformNotSupported
+from .command import get_minecraft_command
+from typing import Literal, Any
+import threading
+import copy
+import time
+import sys
+import os
+
+__all__ = ["InstanceOrchestrator"]
+
+_CGROUP_CPU_PERIOD = 100000
+
+# Moves itself into the cgroup and sets its CPU affinity before it's replaced by Java.
+# The pid stays the same, so Java and everything it starts are limited from the beginning and the threads of the launcher are not pinned.
+_WRAPPER_SCRIPT = """
+import sys
+import os
+cgroup, cpus = sys.argv[1], sys.argv[2]
+if cgroup != "":
+    with open(os.path.join(cgroup, "cgroup.procs"), "w") as f:
+        f.write(str(os.getpid()))
+if cpus != "":
+    os.sched_setaffinity(0, [int(i) for i in cpus.split(",")])
+os.execvp(sys.argv[3], sys.argv[3:])
+"""
+
+
+def _read_proc_metrics(pid: int) -> tuple[float | None, int | None]:
+    """
+    Returns the used CPU time in seconds and the resident memory in bytes of the process.
+    Returns None for values that are not available on this platform.
+    """
+    cpu_time: float | None = None
+    memory_rss: int | None = None
+
+    try:
+        with open(f"/proc/{pid}/stat", "r", encoding="utf-8") as f:
+            # The name of the process may contain spaces, so the fields are counted from the closing bracket
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu_time = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    memory_rss = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return cpu_time, memory_rss
+
+
+def _write_cgroup_file(cgroup: str, name: str, value: str) -> None:
+    """
+    Writes a value into a control file of the cgroup
+    """
+    with open(os.path.join(cgroup, name), "w", encoding="utf-8") as f:
+        f.write(value)
+
+
+def _setup_cgroup(config: InstanceConfig) -> None:
+    """
+    Creates the cgroup of the instance and writes its limits
+    """
+    cgroup = config["cgroup"]
+    os.makedirs(cgroup, exist_ok=True)
+
+    if "memoryMax" in config:
+        _write_cgroup_file(cgroup, "memory.max", str(config["memoryMax"]))
+
+    if "cpuLimit" in config:
+        _write_cgroup_file(cgroup, "cpu.max", f"{int(config['cpuLimit'] * _CGROUP_CPU_PERIOD)} {_CGROUP_CPU_PERIOD}")
+
+
+def _get_wrapped_command(command: list[str], config: InstanceConfig) -> list[str]:
+    """
+    Returns the command, that applies the cgroup and the CPU affinity of the instance before Java is started
+    """
+    if "cgroup" not in config and "cpuAffinity" not in config:
+        return command
+
+    cpus = ",".join(str(i) for i in config.get("cpuAffinity", []))
+    return [sys.executable, "-I", "-S", "-c", _WRAPPER_SCRIPT, config.get("cgroup", ""), cpus] + command
+
+
+class _Instance():
+    """
+    The state of a single instance
+    """
+    def __init__(self, config: InstanceConfig, command: list[str], game_directory: str) -> None:
+        self.name = config["name"]
+        self.config = config
+        self.command = command
+        self.game_directory = game_directory
+        self.process: GameProcess | None = None
+        self.restarts = 0
+        self.exit_codes: list[int] = []
+        self.restart_timer: threading.Timer | None = None
+        # True from the start until the exit has been handled and no restart is pending.
+        # The process reports that it is finished before the exit callback runs, so process.running can't be used for this.
+        self.active = False
+        self.ready = threading.Event()
+        # Makes sure the exit of a process is handled after the process has been stored
+        self.spawn_lock = threading.Lock()
+
+
+class InstanceOrchestrator():
+    """
+    Starts and watches multiple Minecraft instances. All methods can be called from any thread.
+
+    Example:
+
+    .. code:: python
+
+        orchestrator = minecraft_launcher_lib.orchestrator.InstanceOrchestrator(minecraft_directory, stagger_delay=10)
+        for i in range(4):
+            orchestrator.add_instance({"name": f"bot{i}", "version": "1.21", "options": options, "cpuAffinity": [i * 2, i * 2 + 1], "maxHeap": 2048, "restartPolicy": "on-failure"})
+        orchestrator.start()
+        for metrics in orchestrator.get_metrics():
+            print(f"{metrics['name']} needed {metrics['startupTime']} seconds to start and uses {metrics['memoryRss']} bytes of memory")
+        orchestrator.wait()
+
+    .. versionadded:: 8.1
+
+    :param minecraft_directory: The path to your Minecraft directory
+    :param stagger_delay: The seconds between starting two instances
+    :param wait_for_startup: If True, the next instance is started after the previous one has finished loading instead of after stagger_delay
+    :param startup_timeout: If wait_for_startup is True, the next instance is started after this many seconds, even if the previous one is not ready yet
+    :param startup_pattern: The startup pattern for :func:`~minecraft_launcher_lib.process.start_minecraft`
+    :param callback: The callbacks. See :func:`start`.
+    """
+    def __init__(
+            self,
+            minecraft_directory: str | os.PathLike,
+            *,
+            stagger_delay: float = 5.0,
+            wait_for_startup: bool = False,
+            startup_timeout: float = 120.0,
+            startup_pattern: str | None = DEFAULT_STARTUP_PATTERN,
+            callback: OrchestratorCallbackDict | None = None) -> None:
+        if stagger_delay < 0:
+            raise ValueError("stagger_delay can't be negative")
+
+        self._minecraft_directory = os.path.abspath(minecraft_directory)
+        self._stagger_delay = stagger_delay
+        self._wait_for_startup = wait_for_startup
+        self._startup_timeout = startup_timeout
+        self._startup_pattern = startup_pattern
+        self._callback = callback or {}
+        self._instances: dict[str, _Instance] = {}
+        self._condition = threading.Condition()
+        self._stopping = False
+
+    def _call_callback(self, name: Literal["logEvent", "startup", "exit", "restart"], *args: Any) -> None:
+        """
+        Calls the given callback, if it is set
+        """
+        callback = self._callback.get(name)
+        if callback is not None:
+            callback(*args)
+
+    def add_instance(self, config: InstanceConfig) -> None:
+        """
+        Adds a instance. The config can have the following keys. Only name and version are required.
+
+        - name: A unique name of the instance
+        - version: The Minecraft version
+        - options: The options for :func:`~minecraft_launcher_lib.command.get_minecraft_command`. If gameDirectory is not set, ``instances/<name>`` inside the Minecraft directory is used, so the instances don't share their saves and settings.
+        - cpuAffinity: A list of CPU cores the instance can run on. Only supported on Linux.
+        - maxHeap: The maximal heap size of Java in MiB
+        - cgroup: The path to a cgroup v2 directory, that has been delegated to the current user. It's created if it doesn't exist. The process is moved into it before Java starts. Only supported on Linux.
+        - memoryMax: The memory limit of the cgroup in bytes
+        - cpuLimit: The number of CPU cores the cgroup can use (e.g. 1.5)
+        - restartPolicy: "never" (default), "on-failure" to restart if the exit code is not 0, or "always"
+        - maxRestarts: How often the instance is restarted. Defaults to 3.
+        - restartDelay: The seconds to wait before a restart. Defaults to 5.
+
+        :param config: The config of the instance
+        :raises ValueError: The name is already used or the config is invalid
+        :raises ~minecraft_launcher_lib.exceptions.VersionNotFound: The version is not installed
+        """
+        name = config.get("name")
+        if not name:
+            raise ValueError("The instance needs a name")
+
+        if config.get("restartPolicy", "never") not in ("never", "on-failure", "always"):
+            raise ValueError(f"Invalid restart policy: {config['restartPolicy']}")
+
+        if ("memoryMax" in config or "cpuLimit" in config) and "cgroup" not in config:
+            raise ValueError("memoryMax and cpuLimit require a cgroup")
+
+        if "cpuAffinity" in config and not hasattr(os, "sched_setaffinity"):
+            raise PlatformNotSupported()
+
+        if "cgroup" in config and sys.platform != "linux":
+            raise PlatformNotSupported()
+
+        options: MinecraftOptions = copy.deepcopy(config.get("options", {}))
+        if "gameDirectory" not in options:
+            options["gameDirectory"] = os.path.join(self._minecraft_directory, "instances", name)
+
+        if "maxHeap" in config:
+            options["jvmArguments"] = options.get("jvmArguments", []) + [f"-Xmx{config['maxHeap']}M"]
+
+        command = get_minecraft_command(config["version"], self._minecraft_directory, options)
+
+        with self._condition:
+            if name in self._instances:
+                raise ValueError(f"A instance with the name {name} already exists")
+            self._instances[name] = _Instance(config, command, str(options["gameDirectory"]))
+
+    def _spawn(self, instance: _Instance) -> None:
+        """
+        Starts the process of the instance
+        """
+        with instance.spawn_lock:
+            self._spawn_locked(instance)
+
+    def _spawn_locked(self, instance: _Instance) -> None:
+        """
+        Starts the process of the instance. The spawn lock of the instance must be held.
+        """
+        config = instance.config
+        instance.ready.clear()
+        os.makedirs(instance.game_directory, exist_ok=True)
+
+        if "cgroup" in config:
+            _setup_cgroup(config)
+
+        def _log_event(event: GameLogEvent) -> None:
+            "Forwards the event to the callback"
+            self._call_callback("logEvent", instance.name, event)
+
+        def _startup(startup_time: float) -> None:
+            "Marks the instance as ready"
+            instance.ready.set()
+            self._call_callback("startup", instance.name, startup_time)
+
+        def _exit(returncode: int) -> None:
+            "Handles the exit of the instance"
+            self._on_exit(instance, returncode)
+
+        process_callback: GameProcessCallbackDict = {"logEvent": _log_event, "startup": _startup, "exit": _exit}
+
+        process = start_minecraft(_get_wrapped_command(instance.command, config), instance.game_directory, callback=process_callback, startup_pattern=self._startup_pattern, max_buffered_events=0)
+
+        with self._condition:
+            instance.process = process
+            instance.restart_timer = None
+            instance.active = True
+            stopping = self._stopping
+            self._condition.notify_all()
+
+        # stop() was called while the process was started
+        if stopping:
+            process.terminate()
+
+    def _on_exit(self, instance: _Instance, returncode: int) -> None:
+        """
+        Records the exit code and restarts the instance, if the restart policy says so
+        """
+        instance.ready.set()
+
+        policy = instance.config.get("restartPolicy", "never")
+        with instance.spawn_lock, self._condition:
+            instance.exit_codes.append(returncode)
+
+            restart = not self._stopping and instance.restarts < instance.config.get("maxRestarts", 3)
+            if policy == "never" or (policy == "on-failure" and returncode == 0):
+                restart = False
+
+            if restart:
+                instance.restarts += 1
+                instance.restart_timer = threading.Timer(instance.config.get("restartDelay", 5.0), self._restart, args=(instance,))
+                instance.restart_timer.daemon = True
+                instance.restart_timer.start()
+
+            instance.active = restart
+            self._condition.notify_all()
+
+        self._call_callback("exit", instance.name, returncode)
+
+    def _restart(self, instance: _Instance) -> None:
+        """
+        Starts the instance again after it has exited
+        """
+        with self._condition:
+            if self._stopping:
+                instance.restart_timer = None
+                instance.active = False
+                self._condition.notify_all()
+                return
+
+        self._call_callback("restart", instance.name, instance.restarts)
+
+        try:
+            self._spawn(instance)
+        except Exception:
+            with self._condition:
+                instance.restart_timer = None
+                instance.active = False
+                self._condition.notify_all()
+            raise
+
+    def start(self) -> None:
+        """
+        Starts all instances, that are not running yet, one after another. It returns after the last instance has been started.
+
+        The callback dict can have the following keys. The functions are called from a background thread with the name of the instance as first argument.
+
+        - logEvent: Called with the name and a :class:`~minecraft_launcher_lib.types.GameLogEvent` for every line
+        - startup: Called with the name and the seconds since the start, when the instance has finished loading
+        - exit: Called with the name and the exit code
+        - restart: Called with the name and the number of the restart, before a instance is restarted
+        """
+        with self._condition:
+            self._stopping = False
+            instances = [i for i in self._instances.values() if not i.active]
+            # Mark the instances as active now, so wait() and a second start() don't see them as stopped
+            for instance in instances:
+                instance.active = True
+
+        for count, instance in enumerate(instances):
+            if count != 0:
+                previous = instances[count - 1]
+                if self._wait_for_startup:
+                    previous.ready.wait(self._startup_timeout)
+                else:
+                    time.sleep(self._stagger_delay)
+
+            with self._condition:
+                if self._stopping:
+                    self._set_inactive(instances[count:])
+                    return
+
+            try:
+                self._spawn(instance)
+            except Exception:
+                with self._condition:
+                    self._set_inactive(instances[count:])
+                raise
+
+    def _set_inactive(self, instances: list[_Instance]) -> None:
+        """
+        Marks instances that have not been started as inactive. Must be called with the condition held.
+        """
+        for instance in instances:
+            instance.active = False
+        self._condition.notify_all()
+
+    def _is_active(self) -> bool:
+        """
+        Checks if a instance is running or waiting for a restart
+        """
+        return any(i.active for i in self._instances.values())
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all instances have exited and no instance will be restarted
+
+        :param timeout: The maximal time to wait in seconds
+        :return: False, if the timeout has been reached
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._is_active(), timeout)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """
+        Stops all instances. Instances that are still running after the timeout are killed.
+        Pending restarts are cancelled.
+
+        :param timeout: The seconds to wait before the instances are killed
+        """
+        with self._condition:
+            self._stopping = True
+            for instance in self._instances.values():
+                if instance.restart_timer is not None:
+                    instance.restart_timer.cancel()
+                    instance.restart_timer = None
+                    instance.active = False
+            processes = [i.process for i in self._instances.values() if i.process is not None]
+
+        for process in processes:
+            process.terminate()
+
+        if not self.wait(timeout):
+            for process in processes:
+                process.kill()
+            self.wait()
+
+    def get_process(self, name: str) -> GameProcess | None:
+        """
+        Returns the current process of the instance or None, if it has not been started yet
+
+        :param name: The name of the instance
+        :raises ValueError: There is no instance with this name
+        """
+        with self._condition:
+            if name not in self._instances:
+                raise ValueError(f"There is no instance with the name {name}")
+            return self._instances[name].process
+
+    def get_metrics(self) -> list[InstanceMetrics]:
+        """
+        Returns the metrics of all instances. The times are measured for the current process of a instance, so they are reset on a restart.
+        cpuTime and memoryRss are only available on Linux while the instance is running.
+
+        :return: The metrics in the order the instances were added
+        """
+        with self._condition:
+            instances = list(self._instances.values())
+
+        metrics_list: list[InstanceMetrics] = []
+        for instance in instances:
+            process = instance.process
+            running = process is not None and process.running
+
+            cpu_time: float | None = None
+            memory_rss: int | None = None
+            if process is not None and running:
+                cpu_time, memory_rss = _read_proc_metrics(process.pid)
+
+            metrics_list.append({
+                "name": instance.name,
+                "pid": process.pid if process is not None else None,
+                "running": running,
+                "restarts": instance.restarts,
+                "exitCodes": list(instance.exit_codes),
+                "startupTime": process.startup_time if process is not None else None,
+                "firstOutputTime": process.first_output_time if process is not None else None,
+                "uptime": process.elapsed if process is not None and running else None,
+                "cpuTime": cpu_time,
+                "memoryRss": memory_rss,
+            })
+
+        return metrics_list
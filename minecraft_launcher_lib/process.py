@@ -0,0 +1,338 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+process starts Minecraft and reads its output without blocking.
+
+stdout and stderr are read by background threads, so a game that writes a lot of log output never blocks on a full pipe.
+Every line is turned into a :class:`~minecraft_launcher_lib.types.GameLogEvent`.
+If Minecraft writes log4j XML events (e.g. if ``enableLoggingConfig`` is set in the options of :func:`~minecraft_launcher_lib.command.get_minecraft_command`), they are parsed and returned as a single event.
+The events can be received through a callback or a async iterator.
+
+.. versionadded:: 8.1
+"""
+from .types import GameLogEvent, GameLog4jEvent, GameProcessCallbackDict
+from typing import AsyncIterator, Literal, IO
+from ._helper import empty, SUBPROCESS_STARTUP_INFO
+import xml.etree.ElementTree
+import collections
+import subprocess
+import threading
+import asyncio
+import time
+import re
+import os
+
+__all__ = ["GameProcess", "start_minecraft"]
+
+DEFAULT_STARTUP_PATTERN = "Sound engine started"
+"A line that Minecraft writes when the main menu is loaded"
+
+_LOG4J_NAMESPACE = "http://jakarta.apache.org/log4j/"
+
+
+def _parse_log4j_event(text: str) -> GameLog4jEvent | None:
+    """
+    Parses a log4j XML event. Returns None, if the text is not a valid event.
+    """
+    try:
+        root = xml.etree.ElementTree.fromstring(f'<root xmlns:log4j="{_LOG4J_NAMESPACE}">{text}</root>')
+    except xml.etree.ElementTree.ParseError:
+        return None
+
+    element = root.find(f"{{{_LOG4J_NAMESPACE}}}Event")
+    if element is None:
+        return None
+
+    try:
+        timestamp = int(element.get("timestamp", "0"))
+    except ValueError:
+        timestamp = 0
+
+    return {
+        "logger": element.get("logger", ""),
+        "timestamp": timestamp,
+        "level": element.get("level", ""),
+        "thread": element.get("thread", ""),
+        "message": element.findtext(f"{{{_LOG4J_NAMESPACE}}}Message", ""),
+        "throwable": element.findtext(f"{{{_LOG4J_NAMESPACE}}}Throwable")
+    }
+
+
+def _set_future_result(future: "asyncio.Future[None]") -> None:
+    """
+    Wakes up a waiting coroutine
+    """
+    if not future.done():
+        future.set_result(None)
+
+
+def _wake_up(waiters: list[tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]]) -> None:
+    """
+    Wakes up all given coroutines from another thread
+    """
+    for loop, future in waiters:
+        try:
+            loop.call_soon_threadsafe(_set_future_result, future)
+        except RuntimeError:
+            # The event loop is closed
+            pass
+
+
+class GameProcess():
+    """
+    A running Minecraft instance, that has been started with :func:`start_minecraft`.
+    All methods can be called from any thread.
+
+    .. versionadded:: 8.1
+    """
+    def __init__(self, command: list[str], cwd: str | os.PathLike | None, env: dict[str, str] | None, callback: GameProcessCallbackDict, startup_pattern: str | None, max_buffered_events: int) -> None:
+        self._callback = callback
+        self._startup_regex = re.compile(startup_pattern) if startup_pattern is not None else None
+        self._events: collections.deque[GameLogEvent] = collections.deque(maxlen=max_buffered_events)
+        self._lock = threading.Lock()
+        self._event_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+        self._exit_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+        self._finished = threading.Event()
+        self._returncode: int | None = None
+        self._first_output_time: float | None = None
+        self._startup_time: float | None = None
+
+        self.command = command
+        "The command of the process"
+
+        self._start_time = time.monotonic()
+        self._process = subprocess.Popen(command, cwd=cwd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=SUBPROCESS_STARTUP_INFO)
+
+        self.pid = self._process.pid
+        "The process id"
+
+        self._readers = [
+            threading.Thread(target=self._read_stream, args=(self._process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=self._read_stream, args=(self._process.stderr, "stderr"), daemon=True)
+        ]
+        for reader in self._readers:
+            reader.start()
+
+        threading.Thread(target=self._wait_for_exit, daemon=True).start()
+
+    @property
+    def returncode(self) -> int | None:
+        "The exit code of the process or None, if it is still running"
+        return self._returncode
+
+    @property
+    def running(self) -> bool:
+        "If the process is still running"
+        return not self._finished.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        "The seconds since the process has been started"
+        return time.monotonic() - self._start_time
+
+    @property
+    def first_output_time(self) -> float | None:
+        "The seconds from the start until the first line was written or None, if nothing has been written yet"
+        return self._first_output_time
+
+    @property
+    def startup_time(self) -> float | None:
+        "The seconds from the start until a line matched the startup pattern or None, if no line matched yet"
+        return self._startup_time
+
+    def _add_event(self, event: GameLogEvent) -> None:
+        """
+        Sends the event to the callback and adds it to the buffer
+        """
+        startup = False
+        with self._lock:
+            if self._first_output_time is None:
+                self._first_output_time = event["time"]
+
+            if self._startup_time is None and self._startup_regex is not None and self._startup_regex.search(event["text"]) is not None:
+                self._startup_time = event["time"]
+                startup = True
+
+            self._events.append(event)
+            _wake_up(self._event_waiters)
+            self._event_waiters = []
+
+        self._callback.get("logEvent", empty)(event)
+
+        if startup:
+            self._callback.get("startup", empty)(event["time"])
+
+    def _read_stream(self, stream: IO[bytes], name: Literal["stdout", "stderr"]) -> None:
+        """
+        Reads the lines of the stream until it's closed
+        """
+        log4j_lines: list[str] | None = None
+
+        for raw_line in iter(stream.readline, b""):
+            line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+            if log4j_lines is None and line.lstrip().startswith("<log4j:Event"):
+                log4j_lines = []
+
+            if log4j_lines is None:
+                self._add_event({"stream": name, "text": line, "time": self.elapsed, "log4j": None})
+                continue
+
+            log4j_lines.append(line)
+            if "</log4j:Event>" not in line:
+                continue
+
+            log4j_event = _parse_log4j_event("\n".join(log4j_lines))
+            if log4j_event is not None:
+                self._add_event({"stream": name, "text": log4j_event["message"], "time": self.elapsed, "log4j": log4j_event})
+            else:
+                for current_line in log4j_lines:
+                    self._add_event({"stream": name, "text": current_line, "time": self.elapsed, "log4j": None})
+            log4j_lines = None
+
+        # A incomplete event at the end of the output
+        for current_line in log4j_lines or []:
+            self._add_event({"stream": name, "text": current_line, "time": self.elapsed, "log4j": None})
+
+        stream.close()
+
+    def _wait_for_exit(self) -> None:
+        """
+        Waits until the process has exited and all output has been read
+        """
+        for reader in self._readers:
+            reader.join()
+
+        returncode = self._process.wait()
+
+        with self._lock:
+            self._returncode = returncode
+            self._finished.set()
+            _wake_up(self._event_waiters + self._exit_waiters)
+            self._event_waiters = []
+            self._exit_waiters = []
+
+        self._callback.get("exit", empty)(returncode)
+
+    async def _wait_for_change(self, events: bool) -> None:
+        """
+        Waits until the process has exited. If events is True, it also returns when there is a new event.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self._lock:
+            if self._finished.is_set() or (events and len(self._events) != 0):
+                return
+
+            if events:
+                self._event_waiters.append((loop, future))
+            else:
+                self._exit_waiters.append((loop, future))
+
+        await future
+
+    def wait(self, timeout: float | None = None) -> int:
+        """
+        Waits until the process has exited and all output has been read.
+
+        :param timeout: The maximal time to wait in seconds
+        :raises subprocess.TimeoutExpired: The process is still running after the timeout
+        :return: The exit code
+        """
+        if not self._finished.wait(timeout):
+            raise subprocess.TimeoutExpired(self.command, timeout)  # type: ignore
+
+        return self._returncode  # type: ignore
+
+    async def wait_async(self) -> int:
+        """
+        The asyncio version of :func:`wait`
+
+        :return: The exit code
+        """
+        await self._wait_for_change(False)
+        return self._returncode  # type: ignore
+
+    async def events(self) -> AsyncIterator[GameLogEvent]:
+        """
+        Returns the log events as async iterator. It ends, when the process has exited.
+        Each event is only returned once. Events that have been written before are returned first.
+
+        Example:
+
+        .. code:: python
+
+            process = minecraft_launcher_lib.process.start_minecraft(command)
+            async for event in process.events():
+                print(event["text"])
+            print(f"Minecraft exited with code {process.returncode}")
+        """
+        while True:
+            with self._lock:
+                if len(self._events) != 0:
+                    event: GameLogEvent | None = self._events.popleft()
+                elif self._finished.is_set():
+                    return
+                else:
+                    event = None
+
+            if event is not None:
+                yield event
+            else:
+                await self._wait_for_change(True)
+
+    def terminate(self) -> None:
+        """
+        Asks the process to exit
+        """
+        if self.running:
+            self._process.terminate()
+
+    def kill(self) -> None:
+        """
+        Kills the process
+        """
+        if self.running:
+            self._process.kill()
+
+
+def start_minecraft(
+        command: list[str],
+        cwd: str | os.PathLike | None = None,
+        *,
+        callback: GameProcessCallbackDict | None = None,
+        env: dict[str, str] | None = None,
+        startup_pattern: str | None = DEFAULT_STARTUP_PATTERN,
+        max_buffered_events: int = 10000) -> GameProcess:
+    """
+    Starts the command from :func:`~minecraft_launcher_lib.command.get_minecraft_command` and returns immediately.
+    The output is read in the background. Each process uses three threads, so many processes can run at the same time.
+
+    The callback dict can have the following keys. The functions are called from a background thread.
+
+    - logEvent: Called with a :class:`~minecraft_launcher_lib.types.GameLogEvent` for every line or log4j event
+    - startup: Called with the seconds since the start, when the first line matches startup_pattern
+    - exit: Called with the exit code, after the process has exited and all output has been read
+
+    Example:
+
+    .. code:: python
+
+        command = minecraft_launcher_lib.command.get_minecraft_command("1.21", minecraft_directory, options)
+        process = minecraft_launcher_lib.process.start_minecraft(command, minecraft_directory, callback={"logEvent": lambda event: print(event["text"])})
+        exit_code = process.wait()
+        print(f"Minecraft needed {process.startup_time} seconds to start and exited with code {exit_code}")
+
+    .. versionadded:: 8.1
+
+    :param command: The command
+    :param cwd: The working directory of the process
+    :param callback: The callbacks
+    :param env: The environment variables of the process. If None, the variables of the current process are used.
+    :param startup_pattern: A regular expression. The time until the first line matches it is measured as startup time.
+    :param max_buffered_events: How many events are kept for :func:`GameProcess.events`. If there are more, the oldest are dropped. Set it to 0, if you only use the callback.
+    :return: The process
+    """
+    return GameProcess(command, cwd, env, callback or {}, startup_pattern, max_buffered_events)
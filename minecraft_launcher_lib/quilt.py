@@ -11,7 +11,7 @@ quilt contains functions for dealing with the `Quilt modloader <https://quiltmc.
 You may have noticed, that the Functions are the same as in the :doc:`fabric` module.
 That's because Quilt is a Fork of Fabric. This module behaves exactly the same as the fabric module.
 """
-from ._helper import download_file, get_requests_response_cache, parse_maven_metadata, empty, SUBPROCESS_STARTUP_INFO
+from ._helper import download_file, get_cached_json, parse_maven_metadata, empty, SUBPROCESS_STARTUP_INFO
 from .exceptions import VersionNotFound, UnsupportedVersion, ExternalProgramError
 from .types import QuiltMinecraftVersion, QuiltLoader, CallbackDict
 from .install import install_minecraft_version
@@ -19,6 +19,7 @@ from .utils import is_version_valid
 import subprocess
 import tempfile
 import warnings
+import copy
 import os
 
 
@@ -35,7 +36,7 @@ def get_all_minecraft_versions() -> list[QuiltMinecraftVersion]:
     """
     warnings.warn("This module is deprecated and has been replaced by mod_loader", DeprecationWarning)
     QUILT_MINECARFT_VERSIONS_URL = "https://meta.quiltmc.org/v3/versions/game"
-    return get_requests_response_cache(QUILT_MINECARFT_VERSIONS_URL).json()
+    return copy.deepcopy(get_cached_json(QUILT_MINECARFT_VERSIONS_URL))
 
 
 def get_stable_minecraft_versions() -> list[str]:
@@ -127,7 +128,7 @@ def get_all_loader_versions() -> list[QuiltLoader]:
     """
     warnings.warn("This module is deprecated and has been replaced by mod_loader", DeprecationWarning)
     QUILT_LOADER_VERSIONS_URL = "https://meta.quiltmc.org/v3/versions/loader"
-    return get_requests_response_cache(QUILT_LOADER_VERSIONS_URL).json()
+    return copy.deepcopy(get_cached_json(QUILT_LOADER_VERSIONS_URL))
 
 
 def get_latest_loader_version() -> str:
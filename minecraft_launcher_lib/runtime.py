@@ -2,15 +2,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
 "runtime allows to install the java runtime. This module is used by :func:`~minecraft_launcher_lib.install.install_minecraft_version`, so you don't need to use it in your code most of the time."
-from ._helper import get_user_agent, download_file, empty, get_sha1_hash, check_path_inside_minecraft_directory, get_client_json
-from ._internal_types.runtime_types import RuntimeListJson, PlatformManifestJson, _PlatformManifestJsonFile
+from ._internal_types.runtime_types import RuntimeListJson, PlatformManifestJson, RuntimeInstallInfo
+from ._download_scheduler import run_download_jobs, run_download_jobs_async
+from ._helper import check_path_inside_minecraft_directory, get_client_json, get_cached_json
 from .types import CallbackDict, JvmRuntimeInformation, VersionRuntimeInformation
-from .exceptions import VersionNotFound, PlatformNotSupported
-from concurrent.futures import ThreadPoolExecutor
-import subprocess
+from .exceptions import VersionNotFound, PlatformNotSupported, NotAvailableOffline
+from ._internal_types.install_types import DownloadJob
+from ._verification_index import get_verification_index
 import datetime
-import requests
 import platform
+import asyncio
 import os
 
 _JVM_MANIFEST_URL = "https://launchermeta.mojang.com/v1/products/java-runtime/2ec0cc96c44e5a76b9c8b7c39df7210883d12871/all.json"
@@ -51,7 +52,7 @@ def get_jvm_runtimes() -> list[str]:
         for runtime in minecraft_launcher_lib.runtime.get_jvm_runtimes():
             print(runtime)
     """
-    manifest_data: RuntimeListJson = requests.get(_JVM_MANIFEST_URL, headers={"user-agent": get_user_agent()}).json()
+    manifest_data: RuntimeListJson = get_cached_json(_JVM_MANIFEST_URL)
     jvm_list = []
     for key in manifest_data[_get_jvm_platform_string()].keys():
         jvm_list.append(key)
@@ -77,110 +78,218 @@ def get_installed_jvm_runtimes(minecraft_directory: str | os.PathLike) -> list[s
         return []
 
 
-def install_jvm_runtime(
-        jvm_version: str,
-        minecraft_directory: str | os.PathLike,
-        callback: CallbackDict | None = None,
-        max_workers: int | None = None) -> None:
+def _is_jvm_runtime_installed(jvm_version: str, platform_string: str, minecraft_directory: str | os.PathLike) -> bool:
     """
-    Installs the given jvm runtime. callback is the same dict as in the install module.
+    Checks if all files that are listed in the .sha1 file of the runtime exist
+    """
+    runtime_path = os.path.join(minecraft_directory, "runtime", jvm_version, platform_string)
 
-    Example:
+    try:
+        with open(os.path.join(runtime_path, f"{jvm_version}.sha1"), "r", encoding="utf-8") as f:
+            for line in f:
+                current_file = line.partition(" /#// ")[0]
+                if current_file != "" and not os.path.isfile(os.path.join(runtime_path, jvm_version, current_file)):
+                    return False
+    except FileNotFoundError:
+        return False
 
-    .. code:: python
+    return os.path.isfile(os.path.join(runtime_path, ".version"))
 
-        runtime_version = "java-runtime-gamma"
-        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
-        minecraft_launcher_lib.runtime.install_jvm_runtime(runtime_version, minecraft_directory)
 
-    :param jvm_version: The Name of the JVM version
-    :param minecraft_directory: The path to your Minecraft directory
-    :param callback: the same dict as for :func:`~minecraft_launcher_lib.install.install_minecraft_version`
-    :param max_workers: number of workers for asynchronous downloads. If None, max_workers will be set automatically.
-    :raises VersionNotFound: The given JVM Version was not found
-    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+def _get_jvm_runtime_jobs(jvm_version: str, minecraft_directory: str | os.PathLike) -> tuple[list[DownloadJob], RuntimeInstallInfo] | None:
+    """
+    Returns the jobs to download all files of the given runtime.
+    The directories and links are created by _finish_jvm_runtime_install(), so this function doesn't change anything on disk.
+    Returns None if the runtime is not available for this platform or if it is already installed and the manifest is not available in offline mode.
     """
-    if callback is None:
-        callback = {}
-
-    manifest_data: RuntimeListJson = requests.get(_JVM_MANIFEST_URL, headers={"user-agent": get_user_agent()}).json()
     platform_string = _get_jvm_platform_string()
+    try:
+        return _get_jvm_runtime_jobs_from_manifest(jvm_version, platform_string, minecraft_directory)
+    except NotAvailableOffline:
+        if _is_jvm_runtime_installed(jvm_version, platform_string, minecraft_directory):
+            return None
+        raise
+
+
+def _get_jvm_runtime_jobs_from_manifest(jvm_version: str, platform_string: str, minecraft_directory: str | os.PathLike) -> tuple[list[DownloadJob], RuntimeInstallInfo] | None:
+    """
+    Returns the jobs to download all files of the given runtime using the runtime manifest
+    """
+    manifest_data: RuntimeListJson = get_cached_json(_JVM_MANIFEST_URL)
     # Check if the jvm version exists
     if jvm_version not in manifest_data[platform_string]:
         raise VersionNotFound(jvm_version)
     # Check if there is a platform manifest
     if len(manifest_data[platform_string][jvm_version]) == 0:
-        return
-    platform_manifest: PlatformManifestJson = requests.get(manifest_data[platform_string][jvm_version][0]["manifest"]["url"], headers={"user-agent": get_user_agent()}).json()
+        return None
+    platform_manifest: PlatformManifestJson = get_cached_json(manifest_data[platform_string][jvm_version][0]["manifest"]["url"])
     base_path = os.path.join(minecraft_directory, "runtime", jvm_version, platform_string, jvm_version)
-    session = requests.session()
-    file_list: list[str] = []
 
-    def install_runtime_file(key: str, value: _PlatformManifestJsonFile) -> None:
-        """Install the single runtime file."""
+    job_list: list[DownloadJob] = []
+    runtime_info: RuntimeInstallInfo = {
+        "jvmVersion": jvm_version,
+        "platform": platform_string,
+        "versionName": manifest_data[platform_string][jvm_version][0]["version"]["name"],
+        "files": {},
+        "directories": [],
+        "links": {}
+    }
+
+    for key, value in platform_manifest["files"].items():
         current_path = os.path.join(base_path, key)
         check_path_inside_minecraft_directory(minecraft_directory, current_path)
 
         if value["type"] == "file":
             # Prefer downloading the compresses file
             if "lzma" in value["downloads"]:
-                download_file(value["downloads"]["lzma"]["url"], current_path, sha1=value["downloads"]["raw"]["sha1"], callback=callback, lzma_compressed=True, session=session)
+                job_list.append({
+                    "phase": "runtime",
+                    "url": value["downloads"]["lzma"]["url"],
+                    "path": current_path,
+                    "sha1": value["downloads"]["raw"]["sha1"],
+                    "size": value["downloads"]["lzma"]["size"],
+                    "lzmaCompressed": True,
+                    "executable": value["executable"]
+                })
             else:
-                download_file(value["downloads"]["raw"]["url"], current_path, sha1=value["downloads"]["raw"]["sha1"], callback=callback, session=session)
+                job_list.append({
+                    "phase": "runtime",
+                    "url": value["downloads"]["raw"]["url"],
+                    "path": current_path,
+                    "sha1": value["downloads"]["raw"]["sha1"],
+                    "size": value["downloads"]["raw"]["size"],
+                    "executable": value["executable"]
+                })
 
-            # Make files executable on unix systems
-            if value["executable"]:
-                try:
-                    subprocess.run(["chmod", "+x", current_path])
-                except FileNotFoundError:
-                    pass
-            file_list.append(key)
+            runtime_info["files"][key] = value["downloads"]["raw"]["sha1"]
 
         elif value["type"] == "directory":
-            try:
-                os.makedirs(current_path)
-            except Exception:
-                pass
+            runtime_info["directories"].append(key)
 
         elif value["type"] == "link":
-            check_path_inside_minecraft_directory(minecraft_directory, os.path.join(base_path, value["target"]))
-            os.makedirs(os.path.dirname(current_path), exist_ok=True)
-
-            try:
-                os.symlink(value["target"], current_path)
-            except Exception:
-                pass
-
-    # Download all files of the runtime
-    callback.get("setMax", empty)(len(platform_manifest["files"]) - 1)
-    count = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(install_runtime_file, key, value)
-            for key, value in platform_manifest["files"].items()
-        ]
-        for future in futures:
-            future.result()
-            count += 1
-            callback.get("setProgress", empty)(count)
+            check_path_inside_minecraft_directory(minecraft_directory, os.path.join(os.path.dirname(current_path), value["target"]))
+            runtime_info["links"][key] = value["target"]
+
+    return job_list, runtime_info
+
+
+def _finish_jvm_runtime_install(runtime_info: RuntimeInstallInfo, minecraft_directory: str | os.PathLike) -> None:
+    """
+    Writes the files that the runtime needs after all files are downloaded
+    """
+    jvm_version = runtime_info["jvmVersion"]
+    platform_string = runtime_info["platform"]
+    base_path = os.path.join(minecraft_directory, "runtime", jvm_version, platform_string, jvm_version)
+
+    for current_directory in runtime_info["directories"]:
+        current_path = os.path.join(base_path, current_directory)
+        check_path_inside_minecraft_directory(minecraft_directory, current_path)
+        os.makedirs(current_path, exist_ok=True)
+
+    for current_link, target in runtime_info["links"].items():
+        current_path = os.path.join(base_path, current_link)
+        check_path_inside_minecraft_directory(minecraft_directory, current_path)
+        check_path_inside_minecraft_directory(minecraft_directory, os.path.join(os.path.dirname(current_path), target))
+        os.makedirs(os.path.dirname(current_path), exist_ok=True)
+
+        try:
+            os.symlink(target, current_path)
+        except Exception:
+            pass
 
     # Create the .version file
     version_path = os.path.join(minecraft_directory, "runtime", jvm_version, platform_string, ".version")
     check_path_inside_minecraft_directory(minecraft_directory, version_path)
     with open(version_path, "w", encoding="utf-8") as f:
-        f.write(manifest_data[platform_string][jvm_version][0]["version"]["name"])
+        f.write(runtime_info["versionName"])
 
     # Writes the .sha1 file
     # It has the structure {path} /#// {sha1} {creation time in nanoseconds}
     sha1_path = os.path.join(minecraft_directory, "runtime", jvm_version, platform_string, f"{jvm_version}.sha1")
     check_path_inside_minecraft_directory(minecraft_directory, sha1_path)
     with open(sha1_path, "w", encoding="utf-8") as f:
-        for current_file in file_list:
+        # All files have been verified by download_file(), so there is no need to hash them again
+        for current_file, sha1 in runtime_info["files"].items():
             current_path = os.path.join(base_path, current_file)
             ctime = os.stat(current_path).st_ctime_ns
-            sha1 = get_sha1_hash(current_path)
             f.write(f"{current_file} /#// {sha1} {ctime}\n")
 
+    get_verification_index(minecraft_directory).save()
+
+
+def install_jvm_runtime(
+        jvm_version: str,
+        minecraft_directory: str | os.PathLike,
+        callback: CallbackDict | None = None,
+        max_workers: int | None = None) -> None:
+    """
+    Installs the given jvm runtime. callback is the same dict as in the install module.
+
+    Example:
+
+    .. code:: python
+
+        runtime_version = "java-runtime-gamma"
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        minecraft_launcher_lib.runtime.install_jvm_runtime(runtime_version, minecraft_directory)
+
+    :param jvm_version: The Name of the JVM version
+    :param minecraft_directory: The path to your Minecraft directory
+    :param callback: the same dict as for :func:`~minecraft_launcher_lib.install.install_minecraft_version`
+    :param max_workers: number of workers for asynchronous downloads. If None, max_workers will be set automatically.
+    :raises VersionNotFound: The given JVM Version was not found
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+    :raises NotAvailableOffline: Offline mode is enabled and the runtime is neither installed nor in the metadata cache
+    """
+    if callback is None:
+        callback = {}
+
+    runtime_jobs = _get_jvm_runtime_jobs(jvm_version, minecraft_directory)
+    if runtime_jobs is None:
+        return
+
+    job_list, runtime_info = runtime_jobs
+    run_download_jobs(job_list, minecraft_directory, callback, max_workers=max_workers)
+    _finish_jvm_runtime_install(runtime_info, minecraft_directory)
+
+
+async def install_jvm_runtime_async(
+        jvm_version: str,
+        minecraft_directory: str | os.PathLike,
+        callback: CallbackDict | None = None,
+        max_concurrency: int | None = None) -> None:
+    """
+    The asyncio version of :func:`install_jvm_runtime`.
+    It can be used inside asyncio applications without blocking the event loop. The downloads run in a pool of worker threads.
+
+    Example:
+
+    .. code:: python
+
+        runtime_version = "java-runtime-gamma"
+        minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        asyncio.run(minecraft_launcher_lib.runtime.install_jvm_runtime_async(runtime_version, minecraft_directory))
+
+    :param jvm_version: The Name of the JVM version
+    :param minecraft_directory: The path to your Minecraft directory
+    :param callback: the same dict as for :func:`~minecraft_launcher_lib.install.install_minecraft_version`
+    :param max_concurrency: The maximal number of downloads that run at the same time. Every running download uses a worker thread. If None, it will be set automatically.
+    :raises VersionNotFound: The given JVM Version was not found
+    :raises FileOutsideMinecraftDirectory: A File should be placed outside the given Minecraft directory
+
+    .. versionadded:: 8.1
+    """
+    if callback is None:
+        callback = {}
+
+    runtime_jobs = await asyncio.to_thread(_get_jvm_runtime_jobs, jvm_version, minecraft_directory)
+    if runtime_jobs is None:
+        return
+
+    job_list, runtime_info = runtime_jobs
+    await run_download_jobs_async(job_list, minecraft_directory, callback, max_concurrency=max_concurrency)
+    await asyncio.to_thread(_finish_jvm_runtime_install, runtime_info, minecraft_directory)
+
 
 def get_executable_path(jvm_version: str, minecraft_directory: str | os.PathLike) -> str | None:
     """
@@ -231,7 +340,7 @@ def get_jvm_runtime_information(jvm_version: str) -> JvmRuntimeInformation:
     :raises VersionNotFound: The given JVM Version is not available on this Platform
     :return: A Dict with Information
     """
-    manifest_data: RuntimeListJson = requests.get(_JVM_MANIFEST_URL, headers={"user-agent": get_user_agent()}).json()
+    manifest_data: RuntimeListJson = get_cached_json(_JVM_MANIFEST_URL)
     platform_string = _get_jvm_platform_string()
 
     # Check if the jvm version exists
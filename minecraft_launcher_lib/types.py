@@ -34,12 +34,38 @@ class MinecraftOptions(TypedDict, total=False):
     quickPlaySingleplayer: str | None
     quickPlayMultiplayer: str | None
     quickPlayRealms: str | None
+    useArgumentFile: bool
+    jvmPreset: Literal["balanced", "low-latency", "throughput"]
+    createClassDataArchive: bool
+    disableClassDataArchive: bool
+
+
+class ProgressEventPhase(TypedDict):
+    bytesDone: int
+    bytesTotal: int
+    filesDone: int
+    filesTotal: int
+    bytesPerSecond: float
+
+
+class ProgressEvent(TypedDict):
+    bytesDone: int
+    bytesTotal: int
+    filesDone: int
+    filesTotal: int
+    bytesPerSecond: float
+    eta: float | None
+    elapsed: float
+    finished: bool
+    phases: dict[str, ProgressEventPhase]
 
 
 class CallbackDict(TypedDict, total=False):
     setStatus: Callable[[str], None]
     setProgress: Callable[[int], None]
     setMax: Callable[[int], None]
+    progressEvent: Callable[[ProgressEvent], None]
+    progressEventInterval: float
 
 
 class LatestMinecraftVersions(TypedDict):
@@ -95,6 +121,13 @@ class JavaInformation(TypedDict):
     openjdk: bool
 
 
+class HostResources(TypedDict):
+    cpuCount: int
+    memoryTotal: int | None
+    cgroupCpuLimit: float | None
+    cgroupMemoryLimit: int | None
+
+
 # vanilla_launcher
 
 class VanillaLauncherProfileResolution(TypedDict):
@@ -140,6 +173,109 @@ class VersionRuntimeInformation(TypedDict):
     javaMajorVersion: int
 
 
+class RetryPolicy(TypedDict, total=False):
+    attempts: int
+    backoffFactor: float
+    maxBackoff: float
+    jitter: bool
+    connectTimeout: float
+    readTimeout: float
+
+
+class InstallPlanFileExtract(TypedDict):
+    file: str
+    directory: str
+    exclude: list[str]
+
+
+class InstallPlanFile(TypedDict, total=False):
+    url: str
+    path: str
+    sha1: str | None
+    size: int
+    satisfied: bool
+    lzmaCompressed: bool
+    executable: bool
+    ignoreErrors: bool
+    extract: InstallPlanFileExtract
+    phase: str
+
+
+class InstallPlanRuntime(TypedDict):
+    jvmVersion: str
+    platform: str
+    versionName: str
+    files: dict[str, str]
+    directories: list[str]
+    links: dict[str, str]
+
+
+class InstallPlan(TypedDict):
+    formatVersion: int
+    version: str
+    files: list[InstallPlanFile]
+    runtimes: list[InstallPlanRuntime]
+    inheritsFrom: dict[str, str]
+    totalSize: int
+    downloadSize: int
+
+
+class GameLog4jEvent(TypedDict):
+    logger: str
+    timestamp: int
+    level: str
+    thread: str
+    message: str
+    throwable: str | None
+
+
+class GameLogEvent(TypedDict):
+    stream: Literal["stdout", "stderr"]
+    text: str
+    time: float
+    log4j: GameLog4jEvent | None
+
+
+class GameProcessCallbackDict(TypedDict, total=False):
+    logEvent: Callable[[GameLogEvent], None]
+    startup: Callable[[float], None]
+    exit: Callable[[int], None]
+
+
+class InstanceConfig(TypedDict, total=False):
+    name: str
+    version: str
+    options: MinecraftOptions
+    cpuAffinity: list[int]
+    maxHeap: int
+    cgroup: str
+    cpuLimit: float
+    memoryMax: int
+    restartPolicy: Literal["never", "on-failure", "always"]
+    maxRestarts: int
+    restartDelay: float
+
+
+class InstanceMetrics(TypedDict):
+    name: str
+    pid: int | None
+    running: bool
+    restarts: int
+    exitCodes: list[int]
+    startupTime: float | None
+    firstOutputTime: float | None
+    uptime: float | None
+    cpuTime: float | None
+    memoryRss: int | None
+
+
+class OrchestratorCallbackDict(TypedDict, total=False):
+    logEvent: Callable[[str, GameLogEvent], None]
+    startup: Callable[[str, float], None]
+    exit: Callable[[str, int], None]
+    restart: Callable[[str, int], None]
+
+
 class _NewsEntryPlayPageImage(TypedDict):
     title: str
     url: str
@@ -3,8 +3,9 @@
 # SPDX-License-Identifier: BSD-2-Clause
 "utils contains a few functions for helping you that doesn't fit in any other category"
 from .types import MinecraftOptions, LatestMinecraftVersions, MinecraftVersionInfo
-from ._internal_types.shared_types import ClientJson, VersionListManifestJson
-from ._helper import get_requests_response_cache, assert_func
+from ._internal_types.shared_types import ClientJson
+from ._helper import get_version_manifest, assert_func
+from .exceptions import NotAvailableOffline
 from datetime import datetime
 import platform
 import pathlib
@@ -46,7 +47,7 @@ def get_latest_version() -> LatestMinecraftVersions:
         print("Latest Release " + latest_version["release"])
         print("Latest Snapshot " + latest_version["snapshot"])
     """
-    return get_requests_response_cache("https://launchermeta.mojang.com/mc/game/version_manifest_v2.json").json()["latest"]
+    return get_version_manifest().latest
 
 
 def get_version_list() -> list[MinecraftVersionInfo]:
@@ -60,11 +61,8 @@ def get_version_list() -> list[MinecraftVersionInfo]:
         for version in minecraft_launcher_lib.utils.get_version_list():
             print(version["id"])
     """
-    vlist: VersionListManifestJson = get_requests_response_cache("https://launchermeta.mojang.com/mc/game/version_manifest_v2.json").json()
-    returnlist: list[MinecraftVersionInfo] = []
-    for i in vlist["versions"]:
-        returnlist.append({"id": i["id"], "type": i["type"], "releaseTime": datetime.fromisoformat(i["releaseTime"]), "complianceLevel": i["complianceLevel"]})
-    return returnlist
+    # The entries are shared by all calls, so the caller gets copies
+    return [i.copy() for i in get_version_manifest().get_version_list()]
 
 
 def get_installed_versions(minecraft_directory: str | os.PathLike) -> list[MinecraftVersionInfo]:
@@ -119,11 +117,15 @@ def get_available_versions(minecraft_directory: str | os.PathLike) -> list[Minec
     :param minecraft_directory: The path to your Minecraft directory
     """
     version_list = []
-    version_check = []
+    version_check: set[str] = set()
 
-    for i in get_version_list():
-        version_list.append(i)
-        version_check.append(i["id"])
+    try:
+        for i in get_version_list():
+            version_list.append(i)
+            version_check.add(i["id"])
+    except NotAvailableOffline:
+        # In offline mode only the installed versions are available, if the version list is not cached
+        pass
 
     for i in get_installed_versions(minecraft_directory):
         if not i["id"] in version_check:
@@ -234,10 +236,10 @@ def is_version_valid(version: str, minecraft_directory: str | os.PathLike) -> bo
     """
     if os.path.isdir(os.path.join(minecraft_directory, "versions", version)):
         return True
-    for i in get_version_list():
-        if i["id"] == version:
-            return True
-    return False
+    try:
+        return version in get_version_manifest()
+    except NotAvailableOffline:
+        return False
 
 
 def is_vanilla_version(version: str) -> bool:
@@ -256,10 +258,7 @@ def is_vanilla_version(version: str) -> bool:
 
     :param version: A Minecraft version
     """
-    for i in get_version_list():
-        if i["id"] == version:
-            return True
-    return False
+    return version in get_version_manifest()
 
 
 def is_platform_supported() -> bool:
@@ -0,0 +1,14 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+from typing import Iterator
+import minecraft_launcher_lib
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_platform_profile() -> Iterator[None]:
+    # Many tests replace the platform functions, so every test starts with a new platform profile
+    minecraft_launcher_lib._rules.reset_platform_profile()
+    yield
+    minecraft_launcher_lib._rules.reset_platform_profile()
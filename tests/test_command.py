@@ -4,9 +4,13 @@
 from ._test_helper import prepare_test_versions
 import minecraft_launcher_lib
 from typing import List
+import concurrent.futures
 import platform
 import pathlib
+import shutil
 import pytest
+import json
+import re
 import os
 
 
@@ -246,3 +250,187 @@ def test_get_minecraft_command_with_path(tmp_path: pathlib.Path) -> None:
     prepare_test_versions(tmp_path)
     # Test if get_minecraft_command works with os.PathLike
     minecraft_launcher_lib.command.get_minecraft_command("test1", tmp_path, {})
+
+
+def test_get_minecraft_command_launch_plan(tmp_path: pathlib.Path) -> None:
+    prepare_test_versions(tmp_path)
+    options = minecraft_launcher_lib.utils.generate_test_options()
+
+    command = minecraft_launcher_lib.command.get_minecraft_command("inherit", str(tmp_path), options)
+    plan = minecraft_launcher_lib._launch_plan.get_launch_plan("inherit", str(tmp_path))
+
+    # The plan is reused, as long as the version jsons are not changed
+    assert minecraft_launcher_lib.command.get_minecraft_command("inherit", str(tmp_path), options) == command
+    assert minecraft_launcher_lib._launch_plan.get_launch_plan("inherit", str(tmp_path)) is plan
+
+    # Changing the version json creates a new plan
+    json_path = tmp_path / "versions" / "inherit" / "inherit.json"
+    json_path.write_text(json_path.read_text(encoding="utf-8").replace("net.minecraft.client.main.Main", "net.minecraft.client.main.Changed"), encoding="utf-8")
+    os.utime(json_path, ns=(0, 0))
+
+    assert minecraft_launcher_lib._launch_plan.get_launch_plan("inherit", str(tmp_path)) is not plan
+    assert "net.minecraft.client.main.Changed" in minecraft_launcher_lib.command.get_minecraft_command("inherit", str(tmp_path), options)
+
+
+def test_get_minecraft_command_placeholders(tmp_path: pathlib.Path) -> None:
+    prepare_test_versions(tmp_path)
+
+    # The value of a placeholder is not replaced again
+    options = minecraft_launcher_lib.utils.generate_test_options()
+    options["username"] = "${classpath}"
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options)
+    assert _check_argument(command, "--username", "${classpath}")
+
+    # Unknown placeholders are reported and kept
+    json_path = tmp_path / "versions" / "test1" / "test1.json"
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    data["arguments"]["game"].append("${unknown_placeholder}")
+    json_path.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.warns(UserWarning, match=r"\$\{unknown_placeholder\}"):
+        command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options)
+
+    assert command[-1] == "${unknown_placeholder}"
+
+
+def test_get_minecraft_command_argument_file(tmp_path: pathlib.Path) -> None:
+    prepare_test_versions(tmp_path)
+    options = minecraft_launcher_lib.utils.generate_test_options()
+    options["executablePath"] = "java"
+    options["jvmArguments"] = ["-Dtest=a \\ \"b\""]
+
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options)
+
+    options["useArgumentFile"] = True
+    short_command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options)
+
+    assert short_command[0] == "java"
+    assert short_command[1].startswith("@")
+
+    # The command is the same after the JVM arguments
+    main_class_pos = command.index("net.minecraft.client.main.Main")
+    assert short_command[2:] == command[main_class_pos:]
+
+    argument_file = short_command[1][1:]
+    content = pathlib.Path(argument_file).read_text(encoding="utf-8")
+    assert content.splitlines()[0] == '"-Dtest=a \\\\ \\"b\\""'
+    assert len(content.splitlines()) == main_class_pos - 1
+
+    # The file is reused
+    assert minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options) == short_command
+
+    # Only the most recently used files are remembered and old files are removed
+    os.utime(argument_file, (0, 0))
+    for i in range(20):
+        options["jvmArguments"] = [f"-Dtest={i}"]
+        minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options)
+
+    assert len(minecraft_launcher_lib._launch_plan.get_launch_plan("test1", str(tmp_path)).argument_files) == 16
+    assert not os.path.exists(argument_file)
+    assert len(os.listdir(os.path.dirname(argument_file))) == 20
+
+
+def test_compiled_rules(monkeypatch: pytest.MonkeyPatch) -> None:
+    rules = [{"action": "allow", "os": {"name": "linux"}}, {"action": "allow", "features": {"is_demo_user": True}}]
+
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    assert minecraft_launcher_lib._helper.parse_rule_list(rules, {"demo": True}) is True  # type: ignore
+    assert minecraft_launcher_lib._helper.parse_rule_list(rules, {}) is False  # type: ignore
+
+    # The compiled rule list is reused
+    assert minecraft_launcher_lib._rules.compile_rule_list(rules) is minecraft_launcher_lib._rules.compile_rule_list(rules)  # type: ignore
+
+    # A other platform needs a new profile
+    monkeypatch.setattr(platform, "system", lambda: "Windows")
+    minecraft_launcher_lib._rules.reset_platform_profile()
+    assert minecraft_launcher_lib._helper.parse_rule_list(rules, {"demo": True}) is False  # type: ignore
+    assert minecraft_launcher_lib._helper.parse_rule_list([{"action": "disallow", "os": {"name": "linux"}}], {}) is True  # type: ignore
+
+
+def test_compiled_rules_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    monkeypatch.setattr(minecraft_launcher_lib._rules, "_MAX_COMPILED_RULES", 8)
+
+    # The caches are filled and cleared from multiple threads at the same time
+    def _compile(count: int) -> bool:
+        rules = [{"action": "allow", "os": {"name": "linux", "version": f"^{count % 20}"}}, {"action": "allow", "features": {"is_demo_user": True}}]
+        return minecraft_launcher_lib._rules.compile_rule_list(rules)({"demo": True})  # type: ignore
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_compile, range(2000)))
+
+    os_version = minecraft_launcher_lib._rules.get_platform_profile().os_version or ""
+    assert results == [re.match(f"^{i % 20}", os_version) is not None for i in range(2000)]
+
+
+def test_get_minecraft_command_jvm_preset(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    prepare_test_versions(tmp_path)
+    monkeypatch.setattr(minecraft_launcher_lib.java_utils, "get_host_resources", lambda: {"cpuCount": 4, "memoryTotal": 8 * 1024 ** 3, "cgroupCpuLimit": None, "cgroupMemoryLimit": None})
+
+    options: minecraft_launcher_lib.types.MinecraftOptions = {"executablePath": "java", "jvmPreset": "throughput", "jvmArguments": ["-Xmx2G", "-Dtest"]}
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path), options)
+
+    # test1 has no javaVersion, so the preset for Java 8 is used
+    assert command[1:6] == ["-XX:+UseParallelGC", "-XX:ParallelGCThreads=4", "-Xmx2G", "-Dtest", "-Djava.library.path=" + os.path.join(tmp_path, "versions", "test1", "natives")]
+
+
+def test_get_minecraft_command_class_data_archive(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    prepare_test_versions(tmp_path / "minecraft")
+
+    java_home = tmp_path / "java"
+    (java_home / "bin").mkdir(parents=True)
+    java_path = java_home / "bin" / "java"
+    java_path.touch(mode=0o755)
+    (java_home / "release").write_text('JAVA_VERSION="21.0.3"\n', encoding="utf-8")
+
+    options: minecraft_launcher_lib.types.MinecraftOptions = {"executablePath": str(java_path)}
+
+    # There is no archive yet
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)
+    assert not any(i.startswith("-XX:SharedArchiveFile=") or i.startswith("-XX:ArchiveClassesAtExit=") for i in command)
+
+    options["createClassDataArchive"] = True
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)
+    assert command[1].startswith("-XX:ArchiveClassesAtExit=")
+    archive_path = pathlib.Path(command[1].removeprefix("-XX:ArchiveClassesAtExit="))
+    assert archive_path.parent.is_dir()
+
+    # Simulate the JVM writing the archive
+    archive_path.write_bytes(b"archive")
+    del options["createClassDataArchive"]
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)
+    assert command[1] == f"-XX:SharedArchiveFile={archive_path}"
+
+    options["disableClassDataArchive"] = True
+    assert not minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)[1].startswith("-XX:SharedArchiveFile=")
+    del options["disableClassDataArchive"]
+
+    # A change of the launch plan invalidates the archive
+    version_json = tmp_path / "minecraft" / "versions" / "test1" / "test1.json"
+    version_json.write_text(version_json.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)
+    assert not command[1].startswith("-XX:SharedArchiveFile=")
+
+    # The Java installation is only looked up once per launch plan
+    def _fail_which(cmd: str) -> str:
+        raise AssertionError(f"{cmd} was looked up again")
+
+    with monkeypatch.context() as m:
+        m.setattr(shutil, "which", _fail_which)
+        assert not minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)[1].startswith("-XX:SharedArchiveFile=")
+
+    # A update of Java invalidates the archive
+    (java_home / "release").write_text('JAVA_VERSION="21.0.4"\n', encoding="utf-8")
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)
+    assert not command[1].startswith("-XX:SharedArchiveFile=")
+
+    # The outdated archive is removed, when a new one is created
+    options["createClassDataArchive"] = True
+    command = minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)
+    assert command[1].startswith("-XX:ArchiveClassesAtExit=")
+    assert command[1] != f"-XX:ArchiveClassesAtExit={archive_path}"
+    assert not archive_path.exists()
+
+    # Java 8 does not support dynamic archives
+    (java_home / "release").write_text('JAVA_VERSION="1.8.0_51"\n', encoding="utf-8")
+    assert not minecraft_launcher_lib.command.get_minecraft_command("test1", str(tmp_path / "minecraft"), options)[1].startswith("-XX:")
@@ -1,13 +1,18 @@
 # This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
 # SPDX-License-Identifier: BSD-2-Clause
-from ._test_helper import prepare_test_versions, prepare_requests_mock
+from ._test_helper import prepare_test_versions, prepare_requests_mock, get_test_callbacks, read_test_file
+from typing import Any
 import minecraft_launcher_lib
 import requests_mock
 import platform
+import threading
+import asyncio
 import hashlib
 import pathlib
 import pytest
+import json
+import time
 import os
 
 
@@ -99,8 +104,319 @@ def test_install_minecraft_version_invalid_checksum(monkeypatch: pytest.MonkeyPa
     with pytest.raises(minecraft_launcher_lib.exceptions.InvalidChecksum):
         minecraft_launcher_lib.install.install_minecraft_version("checksum", tmp_path)
 
+    # No temporary files should be left
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+def test_install_minecraft_version_resume(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    client_content = read_test_file("downloads/client.txt")
+    range_requests: list[str] = []
+    wrong_range = False
+
+    def _client_response(request: Any, context: Any) -> bytes:
+        if "Range" not in request.headers:
+            return client_content
+
+        range_requests.append(request.headers["Range"])
+        start = 0 if wrong_range else int(request.headers["Range"].removeprefix("bytes=").removesuffix("-"))
+        context.status_code = 206
+        context.headers["Content-Range"] = f"bytes {start}-{len(client_content) - 1}/{len(client_content)}"
+        return client_content[start:]
+
+    requests_mock.get("minecraft-launcher-lib-test://client.txt", content=_client_response)
+
+    # A valid partial file is resumed
+    client_jar = tmp_path / "versions" / "test1" / "test1.jar"
+    client_jar.parent.mkdir(parents=True, exist_ok=True)
+    (tmp_path / "versions" / "test1" / "test1.jar.part").write_bytes(client_content[:3])
+
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+
+    assert range_requests == ["bytes=3-"]
+    _assert_downloaded_file(client_jar, 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+    assert list(tmp_path.rglob("*.part")) == []
+
+    # A broken partial file is detected by the checksum and the file is downloaded again
+    range_requests.clear()
+    client_jar.unlink()
+    (tmp_path / "versions" / "test1" / "test1.jar.part").write_bytes(b"abc")
+
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+
+    assert range_requests == ["bytes=3-"]
+    _assert_downloaded_file(client_jar, 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+    assert list(tmp_path.rglob("*.part")) == []
+
+    # A partial response that doesn't start at the requested offset restarts the download
+    range_requests.clear()
+    wrong_range = True
+    client_jar.unlink()
+    (tmp_path / "versions" / "test1" / "test1.jar.part").write_bytes(client_content[:3])
+
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+
+    assert range_requests == ["bytes=3-"]
+    _assert_downloaded_file(client_jar, 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+    assert list(tmp_path.rglob("*.part")) == []
+
 
 def test_install_minecraft_version_invalid_version(tmp_path: pathlib.Path) -> None:
     # Checks if the VersionNotFound exception raised
     with pytest.raises(minecraft_launcher_lib.exceptions.VersionNotFound):
         minecraft_launcher_lib.install.install_minecraft_version("InvalidVersion", str(tmp_path))
+
+
+def test_install_minecraft_version_verification_index(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+
+    assert (tmp_path / "minecraft-launcher-lib" / "verification_index.json").is_file()
+
+    # Unchanged files must not be hashed again
+    def _fail_hash(path: str) -> str:
+        raise AssertionError(f"{path} was hashed again")
+
+    monkeypatch.setattr(minecraft_launcher_lib._helper, "get_sha1_hash", _fail_hash)
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+    monkeypatch.undo()
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    # A changed file is hashed and repaired
+    client_jar = tmp_path / "versions" / "test1" / "test1.jar"
+    client_jar.write_text("changed file")
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+    _assert_downloaded_file(client_jar, 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+
+
+def test_verification_index_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(minecraft_launcher_lib._verification_index, "_index_cache", minecraft_launcher_lib._verification_index.OrderedDict())
+    monkeypatch.setattr(minecraft_launcher_lib._verification_index, "_MAX_CACHED_INDEXES", 2)
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "test.txt").write_text("test")
+
+    index = minecraft_launcher_lib._verification_index.get_verification_index(tmp_path / "a")
+    index.update(tmp_path / "a" / "test.txt", "a94a8fe5ccb19ba61c4c0873d391e987982fbbd3")
+    assert minecraft_launcher_lib._verification_index.get_verification_index(tmp_path / "a") is index
+
+    minecraft_launcher_lib._verification_index.get_verification_index(tmp_path / "b")
+    minecraft_launcher_lib._verification_index.get_verification_index(tmp_path / "c")
+
+    # The least recently used index is saved when it is dropped
+    assert len(minecraft_launcher_lib._verification_index._index_cache) == 2
+    assert (tmp_path / "a" / "minecraft-launcher-lib" / "verification_index.json").is_file()
+
+    new_index = minecraft_launcher_lib._verification_index.get_verification_index(tmp_path / "a")
+    assert new_index is not index
+    assert new_index.lookup(tmp_path / "a" / "test.txt") == "a94a8fe5ccb19ba61c4c0873d391e987982fbbd3"
+
+
+def test_install_minecraft_version_async(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    asyncio.run(minecraft_launcher_lib.install.install_minecraft_version_async("inherit", tmp_path, callback=get_test_callbacks(), max_concurrency=2))
+
+    _assert_downloaded_file(tmp_path / "libraries" / "ca" / "weblite" / "java-objc-bridge" / "1.1" / "java-objc-bridge-1.1.jar", 25, "2f8a26755f00bc8dc54cbf5e613f6d00f02a099e")
+    _assert_downloaded_file(tmp_path / "libraries" / "com" / "ibm" / "icu" / "icu4j" / "71.1" / "icu4j-71.1.jar", 14, "78ef2a15d1afad3e435cdcaf12c502ac290ca707")
+    _assert_downloaded_file(tmp_path / "assets" / "log_configs" / "client-1.12.xml", 888, "bd65e7d2e3c237be76cfbef4c2405033d7f91521")
+    _assert_downloaded_file(tmp_path / "versions" / "inherit" / "inherit.jar", 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+    _assert_downloaded_file(tmp_path / "versions" / "test1" / "test1.jar", 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+
+    asyncio.run(minecraft_launcher_lib.install.install_minecraft_version_async("assets", tmp_path))
+    assert len(os.listdir(tmp_path / "assets" / "objects")) == 3
+
+    asyncio.run(minecraft_launcher_lib.install.install_minecraft_version_async("runtime", tmp_path))
+    assert (tmp_path / "runtime" / "java-runtime-test" / "linux" / ".version").read_text().strip() == "17.0.3"
+
+    with pytest.raises(minecraft_launcher_lib.exceptions.InvalidChecksum):
+        asyncio.run(minecraft_launcher_lib.install.install_minecraft_version_async("checksum", tmp_path))
+
+
+def test_run_download_jobs_async_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    def _run_download_job(job: Any, *args: Any) -> None:
+        if job["url"] == "slow":
+            time.sleep(2)
+        else:
+            raise ValueError(job["url"])
+
+    monkeypatch.setattr(minecraft_launcher_lib._download_scheduler, "run_download_job", _run_download_job)
+
+    async def _run() -> int:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(_ticker())
+        with pytest.raises(ValueError):
+            await minecraft_launcher_lib._download_scheduler.run_download_jobs_async([{"url": "slow", "path": "slow"}, {"url": "broken", "path": "broken"}], tmp_path, {}, max_concurrency=2)
+
+        # The loop is still running while the slow download finishes in the background
+        await asyncio.sleep(0.1)
+        ticker.cancel()
+        return ticks
+
+    start = time.monotonic()
+    assert asyncio.run(_run()) > 0
+    assert time.monotonic() - start < 1.5
+
+
+def test_install_minecraft_version_single_scheduler_run(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    scheduler_runs: list[list[str]] = []
+    original_run_download_jobs = minecraft_launcher_lib.install.run_download_jobs
+
+    def _run_download_jobs(jobs, minecraft_directory, callback, max_workers=None) -> None:
+        scheduler_runs.append([job["path"] for job in jobs])
+        original_run_download_jobs(jobs, minecraft_directory, callback, max_workers=max_workers)
+
+    monkeypatch.setattr(minecraft_launcher_lib.install, "run_download_jobs", _run_download_jobs)
+
+    minecraft_launcher_lib.install.install_minecraft_version("runtime", tmp_path, max_workers=4)
+
+    # Client, libraries and the java runtime are downloaded in the same run
+    assert len(scheduler_runs) == 1
+    assert any(path.startswith(os.path.join(str(tmp_path), "versions")) for path in scheduler_runs[0])
+    assert any(os.path.join("runtime", "java-runtime-test") in path for path in scheduler_runs[0])
+    assert len(scheduler_runs[0]) == len(set(scheduler_runs[0]))
+
+
+def test_install_minecraft_versions(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    scheduler_runs: list[list[str]] = []
+    original_run_download_jobs = minecraft_launcher_lib.install.run_download_jobs
+
+    def _run_download_jobs(jobs, minecraft_directory, callback, max_workers=None) -> None:
+        scheduler_runs.append([job["path"] for job in jobs])
+        original_run_download_jobs(jobs, minecraft_directory, callback, max_workers=max_workers)
+
+    monkeypatch.setattr(minecraft_launcher_lib.install, "run_download_jobs", _run_download_jobs)
+
+    minecraft_launcher_lib.install.install_minecraft_versions(["test1", "test2", "inherit", "test1"], tmp_path)
+
+    # All versions are downloaded in the same run and every file is only downloaded once
+    assert len(scheduler_runs) == 1
+    assert len(scheduler_runs[0]) == len(set(scheduler_runs[0]))
+
+    _assert_downloaded_file(tmp_path / "versions" / "test1" / "test1.jar", 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+    _assert_downloaded_file(tmp_path / "libraries" / "ca" / "weblite" / "java-objc-bridge" / "1.1" / "java-objc-bridge-1.1.jar", 25, "2f8a26755f00bc8dc54cbf5e613f6d00f02a099e")
+    assert (tmp_path / "libraries" / "com" / "ibm" / "icu" / "icu4j" / "71.1" / "icu4j-71.1.jar").is_file()
+
+    with pytest.raises(minecraft_launcher_lib.exceptions.VersionNotFound):
+        minecraft_launcher_lib.install.install_minecraft_versions(["test1", "InvalidVersion"], tmp_path)
+
+    # A file that is needed with different checksums can't be installed
+    conflict_data = json.loads((tmp_path / "versions" / "test1" / "test1.json").read_text(encoding="utf-8"))
+    conflict_data["id"] = "conflict"
+    conflict_data["libraries"][0]["downloads"]["artifact"]["sha1"] = "0" * 40
+    (tmp_path / "versions" / "conflict").mkdir()
+    (tmp_path / "versions" / "conflict" / "conflict.json").write_text(json.dumps(conflict_data), encoding="utf-8")
+    with pytest.raises(ValueError):
+        minecraft_launcher_lib.install.install_minecraft_versions(["test1", "conflict"], tmp_path)
+
+
+def test_install_plan(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path / "first")
+    prepare_test_versions(tmp_path / "second")
+    prepare_requests_mock(requests_mock)
+
+    existing_files = sorted(tmp_path.rglob("*"))
+    plan = minecraft_launcher_lib.install.get_install_plan("test1", tmp_path / "first")
+
+    # A dry run must not write anything
+    assert sorted(tmp_path.rglob("*")) == existing_files
+
+    files = {i["path"]: i for i in plan["files"]}
+    assert files["versions/test1/test1.jar"]["url"] == "minecraft-launcher-lib-test://client.txt"
+    assert files["versions/test1/test1.jar"]["sha1"] == "173219a75174abb3e3a7bfd36148129df03f9123"
+    assert files["versions/test1/test1.jar"]["size"] == 7
+    assert "assets/log_configs/client-1.12.xml" in files
+    assert not any(i["satisfied"] for i in plan["files"])
+    assert plan["downloadSize"] == plan["totalSize"]
+
+    # The lockfile can be installed into another directory
+    minecraft_launcher_lib.install.save_install_plan(plan, tmp_path / "test1.lock")
+    loaded_plan = minecraft_launcher_lib.install.load_install_plan(tmp_path / "test1.lock")
+    assert loaded_plan == plan
+
+    minecraft_launcher_lib.install.install_from_plan(loaded_plan, tmp_path / "second")
+    _assert_downloaded_file(tmp_path / "second" / "versions" / "test1" / "test1.jar", 7, "173219a75174abb3e3a7bfd36148129df03f9123")
+    _assert_downloaded_file(tmp_path / "second" / "assets" / "log_configs" / "client-1.12.xml", 888, "bd65e7d2e3c237be76cfbef4c2405033d7f91521")
+
+    # After the install everything is satisfied
+    plan = minecraft_launcher_lib.install.get_install_plan("test1", tmp_path / "second")
+    assert all(i["satisfied"] for i in plan["files"])
+    assert plan["downloadSize"] == 0
+
+    # Paths outside the Minecraft directory are not allowed
+    plan["files"][0]["path"] = "../outside.txt"
+    with pytest.raises(minecraft_launcher_lib.exceptions.FileOutsideMinecraftDirectory):
+        minecraft_launcher_lib.install.install_from_plan(plan, tmp_path / "second")
+
+    (tmp_path / "invalid.lock").write_text("{}")
+    with pytest.raises(ValueError):
+        minecraft_launcher_lib.install.load_install_plan(tmp_path / "invalid.lock")
+
+
+def test_install_minecraft_version_progress_event(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    events: list[minecraft_launcher_lib.types.ProgressEvent] = []
+    callback_lock = threading.Lock()
+
+    def _progress_event(event: minecraft_launcher_lib.types.ProgressEvent) -> None:
+        # The events must never be sent at the same time
+        assert callback_lock.acquire(blocking=False)
+        events.append(event)
+        callback_lock.release()
+
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path, callback={"progressEvent": _progress_event, "progressEventInterval": 0})
+
+    assert len(events) > 1
+    assert events[-1]["finished"] is True
+    assert events[-1]["bytesDone"] == events[-1]["bytesTotal"]
+    assert events[-1]["filesDone"] == events[-1]["filesTotal"]
+    assert events[-1]["eta"] == 0
+    assert events[-1]["phases"]["client"]["bytesDone"] == events[-1]["phases"]["client"]["bytesTotal"]
+    assert "libraries" in events[-1]["phases"]
+    assert all(a["bytesDone"] <= b["bytesDone"] for a, b in zip(events, events[1:]))
+
+    # With a long interval only the first and the last event are sent
+    events.clear()
+    prepare_test_versions(tmp_path / "second")
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path / "second", callback={"progressEvent": _progress_event, "progressEventInterval": 1000})
+    assert len(events) == 2
+    assert events[-1]["finished"] is True
+
+
+def test_sort_download_jobs() -> None:
+    jobs = [{"url": "a", "path": "a", "size": 1}, {"url": "b", "path": "b"}, {"url": "c", "path": "c", "size": 100}]
+    assert [job["url"] for job in minecraft_launcher_lib._download_scheduler.sort_download_jobs(jobs)] == ["c", "a", "b"]
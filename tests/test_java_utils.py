@@ -90,3 +90,57 @@ def test_find_system_java_versions_information(monkeypatch: pytest.MonkeyPatch,
     (tmp_path / "testjava" / "bin" / "java").touch()
 
     minecraft_launcher_lib.java_utils.find_system_java_versions_information(additional_directories=[tmp_path])
+
+
+def test_get_jvm_preset_arguments() -> None:
+    resources: minecraft_launcher_lib.types.HostResources = {"cpuCount": 8, "memoryTotal": 16 * 1024 ** 3, "cgroupCpuLimit": None, "cgroupMemoryLimit": None}
+
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("balanced", 21, resources) == ["-Xmx4096M", "-XX:+UnlockExperimentalVMOptions", "-XX:+UseG1GC", "-XX:G1NewSizePercent=20", "-XX:G1ReservePercent=20", "-XX:MaxGCPauseMillis=50", "-XX:G1HeapRegionSize=32M"]
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("low-latency", 21, resources) == ["-Xmx4096M", "-Xms4096M", "-XX:+UseZGC", "-XX:+ZGenerational", "-XX:+DisableExplicitGC", "-XX:+AlwaysPreTouch"]
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("low-latency", 25, resources)[2:4] == ["-XX:+UseZGC", "-XX:+DisableExplicitGC"]
+    assert "-XX:+UseG1GC" in minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("low-latency", 17, resources)
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("throughput", 8, resources) == ["-Xmx8192M", "-XX:+UseParallelGC", "-XX:ParallelGCThreads=8"]
+
+    # The cgroup limits are lower than the resources of the host
+    resources["cgroupCpuLimit"] = 1.5
+    resources["cgroupMemoryLimit"] = 3 * 1024 ** 3
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("throughput", 17, resources) == ["-Xmx1536M", "-XX:ActiveProcessorCount=2", "-XX:+UseParallelGC", "-XX:ParallelGCThreads=2"]
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("throughput", 8, resources) == ["-Xmx1536M", "-XX:+UseParallelGC", "-XX:ParallelGCThreads=2"]
+
+    resources["cgroupCpuLimit"] = 0.5
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("balanced", 17, resources) == ["-Xmx1536M", "-XX:ActiveProcessorCount=1", "-XX:+UseSerialGC"]
+
+    # Unknown memory
+    assert minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("balanced", 17, {"cpuCount": 4, "memoryTotal": None, "cgroupCpuLimit": None, "cgroupMemoryLimit": None})[0] == "-Xmx2048M"
+
+    with pytest.raises(ValueError):
+        minecraft_launcher_lib.java_utils.get_jvm_preset_arguments("test", 17, resources)  # type: ignore
+
+
+def test_merge_jvm_arguments() -> None:
+    preset = ["-Xmx4096M", "-Xms4096M", "-XX:+UnlockExperimentalVMOptions", "-XX:+UseG1GC", "-XX:G1NewSizePercent=20", "-XX:MaxGCPauseMillis=50", "-XX:+AlwaysPreTouch"]
+
+    assert minecraft_launcher_lib.java_utils.merge_jvm_arguments(preset, []) == preset
+    assert minecraft_launcher_lib.java_utils.merge_jvm_arguments(preset, ["-Xmx2G", "-Dtest=1"]) == ["-XX:+UnlockExperimentalVMOptions", "-XX:+UseG1GC", "-XX:G1NewSizePercent=20", "-XX:MaxGCPauseMillis=50", "-XX:+AlwaysPreTouch", "-Xmx2G", "-Dtest=1"]
+    assert minecraft_launcher_lib.java_utils.merge_jvm_arguments(preset, ["-XX:-AlwaysPreTouch", "-XX:MaxGCPauseMillis=100"]) == ["-Xmx4096M", "-Xms4096M", "-XX:+UnlockExperimentalVMOptions", "-XX:+UseG1GC", "-XX:G1NewSizePercent=20", "-XX:-AlwaysPreTouch", "-XX:MaxGCPauseMillis=100"]
+    assert minecraft_launcher_lib.java_utils.merge_jvm_arguments(preset, ["-XX:+UseShenandoahGC"]) == ["-Xmx4096M", "-Xms4096M", "-XX:+UnlockExperimentalVMOptions", "-XX:MaxGCPauseMillis=50", "-XX:+AlwaysPreTouch", "-XX:+UseShenandoahGC"]
+
+    # All tuning arguments of the G1 preset are removed, if the user selects another garbage collector
+    for user_gc in ("-XX:+UseZGC", "-XX:+UseParallelGC"):
+        merged = minecraft_launcher_lib.java_utils.merge_jvm_arguments(minecraft_launcher_lib.java_utils._LOW_LATENCY_G1_ARGUMENTS, [user_gc])
+        assert merged == ["-XX:+UnlockExperimentalVMOptions", "-XX:+ParallelRefProcEnabled", "-XX:MaxGCPauseMillis=50", "-XX:+DisableExplicitGC", user_gc]
+
+
+def test_read_cgroup_limits(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "proc_cgroup").write_text("0::/user.slice/minecraft\n", encoding="utf-8")
+    (tmp_path / "user.slice" / "minecraft").mkdir(parents=True)
+    (tmp_path / "user.slice" / "cpu.max").write_text("200000 100000\n", encoding="utf-8")
+    (tmp_path / "user.slice" / "memory.max").write_text("max\n", encoding="utf-8")
+    (tmp_path / "user.slice" / "minecraft" / "cpu.max").write_text("max 100000\n", encoding="utf-8")
+    (tmp_path / "user.slice" / "minecraft" / "memory.max").write_text("2147483648\n", encoding="utf-8")
+
+    assert minecraft_launcher_lib.java_utils._read_cgroup_limits(str(tmp_path), str(tmp_path / "proc_cgroup")) == (2.0, 2147483648)
+    assert minecraft_launcher_lib.java_utils._read_cgroup_limits(str(tmp_path), str(tmp_path / "invalid")) == (None, None)
+
+    resources = minecraft_launcher_lib.java_utils.get_host_resources()
+    assert resources["cpuCount"] >= 1
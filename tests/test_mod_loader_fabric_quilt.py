@@ -9,6 +9,7 @@ import requests_mock
 import platform
 import pathlib
 import pytest
+import asyncio
 import shutil
 
 
@@ -119,6 +120,11 @@ def test_mod_loader_fabric_quilt_install(loader_id: str, monkeypatch: pytest.Mon
         fabric.install("test1", tmp_path, callback=get_test_callbacks())
         assert fp.call_count(["java", fp.any()]) == 1
 
+    with subtests.test("InstallAsync"):
+        fp.register(["java", fp.any()])
+        assert asyncio.run(fabric.install_async("test1", tmp_path, callback=get_test_callbacks())) == f"{loader_id}-loader-testloader-test1"
+        assert fp.call_count(["java", fp.any()]) == 2
+
     with subtests.test("VersionNotFound"):
         with pytest.raises(minecraft_launcher_lib.exceptions.VersionNotFound):
             fabric.install("invalid", tmp_path)
@@ -169,6 +169,14 @@ def test_install_mrpack(monkeypatch: pytest.MonkeyPatch, subtests: pytest_subtes
         assert sorted(os.listdir(modpack_dir)) == sorted(["a.txt", "b.txt"])
         assert not os.path.isdir(test_dir)
 
+    with subtests.test("Invalid sha512"):
+        test_dir = tmp_path / "InvalidSha512"
+        sha512_index = copy.deepcopy(index)
+        sha512_index["files"][0]["hashes"]["sha512"] = "invalid"
+        with pytest.raises(minecraft_launcher_lib.exceptions.InvalidChecksum):
+            minecraft_launcher_lib.mrpack.install_mrpack(_create_test_index_pack(sha512_index, tmp_path / "InvalidSha512.mrpack"), test_dir, mrpack_install_options={"skipDependenciesInstall": True})
+        assert os.listdir(test_dir) == []
+
     with subtests.test("Forge"):
         monkeypatch.setattr(platform, "system", lambda: "Linux")
         monkeypatch.setattr(platform, "architecture", lambda: ("64bit", "ELF"))
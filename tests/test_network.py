@@ -0,0 +1,337 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+from ._test_helper import prepare_test_versions, prepare_requests_mock
+from typing import Any
+import concurrent.futures
+import minecraft_launcher_lib
+import requests_mock
+import threading
+import requests
+import platform
+import pathlib
+import pytest
+import json
+import time
+import re
+
+
+def _get_pool_size(session: requests.sessions.Session) -> int:
+    return session.get_adapter("https://libraries.minecraft.net")._pool_maxsize  # type: ignore
+
+
+def test_max_connections() -> None:
+    try:
+        minecraft_launcher_lib.network.set_max_connections(50)
+        assert minecraft_launcher_lib.network.get_max_connections() == 50
+
+        session = minecraft_launcher_lib.network.get_session()
+        assert _get_pool_size(session) == 50
+        assert minecraft_launcher_lib.network.get_session() is session
+
+        # A larger pool is created, if more connections are needed
+        assert _get_pool_size(minecraft_launcher_lib.network.get_session(100)) == 100
+
+        with pytest.raises(ValueError):
+            minecraft_launcher_lib.network.set_max_connections(0)
+    finally:
+        minecraft_launcher_lib.network.set_max_connections(None)
+
+    assert minecraft_launcher_lib.network.get_max_connections() >= 1
+
+
+def test_shared_session(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path)
+    prepare_requests_mock(requests_mock)
+
+    created_sessions = []
+    original_session = requests.session
+
+    def _session() -> requests.sessions.Session:
+        session = original_session()
+        created_sessions.append(session)
+        return session
+
+    minecraft_launcher_lib.network.close_session()
+    monkeypatch.setattr(requests, "session", _session)
+
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+    minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path)
+
+    # Both installs must use the same shared session
+    assert len(created_sessions) == 1
+
+
+def test_retry(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    minecraft_launcher_lib.network.set_retry_policy({"attempts": 3, "backoffFactor": 0, "jitter": False})
+    try:
+        # A transient error is retried
+        requests_mock.get("minecraft-launcher-lib-test://retry.txt", [{"status_code": 503, "headers": {"Retry-After": "0"}}, {"content": b"Hello World"}])
+        assert minecraft_launcher_lib._helper.download_file("minecraft-launcher-lib-test://retry.txt", str(tmp_path / "retry.txt"), sha1="0a4d55a8d778e5022fab701977c5d840bbc486d0") is True
+        assert (tmp_path / "retry.txt").read_bytes() == b"Hello World"
+        assert requests_mock.call_count == 2
+
+        # The error is raised, if all attempts failed
+        requests_mock.get("minecraft-launcher-lib-test://broken.txt", status_code=500)
+        with pytest.raises(requests.exceptions.HTTPError):
+            minecraft_launcher_lib._helper.download_file("minecraft-launcher-lib-test://broken.txt", str(tmp_path / "broken.txt"))
+        assert not (tmp_path / "broken.txt").exists()
+
+        # Other status codes are not retried
+        requests_mock.reset_mock()
+        requests_mock.get("minecraft-launcher-lib-test://missing.txt", status_code=404)
+        assert minecraft_launcher_lib._helper.download_file("minecraft-launcher-lib-test://missing.txt", str(tmp_path / "missing.txt")) is False
+        assert requests_mock.call_count == 1
+
+        # Timeouts are passed to every request and retried
+        minecraft_launcher_lib.network.set_retry_policy({"attempts": 3, "backoffFactor": 0, "jitter": False, "connectTimeout": 2, "readTimeout": 5})
+        requests_mock.reset_mock()
+        requests_mock.get("minecraft-launcher-lib-test://timeout.txt", [{"exc": requests.exceptions.ReadTimeout}, {"content": b"Hello World"}])
+        assert minecraft_launcher_lib._helper.download_file("minecraft-launcher-lib-test://timeout.txt", str(tmp_path / "timeout.txt"), sha1="0a4d55a8d778e5022fab701977c5d840bbc486d0") is True
+        assert [i.timeout for i in requests_mock.request_history] == [(2, 5), (2, 5)]
+
+        requests_mock.reset_mock()
+        assert minecraft_launcher_lib._retry.get_with_retry("minecraft-launcher-lib-test://retry.txt").content == b"Hello World"
+        assert requests_mock.request_history[0].timeout == (2, 5)
+
+        with pytest.raises(ValueError):
+            minecraft_launcher_lib.network.set_retry_policy({"readTimeout": 0})
+    finally:
+        minecraft_launcher_lib.network.set_retry_policy({})
+
+
+def test_mirrors(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    minecraft_launcher_lib.network.set_retry_policy({"attempts": 2, "backoffFactor": 0})
+    minecraft_launcher_lib.network.set_mirrors("libraries.minecraft.net", ["https://mirror.example.com/libraries/"])
+    try:
+        assert minecraft_launcher_lib.network.get_mirror_urls("https://libraries.minecraft.net/test/test.jar") == ["https://libraries.minecraft.net/test/test.jar", "https://mirror.example.com/libraries/test/test.jar"]
+
+        requests_mock.get("https://libraries.minecraft.net/test/test.jar", status_code=502)
+        requests_mock.get("https://mirror.example.com/libraries/test/test.jar", content=b"Hello World")
+
+        assert minecraft_launcher_lib._helper.download_file("https://libraries.minecraft.net/test/test.jar", str(tmp_path / "test.jar"), sha1="0a4d55a8d778e5022fab701977c5d840bbc486d0") is True
+        assert (tmp_path / "test.jar").read_bytes() == b"Hello World"
+        assert [request.hostname for request in requests_mock.request_history] == ["libraries.minecraft.net", "libraries.minecraft.net", "mirror.example.com"]
+    finally:
+        minecraft_launcher_lib.network.set_mirrors("libraries.minecraft.net", [])
+        minecraft_launcher_lib.network.set_retry_policy({})
+
+    assert minecraft_launcher_lib.network.get_mirrors("libraries.minecraft.net") == []
+
+
+def test_get_retry_delay() -> None:
+    policy: minecraft_launcher_lib.types.RetryPolicy = {"backoffFactor": 1, "maxBackoff": 5, "jitter": False}
+
+    assert minecraft_launcher_lib._retry.get_retry_delay(policy, 1, None) == 1
+    assert minecraft_launcher_lib._retry.get_retry_delay(policy, 3, None) == 4
+    assert minecraft_launcher_lib._retry.get_retry_delay(policy, 10, None) == 5
+    assert minecraft_launcher_lib._retry.get_retry_delay(policy, 1, 3) == 3
+    assert minecraft_launcher_lib._retry.get_retry_delay(policy, 1, 100) == 5
+
+    assert minecraft_launcher_lib._retry.parse_retry_after("12") == 12
+    assert minecraft_launcher_lib._retry.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert minecraft_launcher_lib._retry.parse_retry_after("invalid") is None
+    assert minecraft_launcher_lib._retry.parse_retry_after(None) is None
+
+    with pytest.raises(ValueError):
+        minecraft_launcher_lib.network.set_retry_policy({"attempts": 0})
+
+
+def test_bandwidth_limit(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    sleep_times: list[float] = []
+    monkeypatch.setattr(minecraft_launcher_lib._throttle.time, "sleep", lambda seconds: sleep_times.append(seconds))
+
+    minecraft_launcher_lib.network.set_bandwidth_limit(1000)
+    try:
+        assert minecraft_launcher_lib.network.get_bandwidth_limit() == 1000
+
+        requests_mock.get("minecraft-launcher-lib-test://large.bin", content=b"a" * 3000)
+        assert minecraft_launcher_lib._helper.download_file("minecraft-launcher-lib-test://large.bin", str(tmp_path / "large.bin")) is True
+
+        # The bucket starts with 1000 tokens, so the remaining 2000 bytes need 2 seconds
+        assert sum(sleep_times) == pytest.approx(2, abs=0.1)
+        assert (tmp_path / "large.bin").read_bytes() == b"a" * 3000
+
+        with pytest.raises(ValueError):
+            minecraft_launcher_lib.network.set_bandwidth_limit(0)
+    finally:
+        minecraft_launcher_lib.network.set_bandwidth_limit(None)
+
+    assert minecraft_launcher_lib.network.get_bandwidth_limit() is None
+
+
+def test_host_connection_limit(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def _response(request: Any, context: Any) -> bytes:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return b"Hello World"
+
+    requests_mock.get(re.compile("https://resources.download.minecraft.net/.*"), content=_response)
+
+    minecraft_launcher_lib.network.set_host_connection_limit("resources.download.minecraft.net", 2)
+    try:
+        assert minecraft_launcher_lib.network.get_host_connection_limit("resources.download.minecraft.net") == 2
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(minecraft_launcher_lib._helper.download_file, f"https://resources.download.minecraft.net/{i}", str(tmp_path / str(i))) for i in range(16)]
+            for future in futures:
+                future.result()
+
+        assert max_running <= 2
+    finally:
+        minecraft_launcher_lib.network.set_host_connection_limit("resources.download.minecraft.net", None)
+
+    assert minecraft_launcher_lib.network.get_host_connection_limit("resources.download.minecraft.net") is None
+
+
+def test_metadata_cache(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    url = "https://meta.example.com/versions.json"
+    etag_requests = []
+
+    def _response(request: Any, context: Any) -> bytes:
+        etag_requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            return b""
+        context.headers["ETag"] = '"v1"'
+        return b'{"hello": "world"}'
+
+    requests_mock.get(url, content=_response)
+
+    minecraft_launcher_lib.network.set_metadata_cache_directory(tmp_path / "cache")
+    try:
+        assert minecraft_launcher_lib.network.get_metadata_cache_directory() == str(tmp_path / "cache")
+
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+        assert minecraft_launcher_lib._helper.get_cached_json(url) == {"hello": "world"}
+
+        # The disk cache is used within the TTL, like after a restart
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+        assert minecraft_launcher_lib._helper.get_cached_json(url) == {"hello": "world"}
+        assert etag_requests == [None]
+
+        # The entry in memory expires together with the entry on disk
+        info_path = minecraft_launcher_lib._metadata_cache._get_disk_cache_paths(str(tmp_path / "cache"), url)[0]
+        with open(info_path, "r", encoding="utf-8") as f:
+            fetched = json.load(f)["fetched"]
+        assert minecraft_launcher_lib._metadata_cache._memory_cache[(url, "json")]["time"] == fetched
+
+        # After the TTL the entry is revalidated
+        minecraft_launcher_lib.network.set_metadata_cache_ttl(0)
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+        assert minecraft_launcher_lib._helper.get_cached_json(url) == {"hello": "world"}
+        assert etag_requests == [None, '"v1"']
+
+        # A outdated entry is used, if the server can't be reached
+        requests_mock.get(url, exc=requests.exceptions.ConnectionError)
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+        assert minecraft_launcher_lib._helper.get_cached_json(url) == {"hello": "world"}
+
+        with pytest.raises(ValueError):
+            minecraft_launcher_lib.network.set_metadata_cache_ttl(-1)
+    finally:
+        minecraft_launcher_lib.network.set_metadata_cache_directory(None)
+        minecraft_launcher_lib.network.set_metadata_cache_ttl(3600)
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
+    assert minecraft_launcher_lib.network.get_metadata_cache_directory() is None
+
+
+def test_metadata_memory_cache(requests_mock: requests_mock.Mocker) -> None:
+    def _response(request: Any, context: Any) -> bytes:
+        time.sleep(0.05)
+        return b'{"hello": "world"}'
+
+    requests_mock.get(re.compile("https://meta.example.com/.*"), content=_response)
+    minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
+    try:
+        # Concurrent misses for the same URL only send one request
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: minecraft_launcher_lib._helper.get_cached_json("https://meta.example.com/a.json"), range(8)))
+
+        assert requests_mock.call_count == 1
+        assert all(i == {"hello": "world"} for i in results)
+
+        # The parsed content is larger than the downloaded file
+        size = minecraft_launcher_lib._metadata_cache.estimate_size({"hello": "world"})
+        assert size > len(b'{"hello": "world"}')
+
+        # The least recently used entry is removed, if the limit is reached
+        minecraft_launcher_lib.network.set_metadata_cache_memory_limit(size * 2 + size // 2)
+        assert minecraft_launcher_lib.network.get_metadata_cache_memory_limit() == size * 2 + size // 2
+
+        minecraft_launcher_lib._helper.get_cached_json("https://meta.example.com/b.json")
+        minecraft_launcher_lib._helper.get_cached_json("https://meta.example.com/c.json")
+        assert requests_mock.call_count == 3
+
+        minecraft_launcher_lib._helper.get_cached_json("https://meta.example.com/c.json")
+        assert requests_mock.call_count == 3
+
+        minecraft_launcher_lib._helper.get_cached_json("https://meta.example.com/a.json")
+        assert requests_mock.call_count == 4
+
+        with pytest.raises(ValueError):
+            minecraft_launcher_lib.network.set_metadata_cache_memory_limit(-1)
+    finally:
+        minecraft_launcher_lib.network.set_metadata_cache_memory_limit(32 * 1024 * 1024)
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
+
+def test_offline_mode(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path / "minecraft")
+    prepare_requests_mock(requests_mock)
+
+    minecraft_launcher_lib.network.set_metadata_cache_directory(tmp_path / "cache")
+    try:
+        minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path / "minecraft")
+        minecraft_launcher_lib.utils.get_version_list()
+
+        minecraft_launcher_lib.network.set_offline_mode(True)
+        assert minecraft_launcher_lib.network.is_offline_mode() is True
+
+        # Everything is answered from the disk cache and the Minecraft directory
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+        requests_mock.reset_mock()
+
+        minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path / "minecraft")
+        assert minecraft_launcher_lib.utils.is_version_valid("test1", tmp_path / "minecraft") is True
+        assert len(minecraft_launcher_lib.utils.get_version_list()) > 0
+        assert requests_mock.call_count == 0
+
+        # Things that are not available locally fail without sending a request
+        with pytest.raises(minecraft_launcher_lib.exceptions.NotAvailableOffline):
+            minecraft_launcher_lib.mod_loader.get_mod_loader("fabric").get_minecraft_versions(False)
+
+        minecraft_launcher_lib.network.set_metadata_cache_directory(None)
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
+        assert minecraft_launcher_lib.utils.is_version_valid("test1", tmp_path / "minecraft") is True
+        assert minecraft_launcher_lib.utils.is_version_valid("test2", tmp_path / "other") is False
+
+        with pytest.raises(minecraft_launcher_lib.exceptions.NotAvailableOffline):
+            minecraft_launcher_lib.utils.get_version_list()
+
+        with pytest.raises(minecraft_launcher_lib.exceptions.NotAvailableOffline):
+            minecraft_launcher_lib.install.install_minecraft_version("test2", tmp_path / "other")
+
+        assert requests_mock.call_count == 0
+    finally:
+        minecraft_launcher_lib.network.set_offline_mode(False)
+        minecraft_launcher_lib.network.set_metadata_cache_directory(None)
+        minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
+    assert minecraft_launcher_lib.network.is_offline_mode() is False
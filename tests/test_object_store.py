@@ -0,0 +1,56 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+from ._test_helper import prepare_test_versions, prepare_requests_mock
+import minecraft_launcher_lib
+import requests_mock
+import platform
+import pathlib
+import pytest
+import os
+
+
+def test_object_store(monkeypatch: pytest.MonkeyPatch, requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+
+    prepare_test_versions(tmp_path / "first")
+    prepare_test_versions(tmp_path / "second")
+    prepare_requests_mock(requests_mock)
+
+    minecraft_launcher_lib.object_store.set_object_store(tmp_path / "store")
+    try:
+        assert minecraft_launcher_lib.object_store.get_object_store() == str(tmp_path / "store")
+
+        minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path / "first")
+
+        # The client jar is in the object store
+        assert (tmp_path / "store" / "objects" / "17" / "173219a75174abb3e3a7bfd36148129df03f9123").is_file()
+
+        requests_mock.reset_mock()
+        minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path / "second")
+
+        # Nothing needs to be downloaded for the second directory
+        assert requests_mock.call_count == 0
+
+        client_jar = pathlib.Path("versions", "test1", "test1.jar")
+        assert (tmp_path / "second" / client_jar).read_bytes() == (tmp_path / "first" / client_jar).read_bytes()
+        assert os.path.samefile(tmp_path / "second" / client_jar, tmp_path / "store" / "objects" / "17" / "173219a75174abb3e3a7bfd36148129df03f9123")
+
+        # A broken object is not linked, but downloaded again
+        object_path = tmp_path / "store" / "objects" / "17" / "173219a75174abb3e3a7bfd36148129df03f9123"
+        content = object_path.read_bytes()
+        object_path.write_bytes(b"broken")
+        prepare_test_versions(tmp_path / "third")
+        requests_mock.reset_mock()
+        minecraft_launcher_lib.install.install_minecraft_version("test1", tmp_path / "third")
+        assert requests_mock.call_count != 0
+        assert (tmp_path / "third" / client_jar).read_bytes() == content
+        assert object_path.read_bytes() == content
+
+        # Executables are copied, so the object does not share the inode with them
+        assert minecraft_launcher_lib.object_store._link_object("173219a75174abb3e3a7bfd36148129df03f9123", str(tmp_path / "executable"), True) is True
+        assert not os.path.samefile(tmp_path / "executable", object_path)
+    finally:
+        minecraft_launcher_lib.object_store.set_object_store(None)
+
+    assert minecraft_launcher_lib.object_store.get_object_store() is None
@@ -0,0 +1,161 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+from minecraft_launcher_lib.types import MinecraftOptions
+from typing import Callable, Any
+import minecraft_launcher_lib
+import threading
+import pathlib
+import pytest
+import time
+import sys
+import os
+
+# Counts its starts in the working directory and fails the first two times
+_TEST_SCRIPT = """
+import os
+import sys
+with open("starts.txt", "a") as f:
+    f.write("x")
+print("Sound engine started")
+sys.exit(0 if os.path.getsize("starts.txt") >= 3 else 1)
+"""
+
+_SLEEP_SCRIPT = """
+import time
+print("Sound engine started", flush=True)
+time.sleep(60)
+"""
+
+
+def _fake_command(script: str) -> tuple[list[tuple[str, MinecraftOptions]], Callable[[str, str, MinecraftOptions], list[str]]]:
+    calls: list[tuple[str, MinecraftOptions]] = []
+
+    def _get_minecraft_command(version: str, minecraft_directory: str, options: MinecraftOptions) -> list[str]:
+        calls.append((version, options))
+        return [sys.executable, "-c", script]
+
+    return calls, _get_minecraft_command
+
+
+def test_orchestrator_restart(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    calls, fake = _fake_command(_TEST_SCRIPT)
+    monkeypatch.setattr(minecraft_launcher_lib.orchestrator, "get_minecraft_command", fake)
+
+    restarts: list[tuple[str, int]] = []
+    startups: list[str] = []
+    orchestrator = minecraft_launcher_lib.orchestrator.InstanceOrchestrator(tmp_path, stagger_delay=0, callback={"restart": lambda name, count: restarts.append((name, count)), "startup": lambda name, _: startups.append(name)})
+
+    orchestrator.add_instance({"name": "a", "version": "test1", "options": {"jvmArguments": ["-Dtest"]}, "maxHeap": 512, "restartPolicy": "on-failure", "restartDelay": 0})
+    orchestrator.add_instance({"name": "b", "version": "test1", "restartPolicy": "never"})
+
+    with pytest.raises(ValueError):
+        orchestrator.add_instance({"name": "a", "version": "test1"})
+
+    with pytest.raises(ValueError):
+        orchestrator.add_instance({"name": "c", "version": "test1", "memoryMax": 1024})
+
+    # Every instance uses its own game directory
+    assert calls[0] == ("test1", {"jvmArguments": ["-Dtest", "-Xmx512M"], "gameDirectory": os.path.join(tmp_path, "instances", "a")})
+    assert calls[1] == ("test1", {"gameDirectory": os.path.join(tmp_path, "instances", "b")})
+
+    orchestrator.start()
+    assert orchestrator.wait(timeout=60) is True
+
+    metrics = {i["name"]: i for i in orchestrator.get_metrics()}
+    assert metrics["a"]["exitCodes"] == [1, 1, 0]
+    assert metrics["a"]["restarts"] == 2
+    assert metrics["b"]["exitCodes"] == [1]
+    assert metrics["b"]["restarts"] == 0
+    assert metrics["a"]["running"] is False
+    assert metrics["a"]["startupTime"] is not None
+    assert restarts == [("a", 1), ("a", 2)]
+    assert sorted(startups) == ["a", "a", "a", "b"]
+
+
+def test_orchestrator_stop(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    _, fake = _fake_command(_SLEEP_SCRIPT)
+    monkeypatch.setattr(minecraft_launcher_lib.orchestrator, "get_minecraft_command", fake)
+
+    affinity = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else set()
+    orchestrator = minecraft_launcher_lib.orchestrator.InstanceOrchestrator(tmp_path, wait_for_startup=True, startup_timeout=30)
+    for i in range(2):
+        config: minecraft_launcher_lib.types.InstanceConfig = {"name": str(i), "version": "test1", "restartPolicy": "always"}
+        if hasattr(os, "sched_setaffinity"):
+            config["cpuAffinity"] = [sorted(os.sched_getaffinity(0))[0]]
+        orchestrator.add_instance(config)
+
+    orchestrator.start()
+
+    metrics = orchestrator.get_metrics()
+    assert [i["running"] for i in metrics] == [True, True]
+    assert metrics[0]["startupTime"] is not None
+
+    if sys.platform == "linux":
+        assert metrics[0]["memoryRss"] is not None
+        assert metrics[0]["cpuTime"] is not None
+        process = orchestrator.get_process("1")
+        assert process is not None
+        assert os.sched_getaffinity(process.pid) == set(config["cpuAffinity"])
+        # Only the child is pinned
+        assert os.sched_getaffinity(0) == affinity
+
+    orchestrator.stop(timeout=10)
+
+    # The processes are not restarted after they have been stopped
+    assert [i["running"] for i in orchestrator.get_metrics()] == [False, False]
+    assert [i["restarts"] for i in orchestrator.get_metrics()] == [0, 0]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="cgroups are only supported on Linux")
+def test_orchestrator_cgroup(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    # The script checks that it has been moved into the cgroup before it was started
+    _, fake = _fake_command("import os\nprint(open('../../cgroup/cgroup.procs').read() == str(os.getpid()))")
+    monkeypatch.setattr(minecraft_launcher_lib.orchestrator, "get_minecraft_command", fake)
+
+    lines: list[str] = []
+    orchestrator = minecraft_launcher_lib.orchestrator.InstanceOrchestrator(tmp_path, callback={"logEvent": lambda _, event: lines.append(event["text"])})
+    orchestrator.add_instance({"name": "a", "version": "test1", "cgroup": str(tmp_path / "cgroup"), "memoryMax": 1073741824, "cpuLimit": 1.5})
+    orchestrator.start()
+    assert orchestrator.wait(timeout=60) is True
+
+    assert lines == ["True"]
+    assert (tmp_path / "cgroup" / "memory.max").read_text() == "1073741824"
+    assert (tmp_path / "cgroup" / "cpu.max").read_text() == "150000 100000"
+
+
+def test_orchestrator_pending_restart(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    _, fake = _fake_command("import sys\nsys.exit(1)")
+    monkeypatch.setattr(minecraft_launcher_lib.orchestrator, "get_minecraft_command", fake)
+
+    # Widen the time between the exit of the process and the handling of the exit
+    on_exit = minecraft_launcher_lib.orchestrator.InstanceOrchestrator._on_exit
+    exiting = threading.Event()
+    exited = threading.Event()
+
+    def _slow_on_exit(self: minecraft_launcher_lib.orchestrator.InstanceOrchestrator, instance: Any, returncode: int) -> None:
+        if instance.name == "a" and not exiting.is_set():
+            exiting.set()
+            time.sleep(0.5)
+            on_exit(self, instance, returncode)
+            exited.set()
+        else:
+            on_exit(self, instance, returncode)
+
+    monkeypatch.setattr(minecraft_launcher_lib.orchestrator.InstanceOrchestrator, "_on_exit", _slow_on_exit)
+
+    orchestrator = minecraft_launcher_lib.orchestrator.InstanceOrchestrator(tmp_path, stagger_delay=0)
+    orchestrator.add_instance({"name": "a", "version": "test1", "restartPolicy": "on-failure", "restartDelay": 0, "maxRestarts": 1})
+    orchestrator.add_instance({"name": "b", "version": "test1", "restartPolicy": "never"})
+    orchestrator.start()
+
+    assert exiting.wait(30)
+
+    # The instance is not started a second time while its restart is pending
+    orchestrator.start()
+    assert orchestrator.wait(timeout=60) is True
+    assert exited.is_set()
+
+    metrics = {i["name"]: i for i in orchestrator.get_metrics()}
+    assert metrics["a"]["exitCodes"] == [1, 1]
+    assert metrics["a"]["restarts"] == 1
@@ -0,0 +1,60 @@
+# This file is part of minecraft-launcher-lib (https://codeberg.org/JakobDev/minecraft-launcher-lib)
+# SPDX-FileCopyrightText: Copyright (c) 2019-2025 JakobDev <jakobdev@gmx.de> and contributors
+# SPDX-License-Identifier: BSD-2-Clause
+from minecraft_launcher_lib.types import GameLogEvent
+import minecraft_launcher_lib
+import asyncio
+import sys
+
+_TEST_SCRIPT = """
+import sys
+print("Starting")
+print("<log4j:Event logger=\\"ehq\\" timestamp=\\"1700000000000\\" level=\\"INFO\\" thread=\\"Render thread\\">")
+print("  <log4j:Message><![CDATA[Sound engine started]]></log4j:Message>")
+print("</log4j:Event>")
+for i in range(20000):
+    print("Line " + str(i), file=sys.stderr)
+sys.exit(3)
+"""
+
+
+def test_start_minecraft() -> None:
+    events: list[GameLogEvent] = []
+    exit_codes: list[int] = []
+    startup_times: list[float] = []
+
+    process = minecraft_launcher_lib.process.start_minecraft([sys.executable, "-c", _TEST_SCRIPT], callback={"logEvent": events.append, "exit": exit_codes.append, "startup": startup_times.append})
+
+    # A lot of output on stderr does not block the process
+    assert process.wait(timeout=60) == 3
+    assert process.returncode == 3
+    assert process.running is False
+    assert exit_codes == [3]
+
+    stdout_events = [i for i in events if i["stream"] == "stdout"]
+    assert stdout_events[0]["text"] == "Starting"
+    assert stdout_events[0]["log4j"] is None
+
+    log4j_event = stdout_events[1]["log4j"]
+    assert log4j_event == {"logger": "ehq", "timestamp": 1700000000000, "level": "INFO", "thread": "Render thread", "message": "Sound engine started", "throwable": None}
+
+    assert len([i for i in events if i["stream"] == "stderr"]) == 20000
+
+    assert process.first_output_time is not None
+    assert process.startup_time == stdout_events[1]["time"]
+    assert startup_times == [process.startup_time]
+
+
+def test_start_minecraft_async() -> None:
+    async def _run() -> tuple[list[str], int]:
+        process = minecraft_launcher_lib.process.start_minecraft([sys.executable, "-c", _TEST_SCRIPT], max_buffered_events=100000)
+        lines = [event["text"] async for event in process.events()]
+        return lines, await process.wait_async()
+
+    lines, exit_code = asyncio.run(_run())
+
+    assert exit_code == 3
+    assert "Starting" in lines
+    assert "Sound engine started" in lines
+    assert "Line 19999" in lines
+    assert len(lines) == 20002
@@ -8,12 +8,17 @@ import requests_mock
 import subprocess
 import platform
 import datetime
+import asyncio
 import pathlib
 import pytest
+import lzma
 import os
 
 
 def test_get_jvm_runtimes() -> None:
+    # Make sure the runtime manifest of the other tests is not used
+    minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
     runtime_list = minecraft_launcher_lib.runtime.get_jvm_runtimes()
     for i in runtime_list:
         assert isinstance(i, str)
@@ -56,6 +61,11 @@ def test_install_jvm_runtime(monkeypatch: pytest.MonkeyPatch, subtests: pytest_s
         assert os.path.isdir(tmp_path / "runtime" / "java-runtime-test" / "linux" / "java-runtime-test" / "lib" / "desktop" / "mime")
         assert (tmp_path / "runtime" / "java-runtime-test" / "linux" / "java-runtime-test" / "links" / "testlink").read_text().strip() == "../target"
 
+    with subtests.test("Async"):
+        (tmp_path / "runtime" / "java-runtime-test" / "linux" / ".version").unlink()
+        asyncio.run(minecraft_launcher_lib.runtime.install_jvm_runtime_async("java-runtime-test", tmp_path, max_concurrency=1))
+        assert (tmp_path / "runtime" / "java-runtime-test" / "linux" / ".version").read_text().strip() == "17.0.3"
+
     with subtests.test("Invalid"):
         with pytest.raises(minecraft_launcher_lib.exceptions.VersionNotFound):
             minecraft_launcher_lib.runtime.install_jvm_runtime("java-runtime-invalid", tmp_path)
@@ -70,6 +80,22 @@ def test_install_jvm_runtime(monkeypatch: pytest.MonkeyPatch, subtests: pytest_s
             minecraft_launcher_lib.runtime.install_jvm_runtime("java-runtime-error", tmp_path)
 
 
+def test_decompress_lzma_stream() -> None:
+    data = os.urandom(1024) * 512
+    compressed = lzma.compress(data)
+
+    # Feed the compressed data in small chunks like a network stream
+    chunks = [compressed[i:i + 1000] for i in range(0, len(compressed), 1000)]
+    output = list(minecraft_launcher_lib._helper._decompress_lzma_stream(chunks))
+
+    assert b"".join(output) == data
+    assert max(len(i) for i in output) <= minecraft_launcher_lib._helper._DOWNLOAD_CHUNK_SIZE
+
+    # Truncated data must not be accepted
+    with pytest.raises(lzma.LZMAError):
+        list(minecraft_launcher_lib._helper._decompress_lzma_stream([compressed[:-10]]))
+
+
 def test_get_executable_path(monkeypatch: pytest.MonkeyPatch, subtests: pytest_subtests.SubTests, tmp_path: pathlib.Path) -> None:
     with subtests.test("Linux"):
         monkeypatch.setattr(platform, "architecture", lambda: ("test",))
@@ -110,6 +136,8 @@ def _test_runtime_information() -> None:
 
 
 def test_get_jvm_runtime_information(monkeypatch: pytest.MonkeyPatch) -> None:
+    minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
     monkeypatch.setattr(platform, "architecture", lambda: ("32bit",))
     monkeypatch.setattr(platform, "system", lambda: "Windows")
     _test_runtime_information()
@@ -195,6 +195,27 @@ def test_is_vanilla_version(requests_mock: requests_mock.Mocker) -> None:
     assert minecraft_launcher_lib.utils.is_vanilla_version("test") is False
 
 
+def test_version_manifest(requests_mock: requests_mock.Mocker) -> None:
+    prepare_requests_mock(requests_mock)
+    minecraft_launcher_lib._metadata_cache.clear_memory_cache()
+
+    version_manifest = minecraft_launcher_lib._helper.get_version_manifest()
+
+    # The parsed manifest is shared
+    assert minecraft_launcher_lib._helper.get_version_manifest() is version_manifest
+    assert requests_mock.call_count == 1
+
+    assert "online-release" in version_manifest
+    assert version_manifest.latest == {"release": "online-release", "snapshot": "online-snapshot"}
+    assert version_manifest.get_ids("release") == ["online-release"]
+    assert version_manifest.get_ids("snapshot") == []
+    assert version_manifest.get_release_time("online-release") == datetime.datetime(2023, 12, 18, 15, 46, 45, tzinfo=datetime.timezone.utc)
+
+    # Modifying the returned list does not change the manifest
+    minecraft_launcher_lib.utils.get_version_list()[0]["id"] = "changed"
+    assert minecraft_launcher_lib.utils.get_version_list()[0]["id"] == "online-release"
+
+
 def test_is_platform_supported(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(platform, "system", lambda: "Windows")
     assert minecraft_launcher_lib.utils.is_platform_supported() is True